@@ -20,10 +20,30 @@ import numpy as np
 cimport numpy as np
 
 # Data types:
-#   Solid and ID arrays use 32-bit integers (0 to 4294967295)
+#   Solid and ID arrays use 32-bit integers (0 to 4294967295) while the model is built, then the narrowest of 8, 16 or 32-bit integers that holds all the materials
 #   Rigid arrays use 8-bit integers (the smallest available type to store true/false)
 #   Fractal and dispersive coefficient arrays use complex numbers (complextype) which are represented as two floats
+#   Dispersive coefficient arrays use floats (floattype) instead if all the dispersive materials have real poles (Debye, Drude)
 #   Main field arrays use floats (floattype) and complex numbers (complextype)
 
 ctypedef np.float32_t floattype_t
-ctypedef np.complex64_t complextype_t
\ No newline at end of file
+ctypedef np.complex64_t complextype_t
+
+# ID arrays
+ctypedef fused idtype_t:
+    np.uint8_t
+    np.uint16_t
+    np.uint32_t
+
+# Dispersive coefficient and temporary arrays
+ctypedef fused dispersivetype_t:
+    floattype_t
+    complextype_t
+
+
+cdef inline float real_part(dispersivetype_t x) noexcept nogil:
+    """Real part of a dispersive coefficient or temporary value, which may be real or complex."""
+    if dispersivetype_t is floattype_t:
+        return x
+    else:
+        return x.real
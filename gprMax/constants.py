@@ -22,13 +22,15 @@ import numpy as np
 from pyfiglet import Figlet
 
 # Data types:
-#   Solid and ID arrays use 32-bit integers (0 to 4294967295)
+#   Solid and ID arrays use 32-bit integers (0 to 4294967295) while the model is built, then the narrowest of 8, 16 or 32-bit integers that holds all the materials
 #   Rigid arrays use 8-bit integers (the smallest available type to store true/false)
 #   Fractal and dispersive coefficient arrays use complex numbers (complextype) which are represented as two floats
+#   Dispersive coefficient arrays use floats (floattype) instead if all the dispersive materials have real poles (Debye, Drude)
 #   Main field arrays use floats (floattype) and complex numbers (complextype)
 
 floattype = np.float32
 complextype = np.complex64
+idtypes = (np.uint8, np.uint16, np.uint32)
 
 # Speed of light in vacuum (m/s)
 c = 2.9979245e8
@@ -19,7 +19,7 @@ import numpy as np
 
 import h5py
 
-from .constants import floattype
+from .constants import floattype, complextype
 
 
 def prepare_output_file(outputfile, G):
@@ -60,16 +60,68 @@ def prepare_output_file(outputfile, G):
     for rxindex, rx in enumerate(G.rxs):
         tmp = f.create_group('/rxs/rx' + str(rxindex + 1))
         tmp['Position'] = (rx.positionx * G.dx, rx.positiony * G.dy, rx.positionz * G.dz)
-        tmp['Ex'] = np.zeros(G.iterations, dtype=floattype)
-        tmp['Ey'] = np.zeros(G.iterations, dtype=floattype)
-        tmp['Ez'] = np.zeros(G.iterations, dtype=floattype)
-        tmp['Hx'] = np.zeros(G.iterations, dtype=floattype)
-        tmp['Hy'] = np.zeros(G.iterations, dtype=floattype)
-        tmp['Hz'] = np.zeros(G.iterations, dtype=floattype)
+        # If the run may stop early the field values can be truncated to the iterations that were run
+        if G.stopondecay or G.steadystate:
+            for name in ('Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz'):
+                tmp.create_dataset(name, data=np.zeros(G.iterations, dtype=floattype), maxshape=(None,))
+        else:
+            tmp['Ex'] = np.zeros(G.iterations, dtype=floattype)
+            tmp['Ey'] = np.zeros(G.iterations, dtype=floattype)
+            tmp['Ez'] = np.zeros(G.iterations, dtype=floattype)
+            tmp['Hx'] = np.zeros(G.iterations, dtype=floattype)
+            tmp['Hy'] = np.zeros(G.iterations, dtype=floattype)
+            tmp['Hz'] = np.zeros(G.iterations, dtype=floattype)
 
     return f
 
 
+def write_output_block(f, start, stop, rxvalues, G):
+    """Writes a block of stored field component values at receivers to an output file in HDF5 format.
+
+    Args:
+        f (file object): File object for the file to be written to.
+        start (int): Iteration number of the first values in the block.
+        stop (int): One past the iteration number of the last values in the block.
+        rxvalues (memory view): numpy array of field component values (Ex, Ey, Ez, Hx, Hy, Hz) indexed by component, receiver and iteration within the block.
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    for rxindex, rx in enumerate(G.rxs):
+        for component, name in enumerate(('Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz')):
+            f['/rxs/rx' + str(rxindex + 1) + '/' + name][start:stop] = rxvalues[component, rxindex, 0:stop - start]
+
+
+def truncate_output(f, iterations, G):
+    """Truncates the field component values at receivers in an output file in HDF5 format to the iterations that were run, when the run stopped early.
+
+    Args:
+        f (file object): File object for the file to be written to.
+        iterations (int): Number of iterations that were run.
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    f.attrs['Iterations'] = iterations
+    for rxindex, rx in enumerate(G.rxs):
+        for name in ('Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz'):
+            f['/rxs/rx' + str(rxindex + 1) + '/' + name].resize((iterations,))
+
+
+def write_phasors(f, steadystate, G):
+    """Writes the phasors of the field components at receivers for the last period of continuous sine wave sources to an output file in HDF5 format.
+
+    Args:
+        f (file object): File object for the file to be written to.
+        steadystate (class): SteadyState class instance - holds the phasors at the receivers.
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    f.attrs['Phasor frequency'] = steadystate.frequency
+    f.attrs['Steady state'] = steadystate.converged
+    for rxindex, rx in enumerate(G.rxs):
+        for component, name in enumerate(('Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz')):
+            f['/rxs/rx' + str(rxindex + 1) + '/Phasors/' + name] = complextype(steadystate.phasors[component, rxindex])
+
+
 def write_output(f, timestep, Ex, Ey, Ez, Hx, Hy, Hz, G):
     """Writes field component values to an output file in HDF5 format.
         
@@ -0,0 +1,65 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+cimport numpy as np
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t
+
+cpdef update_electric(int nx, int ny, int nz, int nthreads, int[:, :] uniformE, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex)
+cpdef update_ex_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex)
+cpdef update_ex_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex)
+cpdef update_ex_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ex_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex)
+cpdef update_ex_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_ey(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey)
+cpdef update_ey_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey)
+cpdef update_ey_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey)
+cpdef update_ey_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ey_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey)
+cpdef update_ey_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz)
+cpdef update_ez(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez)
+cpdef update_ez_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez)
+cpdef update_ez_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez)
+cpdef update_ez_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_ez_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez)
+cpdef update_ez_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy)
+cpdef update_magnetic(int nx, int ny, int nz, int nthreads, int[:, :] uniformH, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_hx(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_hy(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez)
+cpdef update_hz(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey)
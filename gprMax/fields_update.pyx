@@ -16,16 +16,80 @@
 # You should have received a copy of the GNU General Public License
 # along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
 
+# cython: cdivision=True
+
 import numpy as np
 cimport numpy as np
 from cython.parallel import prange
-from .constants cimport floattype_t, complextype_t
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t, real_part
+
+# The updates are parallelised over the rows (along z) of the x-y plane, i.e. the i and j loops are collapsed into a single loop.
+# The rows are divided between the threads in contiguous blocks (static schedule), which are sized from the number of cells in x and y
+# and the number of threads: whole slices in x when there are enough of them, and parts of slices when the model is thin in x (e.g. 2D models).
+# Each thread then writes a single contiguous part of each array, so threads only share a cache line at the edges of their blocks.
+
+#############################################################
+# Electric field updates - all components in a single sweep #
+#############################################################
+cpdef update_electric(int nx, int ny, int nz, int nthreads, int[:, :] uniformE, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components in a single traversal of the grid, so that ID and the magnetic field components are only read once.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        uniformE (memoryview): Material of each row [i, j] of the electric field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex, material
+    cdef float CA, CBx, CBy, CBz
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+        i = ij // ny
+        j = ij % ny
+        material = uniformE[i, j]
+        if material >= 0:
+            CA = updatecoeffsE[material, 0]
+            CBx = updatecoeffsE[material, 1]
+            CBy = updatecoeffsE[material, 2]
+            CBz = updatecoeffsE[material, 3]
+            # Only Ez is updated on the k = 0 plane
+            if updateEz and i > 0 and j > 0:
+                Ez[i, j, 0] = CA * Ez[i, j, 0] + CBx * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - CBy * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+            for k in range(1, nz):
+                if updateEx and j > 0:
+                    Ex[i, j, k] = CA * Ex[i, j, k] + CBy * (Hz[i, j, k] - Hz[i, j - 1, k]) - CBz * (Hy[i, j, k] - Hy[i, j, k - 1])
+                if updateEy and i > 0:
+                    Ey[i, j, k] = CA * Ey[i, j, k] + CBz * (Hx[i, j, k] - Hx[i, j, k - 1]) - CBx * (Hz[i, j, k] - Hz[i - 1, j, k])
+                if updateEz and i > 0 and j > 0:
+                    Ez[i, j, k] = CA * Ez[i, j, k] + CBx * (Hy[i, j, k] - Hy[i - 1, j, k]) - CBy * (Hx[i, j, k] - Hx[i, j - 1, k])
+        else:
+            # Only Ez is updated on the k = 0 plane
+            if updateEz and i > 0 and j > 0:
+                listIndex = ID[2, i, j, 0]
+                Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+            for k in range(1, nz):
+                if updateEx and j > 0:
+                    listIndex = ID[0, i, j, k]
+                    Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1])
+                if updateEy and i > 0:
+                    listIndex = ID[1, i, j, k]
+                    Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
+                if updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, k]
+                    Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
 
 
 #########################################
 # Electric field updates - Ex component #
 #########################################
-cpdef update_ex(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+cpdef update_ex(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
     """This function updates the Ex field components.
         
     Args:
@@ -34,68 +98,101 @@ cpdef update_ex(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if ny == 1 or nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(1, nz):
-                    listIndex = ID[0, i, j, k]
-                    Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1])
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1])
 
 
-cpdef update_ex_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int maxpoles, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+cpdef update_ex_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
     """This function updates the Ex field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
     cdef float phi = 0.0
 
     if ny == 1 or nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(1, nz):
-                    listIndex = ID[0, i, j, k]
-                    phi = 0.0
-                    for p in range(0, maxpoles):
-                        phi = phi + updatecoeffsdispersive[listIndex, p * 3].real * Tx[p, i, j, k].real
-                        Tx[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tx[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
-                    Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tx[p, i, j, k])
+                    Tx[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tx[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
 
-cpdef update_ex_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int maxpoles, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
+cpdef update_ex_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
     """This function updates the Ex field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
 
     if ny == 1 or nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(1, nz):
-                    listIndex = ID[0, i, j, k]
-                    for p in range(0, maxpoles):
-                        Tx[p, i, j, k] = Tx[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                for p in range(0, poles[listIndex]):
+                    Tx[p, i, j, k] = Tx[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
 
 
-cpdef update_ex_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+cpdef update_ex_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex field components when dispersive materials (with multiple poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex, p
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    Tprev = Tx[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                    Tx[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ex_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
     """This function updates the Ex field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -104,22 +201,23 @@ cpdef update_ex_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floatty
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
     cdef float phi = 0.0
 
     if ny == 1 or nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(1, nz):
-                    listIndex = ID[0, i, j, k]
-                    phi = updatecoeffsdispersive[listIndex, 0].real * Tx[0, i, j, k].real
-                    Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
-                    Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k])
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ex_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
+cpdef update_ex_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
     """This function updates the Ex field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -128,22 +226,210 @@ cpdef update_ex_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complex
         updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if ny == 1 or nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(1, nz):
-                    listIndex = ID[0, i, j, k]
-                    Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+
+
+cpdef update_ex_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex field components when dispersive materials (with 1 pole) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tprev = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ex_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tx[1, i, j, k])
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tx[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ex_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
+    """This function updates the Ex field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+
+
+cpdef update_ex_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tprev0 = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tprev1 = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ex_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tx[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tx[2, i, j, k])
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tx[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Tx[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tx[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ex_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex):
+    """This function updates the Ex field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Tx[2, i, j, k] = Tx[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+
+
+cpdef update_ex_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1, Tprev2
+
+    if ny == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(1, nz):
+                listIndex = ID[0, i, j, k]
+                Tprev0 = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tprev1 = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Tprev2 = Tx[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                Tx[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
 
 
 #########################################
 # Electric field updates - Ey component #
 #########################################
-cpdef update_ey(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+cpdef update_ey(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
     """This function updates the Ey field components.
         
     Args:
@@ -152,69 +438,102 @@ cpdef update_ey(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nx == 1 or nz == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[1, i, j, k]
-                    Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
 
 
-cpdef update_ey_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int maxpoles, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+cpdef update_ey_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
     """This function updates the Ey field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
     cdef float phi = 0.0
 
     if nx == 1 or nz == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[1, i, j, k]
-                    phi = 0.0
-                    for p in range(0, maxpoles):
-                        phi = phi + updatecoeffsdispersive[listIndex, p * 3].real * Ty[p, i, j, k].real
-                        Ty[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Ty[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
-                    Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Ty[p, i, j, k])
+                    Ty[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Ty[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ey_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int maxpoles, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
+cpdef update_ey_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
     """This function updates the Ey field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
 
     if nx == 1 or nz == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[1, i, j, k]
-                    for p in range(0, maxpoles):
-                        Ty[p, i, j, k] = Ty[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                for p in range(0, poles[listIndex]):
+                    Ty[p, i, j, k] = Ty[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
 
 
-cpdef update_ey_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+cpdef update_ey_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ey field components when dispersive materials (with multiple poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex, p
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    Tprev = Ty[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                    Ty[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ey_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
     """This function updates the Ey field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -223,22 +542,23 @@ cpdef update_ey_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floatty
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
     cdef float phi = 0.0
 
     if nx == 1 or nz == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[1, i, j, k]
-                    phi = updatecoeffsdispersive[listIndex, 0].real * Ty[0, i, j, k].real
-                    Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
-                    Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k])
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ey_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
+cpdef update_ey_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
     """This function updates the Ey field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -247,22 +567,210 @@ cpdef update_ey_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complex
         updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nx == 1 or nz == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[1, i, j, k]
-                    Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+
+
+cpdef update_ey_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ey field components when dispersive materials (with 1 pole) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Tprev = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ey_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function updates the Ey field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Ty[1, i, j, k])
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Ty[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ey_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
+    """This function updates the Ey field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+
+
+cpdef update_ey_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ey field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Tprev0 = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Tprev1 = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ey_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function updates the Ey field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Ty[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Ty[2, i, j, k])
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Ty[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Ty[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Ty[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ey_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey):
+    """This function updates the Ey field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Ty[2, i, j, k] = Ty[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+
+
+cpdef update_ey_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Ty, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ey field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1, Tprev2
+
+    if nx == 1 or nz == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[1, i, j, k]
+                Tprev0 = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Tprev1 = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Tprev2 = Ty[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                Ty[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
 #########################################
 # Electric field updates - Ez component #
 #########################################
-cpdef update_ez(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+cpdef update_ez(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
     """This function updates the Ez field components.
         
     Args:
@@ -271,69 +779,102 @@ cpdef update_ez(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
         
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nx == 1 or ny == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[2, i, j, k]
-                    Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
 
 
-cpdef update_ez_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int maxpoles, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+cpdef update_ez_dispersive_multipole_A(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
     """This function updates the Ez field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
         
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
     cdef float phi = 0.0
 
     if nx == 1 or ny == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[2, i, j, k]
-                    phi = 0.0
-                    for p in range(0, maxpoles):
-                        phi = phi + updatecoeffsdispersive[listIndex, p * 3].real * Tz[p, i, j, k].real
-                        Tz[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tz[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
-                    Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tz[p, i, j, k])
+                    Tz[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tz[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ez_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int maxpoles, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
+cpdef update_ez_dispersive_multipole_B(int nx, int ny, int nz, int nthreads, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
     """This function updates the Ez field components when dispersive materials (with multiple poles) are present.
         
     Args:
         nx, ny, nz (int): Grid size in cells
-        maxpoles (int): Maximum number of poles
+        poles (memoryview): Number of poles of each material
         nthreads (int): Number of threads to use
         updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex, p
+    cdef int i, j, k, ij, listIndex, p
 
     if nx == 1 or ny == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[2, i, j, k]
-                    for p in range(0, maxpoles):
-                        Tz[p, i, j, k] = Tz[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                for p in range(0, poles[listIndex]):
+                    Tz[p, i, j, k] = Tz[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+
+
+cpdef update_ez_dispersive_multipole_BA(int nx, int ny, int nz, int nthreads, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ez field components when dispersive materials (with multiple poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex, p
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                phi = 0.0
+                for p in range(0, poles[listIndex]):
+                    Tprev = Tz[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                    phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                    Tz[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ez_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+cpdef update_ez_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
     """This function updates the Ez field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -342,22 +883,23 @@ cpdef update_ez_dispersive_1pole_A(int nx, int ny, int nz, int nthreads, floatty
         updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
         
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
     cdef float phi = 0.0
 
     if nx == 1 or ny == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[2, i, j, k]
-                    phi = updatecoeffsdispersive[listIndex, 0].real * Tz[0, i, j, k].real
-                    Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
-                    Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k])
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
 
 
-cpdef update_ez_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complextype_t[:, :] updatecoeffsdispersive, np.uint32_t[:, :, :, :] ID, complextype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
+cpdef update_ez_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
     """This function updates the Ez field components when dispersive materials (with 1 pole) are present.
         
     Args:
@@ -366,22 +908,273 @@ cpdef update_ez_dispersive_1pole_B(int nx, int ny, int nz, int nthreads, complex
         updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nx == 1 or ny == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[2, i, j, k]
-                    Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+
+
+cpdef update_ez_dispersive_1pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ez field components when dispersive materials (with 1 pole) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tprev = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ez_dispersive_2pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function updates the Ez field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, k])
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ez_dispersive_2pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
+    """This function updates the Ez field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+
+
+cpdef update_ez_dispersive_2pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ez field components when dispersive materials (with 2 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tprev0 = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tprev1 = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ez_dispersive_3pole_A(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function updates the Ez field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tz[2, i, j, k])
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Tz[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tz[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_ez_dispersive_3pole_B(int nx, int ny, int nz, int nthreads, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez):
+    """This function updates the Ez field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Tz[2, i, j, k] = Tz[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+
+
+cpdef update_ez_dispersive_3pole_BA(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ez field components when dispersive materials (with 3 poles) are present.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+        
+    cdef int i, j, k, ij, listIndex
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1, Tprev2
+
+    if nx == 1 or ny == 1:
+        pass
+    else:
+        for ij in prange(0, (nx - 1) * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[2, i, j, k]
+                Tprev0 = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tprev1 = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Tprev2 = Tz[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                Tz[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+#############################################################
+# Magnetic field updates - all components in a single sweep #
+#############################################################
+cpdef update_magnetic(int nx, int ny, int nz, int nthreads, int[:, :] uniformH, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the Hx, Hy and Hz field components in a single traversal of the grid, so that ID and the electric field components are only read once.
+        
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        uniformH (memoryview): Material of each row [i, j] of the magnetic field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+    
+    cdef int i, j, k, ij, listIndex, material
+    cdef float DA, DBx, DBy, DBz
+    cdef bint updateHx, updateHy, updateHz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateHx = nx != 1
+    updateHy = ny != 1
+    updateHz = nz != 1
+
+    for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+        i = ij // ny
+        j = ij % ny
+        material = uniformH[i, j]
+        if material >= 0:
+            DA = updatecoeffsH[material, 0]
+            DBx = updatecoeffsH[material, 1]
+            DBy = updatecoeffsH[material, 2]
+            DBz = updatecoeffsH[material, 3]
+            # Hz is not updated on the k = 0 plane
+            if updateHx and i > 0:
+                Hx[i, j, 0] = DA * Hx[i, j, 0] - DBy * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + DBz * (Ey[i, j, 1] - Ey[i, j, 0])
+            if updateHy and j > 0:
+                Hy[i, j, 0] = DA * Hy[i, j, 0] - DBz * (Ex[i, j, 1] - Ex[i, j, 0]) + DBx * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+            for k in range(1, nz):
+                if updateHx and i > 0:
+                    Hx[i, j, k] = DA * Hx[i, j, k] - DBy * (Ez[i, j + 1, k] - Ez[i, j, k]) + DBz * (Ey[i, j, k + 1] - Ey[i, j, k])
+                if updateHy and j > 0:
+                    Hy[i, j, k] = DA * Hy[i, j, k] - DBz * (Ex[i, j, k + 1] - Ex[i, j, k]) + DBx * (Ez[i + 1, j, k] - Ez[i, j, k])
+                if updateHz:
+                    Hz[i, j, k] = DA * Hz[i, j, k] - DBx * (Ey[i + 1, j, k] - Ey[i, j, k]) + DBy * (Ex[i, j + 1, k] - Ex[i, j, k])
+        else:
+            # Hz is not updated on the k = 0 plane
+            if updateHx and i > 0:
+                listIndex = ID[3, i, j, 0]
+                Hx[i, j, 0] = updatecoeffsH[listIndex, 0] * Hx[i, j, 0] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, 1] - Ey[i, j, 0])
+            if updateHy and j > 0:
+                listIndex = ID[4, i, j, 0]
+                Hy[i, j, 0] = updatecoeffsH[listIndex, 0] * Hy[i, j, 0] - updatecoeffsH[listIndex, 3] * (Ex[i, j, 1] - Ex[i, j, 0]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+            for k in range(1, nz):
+                if updateHx and i > 0:
+                    listIndex = ID[3, i, j, k]
+                    Hx[i, j, k] = updatecoeffsH[listIndex, 0] * Hx[i, j, k] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, k] - Ez[i, j, k]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, k + 1] - Ey[i, j, k])
+                if updateHy and j > 0:
+                    listIndex = ID[4, i, j, k]
+                    Hy[i, j, k] = updatecoeffsH[listIndex, 0] * Hy[i, j, k] - updatecoeffsH[listIndex, 3] * (Ex[i, j, k + 1] - Ex[i, j, k]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, k] - Ez[i, j, k])
+                if updateHz:
+                    listIndex = ID[5, i, j, k]
+                    Hz[i, j, k] = updatecoeffsH[listIndex, 0] * Hz[i, j, k] - updatecoeffsH[listIndex, 1] * (Ey[i + 1, j, k] - Ey[i, j, k]) + updatecoeffsH[listIndex, 2] * (Ex[i, j + 1, k] - Ex[i, j, k])
 
 
 #########################################
 # Magnetic field updates - Hx component #
 #########################################
-cpdef update_hx(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+cpdef update_hx(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
     """This function updates the Hx field components.
         
     Args:
@@ -390,22 +1183,23 @@ cpdef update_hx(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nx == 1:
         pass
     else:
-        for i in prange(1, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(0, nz):
-                    listIndex = ID[3, i, j, k]
-                    Hx[i, j, k] = updatecoeffsH[listIndex, 0] * Hx[i, j, k] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, k] - Ez[i, j, k]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, k + 1] - Ey[i, j, k])
+        for ij in prange(0, (nx - 1) * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = 1 + ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i, j, k]
+                Hx[i, j, k] = updatecoeffsH[listIndex, 0] * Hx[i, j, k] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, k] - Ez[i, j, k]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, k + 1] - Ey[i, j, k])
 
 
 #########################################
 # Magnetic field updates - Hy component #
 #########################################
-cpdef update_hy(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez):
+cpdef update_hy(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez):
     """This function updates the Hy field components.
         
     Args:
@@ -414,22 +1208,23 @@ cpdef update_hy(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if ny == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(1, ny):
-                for k in range(0, nz):
-                    listIndex = ID[4, i, j, k]
-                    Hy[i, j, k] = updatecoeffsH[listIndex, 0] * Hy[i, j, k] - updatecoeffsH[listIndex, 3] * (Ex[i, j, k + 1] - Ex[i, j, k]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, k] - Ez[i, j, k])
+        for ij in prange(0, nx * (ny - 1), nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // (ny - 1)
+            j = 1 + ij % (ny - 1)
+            for k in range(0, nz):
+                listIndex = ID[4, i, j, k]
+                Hy[i, j, k] = updatecoeffsH[listIndex, 0] * Hy[i, j, k] - updatecoeffsH[listIndex, 3] * (Ex[i, j, k + 1] - Ex[i, j, k]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, k] - Ez[i, j, k])
 
 
 #########################################
 # Magnetic field updates - Hz component #
 #########################################
-cpdef update_hz(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, np.uint32_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey):
+cpdef update_hz(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey):
     """This function updates the Hz field components.
         
     Args:
@@ -438,14 +1233,15 @@ cpdef update_hz(int nx, int ny, int nz, int nthreads, floattype_t[:, :] updateco
         updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
     """
     
-    cdef int i, j, k, listIndex
+    cdef int i, j, k, ij, listIndex
 
     if nz == 1:
         pass
     else:
-        for i in prange(0, nx, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
-            for j in range(0, ny):
-                for k in range(1, nz):
-                    listIndex = ID[5, i, j, k]
-                    Hz[i, j, k] = updatecoeffsH[listIndex, 0] * Hz[i, j, k] - updatecoeffsH[listIndex, 1] * (Ey[i + 1, j, k] - Ey[i, j, k]) + updatecoeffsH[listIndex, 2] * (Ex[i, j + 1, k] - Ex[i, j, k])
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(1, nz):
+                listIndex = ID[5, i, j, k]
+                Hz[i, j, k] = updatecoeffsH[listIndex, 0] * Hz[i, j, k] - updatecoeffsH[listIndex, 1] * (Ey[i + 1, j, k] - Ey[i, j, k]) + updatecoeffsH[listIndex, 2] * (Ex[i, j + 1, k] - Ex[i, j, k])
 
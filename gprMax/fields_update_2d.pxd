@@ -0,0 +1,23 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+cimport numpy as np
+from .constants cimport floattype_t, idtype_t
+
+cpdef update_electric_2d(int nump, int numq, int nthreads, int coeffp, int coeffq, bint righthanded, floattype_t[:, :] updatecoeffsE, idtype_t[:, :] ID, floattype_t[:, :] E, floattype_t[:, :] Hp, floattype_t[:, :] Hq)
+cpdef update_magnetic_2d(int nump, int numq, int nthreads, int coeffp, int coeffq, bint righthanded, floattype_t[:, :] updatecoeffsH, idtype_t[:, :] IDp, idtype_t[:, :] IDq, floattype_t[:, :] Hp, floattype_t[:, :] Hq, floattype_t[:, :] E)
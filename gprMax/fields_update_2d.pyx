@@ -0,0 +1,80 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from .constants cimport floattype_t, idtype_t
+
+
+# Field updates of 2D (TM) models, i.e. when the grid is a single cell thick in one direction. Only the electric field
+# component normal to the plane of the model, and the magnetic field components in the plane, are updated. The arrays
+# are the planes of the field components (and ID) in the plane of the model, with cells indexed by p and q, which are
+# the two directions of the plane in the order of the field arrays (x-y, y-z or x-z). Hp and Hq are the magnetic field
+# components in the p and q directions. The directions p, q and the normal are right-handed for models in the x-y (TMz)
+# and y-z (TMx) planes, and left-handed for models in the x-z (TMy) plane, which reverses the curl of the fields.
+
+cpdef update_electric_2d(int nump, int numq, int nthreads, int coeffp, int coeffq, bint righthanded, floattype_t[:, :] updatecoeffsE, idtype_t[:, :] ID, floattype_t[:, :] E, floattype_t[:, :] Hp, floattype_t[:, :] Hq):
+    """This function updates the electric field component normal to the plane of a 2D model.
+
+    Args:
+        nump, numq (int): Grid size in cells in the p and q directions
+        nthreads (int): Number of threads to use
+        coeffp, coeffq (int): Columns of the update coefficients for the p and q directions
+        righthanded (bint): Directions p, q and the normal to the plane are right-handed
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int p, q, listIndex
+
+    if righthanded:
+        for p in prange(1, nump, nogil=True, schedule='static', num_threads=nthreads):
+            for q in range(1, numq):
+                listIndex = ID[p, q]
+                E[p, q] = updatecoeffsE[listIndex, 0] * E[p, q] + updatecoeffsE[listIndex, coeffp] * (Hq[p, q] - Hq[p - 1, q]) - updatecoeffsE[listIndex, coeffq] * (Hp[p, q] - Hp[p, q - 1])
+    else:
+        for p in prange(1, nump, nogil=True, schedule='static', num_threads=nthreads):
+            for q in range(1, numq):
+                listIndex = ID[p, q]
+                E[p, q] = updatecoeffsE[listIndex, 0] * E[p, q] + updatecoeffsE[listIndex, coeffq] * (Hp[p, q] - Hp[p, q - 1]) - updatecoeffsE[listIndex, coeffp] * (Hq[p, q] - Hq[p - 1, q])
+
+
+cpdef update_magnetic_2d(int nump, int numq, int nthreads, int coeffp, int coeffq, bint righthanded, floattype_t[:, :] updatecoeffsH, idtype_t[:, :] IDp, idtype_t[:, :] IDq, floattype_t[:, :] Hp, floattype_t[:, :] Hq, floattype_t[:, :] E):
+    """This function updates the magnetic field components in the plane of a 2D model in a single traversal of the grid.
+
+    Args:
+        nump, numq (int): Grid size in cells in the p and q directions
+        nthreads (int): Number of threads to use
+        coeffp, coeffq (int): Columns of the update coefficients for the p and q directions
+        righthanded (bint): Directions p, q and the normal to the plane are right-handed
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID (of the Hp and Hq components) and field component arrays
+    """
+
+    cdef int p, q, listIndex
+    cdef float sign
+
+    sign = 1 if righthanded else -1
+
+    for p in prange(0, nump, nogil=True, schedule='static', num_threads=nthreads):
+        for q in range(0, numq):
+            if p > 0:
+                listIndex = IDp[p, q]
+                Hp[p, q] = updatecoeffsH[listIndex, 0] * Hp[p, q] - sign * updatecoeffsH[listIndex, coeffq] * (E[p, q + 1] - E[p, q])
+            if q > 0:
+                listIndex = IDq[p, q]
+                Hq[p, q] = updatecoeffsH[listIndex, 0] * Hq[p, q] + sign * updatecoeffsH[listIndex, coeffp] * (E[p + 1, q] - E[p, q])
@@ -0,0 +1,25 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+cimport numpy as np
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t
+
+cpdef update_dispersive_sparse_A(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:] phi, floattype_t[:, :, :] E)
+cpdef update_dispersive_sparse_BA(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:] phi, floattype_t[:, :, :] E)
+cpdef update_dispersive_sparse_phi(int nthreads, int component, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, floattype_t[:] phi, floattype_t[:, :, :] E)
+cpdef update_dispersive_sparse_B(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:, :, :] E)
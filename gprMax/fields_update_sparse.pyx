@@ -0,0 +1,138 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t, real_part
+
+
+# Dispersive updates of a list of the cell edges of a field component that have dispersive materials,
+# used when the temporary dispersive values are only stored for those edges (T[pole, edge]). The standard
+# update is used for the field component over the whole grid, and the dispersive updates are split
+# around it: the 1st part is done before the standard update and stores the dispersive contribution
+# for each edge (phi), which is then subtracted from the field after the standard update.
+
+
+#############################################################
+# Dispersive updates - 1st part, before the standard update #
+#############################################################
+cpdef update_dispersive_sparse_A(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:] phi, floattype_t[:, :, :] E):
+    """This function does the 1st part of the dispersive update for a list of cell edges of an electric field component.
+
+    Args:
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        component (int): Index of the field component in the ID array
+        cells (memoryview): Indices (i, j, k) of the cell edges with dispersive materials
+        phi (memoryview): Dispersive contribution to the field for each cell edge
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int n, i, j, k, listIndex, p
+    cdef float phisum
+
+    for n in prange(0, cells.shape[0], nogil=True, schedule='static', num_threads=nthreads):
+        i = cells[n, 0]
+        j = cells[n, 1]
+        k = cells[n, 2]
+        listIndex = ID[component, i, j, k]
+        phisum = 0.0
+        for p in range(0, poles[listIndex]):
+            phisum = phisum + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(T[p, n])
+            T[p, n] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * T[p, n] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * E[i, j, k]
+        phi[n] = phisum
+
+
+cpdef update_dispersive_sparse_BA(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:] phi, floattype_t[:, :, :] E):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then the 1st part of the dispersive update, for a list of cell edges of an electric field component.
+
+    Args:
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        component (int): Index of the field component in the ID array
+        cells (memoryview): Indices (i, j, k) of the cell edges with dispersive materials
+        phi (memoryview): Dispersive contribution to the field for each cell edge
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int n, i, j, k, listIndex, p
+    cdef float phisum
+    cdef dispersivetype_t Tprev
+
+    for n in prange(0, cells.shape[0], nogil=True, schedule='static', num_threads=nthreads):
+        i = cells[n, 0]
+        j = cells[n, 1]
+        k = cells[n, 2]
+        listIndex = ID[component, i, j, k]
+        phisum = 0.0
+        for p in range(0, poles[listIndex]):
+            Tprev = T[p, n] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * E[i, j, k]
+            phisum = phisum + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+            T[p, n] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * E[i, j, k]
+        phi[n] = phisum
+
+
+############################################################
+# Dispersive updates - 1st part, after the standard update #
+############################################################
+cpdef update_dispersive_sparse_phi(int nthreads, int component, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, floattype_t[:] phi, floattype_t[:, :, :] E):
+    """This function subtracts the dispersive contribution from a list of cell edges of an electric field component.
+
+    Args:
+        nthreads (int): Number of threads to use
+        component (int): Index of the field component in the ID array
+        cells (memoryview): Indices (i, j, k) of the cell edges with dispersive materials
+        phi (memoryview): Dispersive contribution to the field for each cell edge
+        updatecoeffs, ID, E (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int n, i, j, k, listIndex
+
+    for n in prange(0, cells.shape[0], nogil=True, schedule='static', num_threads=nthreads):
+        i = cells[n, 0]
+        j = cells[n, 1]
+        k = cells[n, 2]
+        listIndex = ID[component, i, j, k]
+        E[i, j, k] = E[i, j, k] - updatecoeffsE[listIndex, 4] * phi[n]
+
+
+################################################################
+# Dispersive updates - 2nd part, after the sources are updated #
+################################################################
+cpdef update_dispersive_sparse_B(int nthreads, int[:] poles, int component, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, np.int32_t[:, :] cells, dispersivetype_t[:, :] T, floattype_t[:, :, :] E):
+    """This function does the 2nd part of the dispersive update for a list of cell edges of an electric field component.
+
+    Args:
+        poles (memoryview): Number of poles of each material
+        nthreads (int): Number of threads to use
+        component (int): Index of the field component in the ID array
+        cells (memoryview): Indices (i, j, k) of the cell edges with dispersive materials
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int n, i, j, k, listIndex, p
+
+    for n in prange(0, cells.shape[0], nogil=True, schedule='static', num_threads=nthreads):
+        i = cells[n, 0]
+        j = cells[n, 1]
+        k = cells[n, 2]
+        listIndex = ID[component, i, j, k]
+        for p in range(0, poles[listIndex]):
+            T[p, n] = T[p, n] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * E[i, j, k]
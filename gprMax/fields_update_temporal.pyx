@@ -0,0 +1,159 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from .constants cimport floattype_t, complextype_t, idtype_t
+
+
+# Updates of the rows j0 to j1 - 1 of a single i plane of the grid, used by the temporally blocked
+# solver. Cells outside the range normally updated for each field component are left unchanged.
+
+
+##############################################
+# Electric field updates - single plane rows #
+##############################################
+cpdef update_electric_rows(int nx, int ny, int nz, int nthreads, int i, int j0, int j1, int[:, :] uniformE, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components of rows of an i plane.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        i (int): Plane to update
+        j0, j1 (int): First row, and one past the last row, to update
+        uniformE (memoryview): Material of each row [i, j] of the electric field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int j, k, jstart, jstop, listIndex, material
+    cdef float CA, CBx, CBy, CBz
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models), or on this plane
+    updateEx = ny != 1 and nz != 1 and i < nx
+    updateEy = nx != 1 and nz != 1 and i > 0 and i < nx
+    updateEz = nx != 1 and ny != 1 and i > 0 and i < nx
+    jstart = max(j0, 0)
+    jstop = min(j1, ny)
+
+    # No field components are updated on the plane i = nx, which has no row materials
+    if i >= nx:
+        return
+
+    for j in prange(jstart, jstop, nogil=True, schedule='static', num_threads=nthreads):
+        material = uniformE[i, j]
+        if material >= 0:
+            CA = updatecoeffsE[material, 0]
+            CBx = updatecoeffsE[material, 1]
+            CBy = updatecoeffsE[material, 2]
+            CBz = updatecoeffsE[material, 3]
+            # Only Ez is updated on the k = 0 plane
+            if updateEz and j > 0:
+                Ez[i, j, 0] = CA * Ez[i, j, 0] + CBx * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - CBy * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+            for k in range(1, nz):
+                if updateEx and j > 0:
+                    Ex[i, j, k] = CA * Ex[i, j, k] + CBy * (Hz[i, j, k] - Hz[i, j - 1, k]) - CBz * (Hy[i, j, k] - Hy[i, j, k - 1])
+                if updateEy:
+                    Ey[i, j, k] = CA * Ey[i, j, k] + CBz * (Hx[i, j, k] - Hx[i, j, k - 1]) - CBx * (Hz[i, j, k] - Hz[i - 1, j, k])
+                if updateEz and j > 0:
+                    Ez[i, j, k] = CA * Ez[i, j, k] + CBx * (Hy[i, j, k] - Hy[i - 1, j, k]) - CBy * (Hx[i, j, k] - Hx[i, j - 1, k])
+        else:
+            # Only Ez is updated on the k = 0 plane
+            if updateEz and j > 0:
+                listIndex = ID[2, i, j, 0]
+                Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+            for k in range(1, nz):
+                if updateEx and j > 0:
+                    listIndex = ID[0, i, j, k]
+                    Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1])
+                if updateEy:
+                    listIndex = ID[1, i, j, k]
+                    Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
+                if updateEz and j > 0:
+                    listIndex = ID[2, i, j, k]
+                    Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
+
+
+##############################################
+# Magnetic field updates - single plane rows #
+##############################################
+cpdef update_magnetic_rows(int nx, int ny, int nz, int nthreads, int i, int j0, int j1, int[:, :] uniformH, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the Hx, Hy and Hz field components of rows of an i plane.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        i (int): Plane to update
+        j0, j1 (int): First row, and one past the last row, to update
+        uniformH (memoryview): Material of each row [i, j] of the magnetic field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int j, k, jstart, jstop, listIndex, material
+    cdef float DA, DBx, DBy, DBz
+    cdef bint updateHx, updateHy, updateHz
+
+    # Components that are not updated when the grid is a single cell thick (2D models), or on this plane
+    updateHx = nx != 1 and i > 0 and i < nx
+    updateHy = ny != 1 and i < nx
+    updateHz = nz != 1 and i < nx
+    jstart = max(j0, 0)
+    jstop = min(j1, ny)
+
+    # No field components are updated on the plane i = nx, which has no row materials
+    if i >= nx:
+        return
+
+    for j in prange(jstart, jstop, nogil=True, schedule='static', num_threads=nthreads):
+        material = uniformH[i, j]
+        if material >= 0:
+            DA = updatecoeffsH[material, 0]
+            DBx = updatecoeffsH[material, 1]
+            DBy = updatecoeffsH[material, 2]
+            DBz = updatecoeffsH[material, 3]
+            # Hz is not updated on the k = 0 plane
+            if updateHx:
+                Hx[i, j, 0] = DA * Hx[i, j, 0] - DBy * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + DBz * (Ey[i, j, 1] - Ey[i, j, 0])
+            if updateHy and j > 0:
+                Hy[i, j, 0] = DA * Hy[i, j, 0] - DBz * (Ex[i, j, 1] - Ex[i, j, 0]) + DBx * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+            for k in range(1, nz):
+                if updateHx:
+                    Hx[i, j, k] = DA * Hx[i, j, k] - DBy * (Ez[i, j + 1, k] - Ez[i, j, k]) + DBz * (Ey[i, j, k + 1] - Ey[i, j, k])
+                if updateHy and j > 0:
+                    Hy[i, j, k] = DA * Hy[i, j, k] - DBz * (Ex[i, j, k + 1] - Ex[i, j, k]) + DBx * (Ez[i + 1, j, k] - Ez[i, j, k])
+                if updateHz:
+                    Hz[i, j, k] = DA * Hz[i, j, k] - DBx * (Ey[i + 1, j, k] - Ey[i, j, k]) + DBy * (Ex[i, j + 1, k] - Ex[i, j, k])
+        else:
+            # Hz is not updated on the k = 0 plane
+            if updateHx:
+                listIndex = ID[3, i, j, 0]
+                Hx[i, j, 0] = updatecoeffsH[listIndex, 0] * Hx[i, j, 0] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, 1] - Ey[i, j, 0])
+            if updateHy and j > 0:
+                listIndex = ID[4, i, j, 0]
+                Hy[i, j, 0] = updatecoeffsH[listIndex, 0] * Hy[i, j, 0] - updatecoeffsH[listIndex, 3] * (Ex[i, j, 1] - Ex[i, j, 0]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+            for k in range(1, nz):
+                if updateHx:
+                    listIndex = ID[3, i, j, k]
+                    Hx[i, j, k] = updatecoeffsH[listIndex, 0] * Hx[i, j, k] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, k] - Ez[i, j, k]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, k + 1] - Ey[i, j, k])
+                if updateHy and j > 0:
+                    listIndex = ID[4, i, j, k]
+                    Hy[i, j, k] = updatecoeffsH[listIndex, 0] * Hy[i, j, k] - updatecoeffsH[listIndex, 3] * (Ex[i, j, k + 1] - Ex[i, j, k]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, k] - Ez[i, j, k])
+                if updateHz:
+                    listIndex = ID[5, i, j, k]
+                    Hz[i, j, k] = updatecoeffsH[listIndex, 0] * Hz[i, j, k] - updatecoeffsH[listIndex, 1] * (Ey[i + 1, j, k] - Ey[i, j, k]) + updatecoeffsH[listIndex, 2] * (Ex[i, j + 1, k] - Ex[i, j, k])
@@ -0,0 +1,35 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+cimport numpy as np
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t
+
+cpdef update_electric_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:, :, :] uniformE, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_multipole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_multipole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_electric_dispersive_multipole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_1pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_1pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_electric_dispersive_1pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_2pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_2pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_electric_dispersive_2pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_3pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_electric_dispersive_3pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
+cpdef update_electric_dispersive_3pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz)
+cpdef update_magnetic_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:, :, :] uniformH, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez)
@@ -0,0 +1,849 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t, real_part
+
+
+# The grid is divided into tiles in the j and k directions. Each tile is swept over all i, so the
+# values of the previous i plane of the tile are still in cache when the stencil reaches them.
+# Tiles are distributed to threads, and all field components are updated in the same sweep.
+# The standard updates are given the material of each row (in the k direction) of each tile if it is
+# the same for all cell edges of the row, or -1. Uniform rows are updated with the update coefficients
+# of their material without reading the ID array.
+
+
+######################################################
+# Electric field updates - standard - all components #
+######################################################
+cpdef update_electric_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:, :, :] uniformE, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components tile by tile.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        uniformE (memoryview): Material of each row [i, j, tile in k direction] of the electric field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, material, ntilesk, js, jf, ks, kf
+    cdef float CA, CBx, CBy, CBz
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                material = uniformE[i, j, t % ntilesk]
+                if material >= 0:
+                    CA = updatecoeffsE[material, 0]
+                    CBx = updatecoeffsE[material, 1]
+                    CBy = updatecoeffsE[material, 2]
+                    CBz = updatecoeffsE[material, 3]
+                    # Only Ez is updated on the k = 0 plane
+                    if ks == 0 and updateEz and i > 0 and j > 0:
+                        Ez[i, j, 0] = CA * Ez[i, j, 0] + CBx * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - CBy * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+                    for k in range(max(ks, 1), kf):
+                        if updateEx and j > 0:
+                            Ex[i, j, k] = CA * Ex[i, j, k] + CBy * (Hz[i, j, k] - Hz[i, j - 1, k]) - CBz * (Hy[i, j, k] - Hy[i, j, k - 1])
+                        if updateEy and i > 0:
+                            Ey[i, j, k] = CA * Ey[i, j, k] + CBz * (Hx[i, j, k] - Hx[i, j, k - 1]) - CBx * (Hz[i, j, k] - Hz[i - 1, j, k])
+                        if updateEz and i > 0 and j > 0:
+                            Ez[i, j, k] = CA * Ez[i, j, k] + CBx * (Hy[i, j, k] - Hy[i - 1, j, k]) - CBy * (Hx[i, j, k] - Hx[i, j - 1, k])
+                else:
+                    # Only Ez is updated on the k = 0 plane
+                    if ks == 0 and updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, 0]
+                        Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0])
+                    for k in range(max(ks, 1), kf):
+                        if updateEx and j > 0:
+                            listIndex = ID[0, i, j, k]
+                            Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1])
+                        if updateEy and i > 0:
+                            listIndex = ID[1, i, j, k]
+                            Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k])
+                        if updateEz and i > 0 and j > 0:
+                            listIndex = ID[2, i, j, k]
+                            Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k])
+
+
+########################################################
+# Electric field updates - dispersive - all components #
+########################################################
+cpdef update_electric_dispersive_multipole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with multiple poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        poles (memoryview): Number of poles of each material
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, p, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    phi = 0.0
+                    for p in range(0, poles[listIndex]):
+                        phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tz[p, i, j, 0])
+                        Tz[p, i, j, 0] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tz[p, i, j, 0] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tx[p, i, j, k])
+                            Tx[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tx[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Ty[p, i, j, k])
+                            Ty[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Ty[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tz[p, i, j, k])
+                            Tz[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tz[p, i, j, k] + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_multipole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the temporary dispersive arrays of the Ex, Ey and Ez field components tile by tile when dispersive materials (with multiple poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        poles (memoryview): Number of poles of each material
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, p, ntilesk, js, jf, ks, kf
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    for p in range(0, poles[listIndex]):
+                        Tz[p, i, j, 0] = Tz[p, i, j, 0] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, 0]
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        for p in range(0, poles[listIndex]):
+                            Tx[p, i, j, k] = Tx[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        for p in range(0, poles[listIndex]):
+                            Ty[p, i, j, k] = Ty[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        for p in range(0, poles[listIndex]):
+                            Tz[p, i, j, k] = Tz[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+
+
+cpdef update_electric_dispersive_multipole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:] poles, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with multiple poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        poles (memoryview): Number of poles of each material
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, p, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    phi = 0.0
+                    for p in range(0, poles[listIndex]):
+                        Tprev = Tz[p, i, j, 0] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, 0]
+                        phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                        Tz[p, i, j, 0] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            Tprev = Tx[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                            Tx[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            Tprev = Ty[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                            Ty[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        phi = 0.0
+                        for p in range(0, poles[listIndex]):
+                            Tprev = Tz[p, i, j, k] - updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                            phi = phi + real_part(updatecoeffsdispersive[listIndex, p * 3]) * real_part(Tprev)
+                            Tz[p, i, j, k] = updatecoeffsdispersive[listIndex, 1 + (p * 3)] * Tprev + updatecoeffsdispersive[listIndex, 2 + (p * 3)] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_1pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 1 pole) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, 0])
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, 0] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k])
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k])
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k])
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_1pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the temporary dispersive arrays of the Ex, Ey and Ez field components tile by tile when dispersive materials (with 1 pole) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tz[0, i, j, 0] = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+
+
+cpdef update_electric_dispersive_1pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 1 pole) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tprev = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tprev = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Tprev = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tprev = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev)
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_2pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 2 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, 0]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, 0])
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, 0] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, 0] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tx[1, i, j, k])
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tx[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Ty[1, i, j, k])
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Ty[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, k])
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_2pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the temporary dispersive arrays of the Ex, Ey and Ez field components tile by tile when dispersive materials (with 2 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tz[0, i, j, 0] = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = Tz[1, i, j, 0] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+
+
+cpdef update_electric_dispersive_2pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 2 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tprev0 = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tprev1 = Tz[1, i, j, 0] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tprev0 = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tprev1 = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Tprev0 = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Tprev1 = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tprev0 = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tprev1 = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1)
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_3pole_A_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 3 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, 0]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, 0]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tz[2, i, j, 0])
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, 0] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, 0] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Tz[2, i, j, 0] = updatecoeffsdispersive[listIndex, 7] * Tz[2, i, j, 0] + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tx[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tx[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tx[2, i, j, k])
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tx[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tx[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Tx[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tx[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Ty[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Ty[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Ty[2, i, j, k])
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Ty[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Ty[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Ty[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Ty[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tz[0, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tz[1, i, j, k]) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tz[2, i, j, k])
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tz[0, i, j, k] + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tz[1, i, j, k] + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Tz[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tz[2, i, j, k] + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+cpdef update_electric_dispersive_3pole_B_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the temporary dispersive arrays of the Ex, Ey and Ez field components tile by tile when dispersive materials (with 3 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tz[0, i, j, 0] = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = Tz[1, i, j, 0] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Tz[2, i, j, 0] = Tz[2, i, j, 0] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, 0]
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tx[0, i, j, k] = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Tx[2, i, j, k] = Tx[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Ty[0, i, j, k] = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Ty[2, i, j, k] = Ty[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tz[0, i, j, k] = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Tz[2, i, j, k] = Tz[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+
+
+cpdef update_electric_dispersive_3pole_BA_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, floattype_t[:, :] updatecoeffsE, dispersivetype_t[:, :] updatecoeffsdispersive, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz):
+    """This function does the 2nd part of the dispersive update of the previous iteration, then updates the Ex, Ey and Ez field components tile by tile when dispersive materials (with 3 poles) are present.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        updatecoeffs, T, ID, E, H (memoryviews): Access to update coeffients, temporary, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, ntilesk, js, jf, ks, kf
+    cdef float phi = 0.0
+    cdef dispersivetype_t Tprev0, Tprev1, Tprev2
+    cdef bint updateEx, updateEy, updateEz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateEx = ny != 1 and nz != 1
+    updateEy = nx != 1 and nz != 1
+    updateEz = nx != 1 and ny != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                # Only Ez is updated on the k = 0 plane
+                if ks == 0 and updateEz and i > 0 and j > 0:
+                    listIndex = ID[2, i, j, 0]
+                    Tprev0 = Tz[0, i, j, 0] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tprev1 = Tz[1, i, j, 0] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Tprev2 = Tz[2, i, j, 0] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, 0]
+                    phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                    Tz[0, i, j, 0] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, 0]
+                    Tz[1, i, j, 0] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, 0]
+                    Tz[2, i, j, 0] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, 0]
+                    Ez[i, j, 0] = updatecoeffsE[listIndex, 0] * Ez[i, j, 0] + updatecoeffsE[listIndex, 1] * (Hy[i, j, 0] - Hy[i - 1, j, 0]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, 0] - Hx[i, j - 1, 0]) - updatecoeffsE[listIndex, 4] * phi
+                for k in range(max(ks, 1), kf):
+                    if updateEx and j > 0:
+                        listIndex = ID[0, i, j, k]
+                        Tprev0 = Tx[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tprev1 = Tx[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Tprev2 = Tx[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                        Tx[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ex[i, j, k]
+                        Tx[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ex[i, j, k]
+                        Tx[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ex[i, j, k]
+                        Ex[i, j, k] = updatecoeffsE[listIndex, 0] * Ex[i, j, k] + updatecoeffsE[listIndex, 2] * (Hz[i, j, k] - Hz[i, j - 1, k]) - updatecoeffsE[listIndex, 3] * (Hy[i, j, k] - Hy[i, j, k - 1]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEy and i > 0:
+                        listIndex = ID[1, i, j, k]
+                        Tprev0 = Ty[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Tprev1 = Ty[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Tprev2 = Ty[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                        Ty[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ey[i, j, k]
+                        Ty[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ey[i, j, k]
+                        Ty[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ey[i, j, k]
+                        Ey[i, j, k] = updatecoeffsE[listIndex, 0] * Ey[i, j, k] + updatecoeffsE[listIndex, 3] * (Hx[i, j, k] - Hx[i, j, k - 1]) - updatecoeffsE[listIndex, 1] * (Hz[i, j, k] - Hz[i - 1, j, k]) - updatecoeffsE[listIndex, 4] * phi
+                    if updateEz and i > 0 and j > 0:
+                        listIndex = ID[2, i, j, k]
+                        Tprev0 = Tz[0, i, j, k] - updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tprev1 = Tz[1, i, j, k] - updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Tprev2 = Tz[2, i, j, k] - updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                        phi = real_part(updatecoeffsdispersive[listIndex, 0]) * real_part(Tprev0) + real_part(updatecoeffsdispersive[listIndex, 3]) * real_part(Tprev1) + real_part(updatecoeffsdispersive[listIndex, 6]) * real_part(Tprev2)
+                        Tz[0, i, j, k] = updatecoeffsdispersive[listIndex, 1] * Tprev0 + updatecoeffsdispersive[listIndex, 2] * Ez[i, j, k]
+                        Tz[1, i, j, k] = updatecoeffsdispersive[listIndex, 4] * Tprev1 + updatecoeffsdispersive[listIndex, 5] * Ez[i, j, k]
+                        Tz[2, i, j, k] = updatecoeffsdispersive[listIndex, 7] * Tprev2 + updatecoeffsdispersive[listIndex, 8] * Ez[i, j, k]
+                        Ez[i, j, k] = updatecoeffsE[listIndex, 0] * Ez[i, j, k] + updatecoeffsE[listIndex, 1] * (Hy[i, j, k] - Hy[i - 1, j, k]) - updatecoeffsE[listIndex, 2] * (Hx[i, j, k] - Hx[i, j - 1, k]) - updatecoeffsE[listIndex, 4] * phi
+
+
+###########################################
+# Magnetic field updates - all components #
+###########################################
+cpdef update_magnetic_tiled(int nx, int ny, int nz, int nthreads, int tilej, int tilek, int[:, :, :] uniformH, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez):
+    """This function updates the Hx, Hy and Hz field components tile by tile.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells
+        nthreads (int): Number of threads to use
+        tilej, tilek (int): Tile size in cells in the j and k directions
+        uniformH (memoryview): Material of each row [i, j, tile in k direction] of the magnetic field components, or -1 if the row has more than one material
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+    """
+
+    cdef int i, j, k, t, listIndex, material, ntilesk, js, jf, ks, kf
+    cdef float DA, DBx, DBy, DBz
+    cdef bint updateHx, updateHy, updateHz
+
+    # Components that are not updated when the grid is a single cell thick (2D models)
+    updateHx = nx != 1
+    updateHy = ny != 1
+    updateHz = nz != 1
+
+    ntilesk = (nz + tilek - 1) // tilek
+
+    for t in prange(0, ((ny + tilej - 1) // tilej) * ntilesk, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        js = (t // ntilesk) * tilej
+        jf = min(js + tilej, ny)
+        ks = (t % ntilesk) * tilek
+        kf = min(ks + tilek, nz)
+        for i in range(0, nx):
+            for j in range(js, jf):
+                material = uniformH[i, j, t % ntilesk]
+                if material >= 0:
+                    DA = updatecoeffsH[material, 0]
+                    DBx = updatecoeffsH[material, 1]
+                    DBy = updatecoeffsH[material, 2]
+                    DBz = updatecoeffsH[material, 3]
+                    # Hz is not updated on the k = 0 plane
+                    if ks == 0:
+                        if updateHx and i > 0:
+                            Hx[i, j, 0] = DA * Hx[i, j, 0] - DBy * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + DBz * (Ey[i, j, 1] - Ey[i, j, 0])
+                        if updateHy and j > 0:
+                            Hy[i, j, 0] = DA * Hy[i, j, 0] - DBz * (Ex[i, j, 1] - Ex[i, j, 0]) + DBx * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+                    for k in range(max(ks, 1), kf):
+                        if updateHx and i > 0:
+                            Hx[i, j, k] = DA * Hx[i, j, k] - DBy * (Ez[i, j + 1, k] - Ez[i, j, k]) + DBz * (Ey[i, j, k + 1] - Ey[i, j, k])
+                        if updateHy and j > 0:
+                            Hy[i, j, k] = DA * Hy[i, j, k] - DBz * (Ex[i, j, k + 1] - Ex[i, j, k]) + DBx * (Ez[i + 1, j, k] - Ez[i, j, k])
+                        if updateHz:
+                            Hz[i, j, k] = DA * Hz[i, j, k] - DBx * (Ey[i + 1, j, k] - Ey[i, j, k]) + DBy * (Ex[i, j + 1, k] - Ex[i, j, k])
+                else:
+                    # Hz is not updated on the k = 0 plane
+                    if ks == 0:
+                        if updateHx and i > 0:
+                            listIndex = ID[3, i, j, 0]
+                            Hx[i, j, 0] = updatecoeffsH[listIndex, 0] * Hx[i, j, 0] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, 0] - Ez[i, j, 0]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, 1] - Ey[i, j, 0])
+                        if updateHy and j > 0:
+                            listIndex = ID[4, i, j, 0]
+                            Hy[i, j, 0] = updatecoeffsH[listIndex, 0] * Hy[i, j, 0] - updatecoeffsH[listIndex, 3] * (Ex[i, j, 1] - Ex[i, j, 0]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, 0] - Ez[i, j, 0])
+                    for k in range(max(ks, 1), kf):
+                        if updateHx and i > 0:
+                            listIndex = ID[3, i, j, k]
+                            Hx[i, j, k] = updatecoeffsH[listIndex, 0] * Hx[i, j, k] - updatecoeffsH[listIndex, 2] * (Ez[i, j + 1, k] - Ez[i, j, k]) + updatecoeffsH[listIndex, 3] * (Ey[i, j, k + 1] - Ey[i, j, k])
+                        if updateHy and j > 0:
+                            listIndex = ID[4, i, j, k]
+                            Hy[i, j, k] = updatecoeffsH[listIndex, 0] * Hy[i, j, k] - updatecoeffsH[listIndex, 3] * (Ex[i, j, k + 1] - Ex[i, j, k]) + updatecoeffsH[listIndex, 1] * (Ez[i + 1, j, k] - Ez[i, j, k])
+                        if updateHz:
+                            listIndex = ID[5, i, j, k]
+                            Hz[i, j, k] = updatecoeffsH[listIndex, 0] * Hz[i, j, k] - updatecoeffsH[listIndex, 1] * (Ey[i + 1, j, k] - Ey[i, j, k]) + updatecoeffsH[listIndex, 2] * (Ex[i, j + 1, k] - Ex[i, j, k])
@@ -81,7 +81,7 @@ cpdef bint is_inside_sector(float px, float py, float ctrx, float ctry, float se
     return not are_clockwise(sectorstart1, sectorstart2, relpoint1, relpoint2) and are_clockwise(sectorend1, sectorend2, relpoint1, relpoint2) and is_within_radius(relpoint1, relpoint2, radius)
 
 
-cpdef build_edge_x(int i, int j, int k, int numIDx, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_edge_x(int i, int j, int k, int numIDx, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set x-orientated edges in the rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -94,7 +94,7 @@ cpdef build_edge_x(int i, int j, int k, int numIDx, np.int8_t[:, :, :, :] rigidE
     ID[0, i, j, k] = numIDx
 
 
-cpdef build_edge_y(int i, int j, int k, int numIDy, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_edge_y(int i, int j, int k, int numIDy, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set y-orientated edges in the rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -107,7 +107,7 @@ cpdef build_edge_y(int i, int j, int k, int numIDy, np.int8_t[:, :, :, :] rigidE
     ID[1, i, j, k] = numIDy
 
 
-cpdef build_edge_z(int i, int j, int k, int numIDz, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_edge_z(int i, int j, int k, int numIDz, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set z-orientated edges in the rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -120,7 +120,7 @@ cpdef build_edge_z(int i, int j, int k, int numIDz, np.int8_t[:, :, :, :] rigidE
     ID[2, i, j, k] = numIDz
 
 
-cpdef build_face_yz(int i, int j, int k, int numIDy, int numIDz, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_face_yz(int i, int j, int k, int numIDy, int numIDz, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set the edges of the yz-plane face of a Yell cell in the rigid and ID arrays.
         
     Args:
@@ -147,7 +147,7 @@ cpdef build_face_yz(int i, int j, int k, int numIDy, int numIDz, np.int8_t[:, :,
     ID[5, i, j + 1, k] = numIDz
 
 
-cpdef build_face_xz(int i, int j, int k, int numIDx, int numIDz, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_face_xz(int i, int j, int k, int numIDx, int numIDz, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set the edges of the xz-plane face of a Yell cell in the rigid and ID arrays.
         
     Args:
@@ -174,7 +174,7 @@ cpdef build_face_xz(int i, int j, int k, int numIDx, int numIDz, np.int8_t[:, :,
     ID[5, i + 1, j, k] = numIDz
 
 
-cpdef build_face_xy(int i, int j, int k, int numIDx, int numIDy, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_face_xy(int i, int j, int k, int numIDx, int numIDy, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set the edges of the xy-plane face of a Yell cell in the rigid and ID arrays.
         
     Args:
@@ -201,7 +201,7 @@ cpdef build_face_xy(int i, int j, int k, int numIDx, int numIDy, np.int8_t[:, :,
     ID[4, i + 1, j, k] = numIDy
 
 
-cpdef build_voxel(int i, int j, int k, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_voxel(int i, int j, int k, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Set values in the solid, rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -252,7 +252,7 @@ cpdef build_voxel(int i, int j, int k, int numID, int numIDx, int numIDy, int nu
         ID[5, i, j + 1, k] = numIDz
 
 
-cpdef build_triangle(float x1, float y1, float z1, float x2, float y2, float z2, float x3, float y3, float z3, str normal, int thickness, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_triangle(float x1, float y1, float z1, float x2, float y2, float z2, float x3, float y3, float z3, str normal, int thickness, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Builds #triangle and #triangular_prism commands which sets values in the solid, rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -332,7 +332,7 @@ cpdef build_triangle(float x1, float y1, float z1, float x2, float y2, float z2,
                             build_voxel(i, j, k, numID, numIDx, numIDy, numIDz, averaging, solid, rigidE, rigidH, ID)
 
 
-cpdef build_cylindrical_sector(float ctr1, float ctr2, int level, float sectorstartangle, float sectorangle, float radius, str normal, int thickness, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_cylindrical_sector(float ctr1, float ctr2, int level, float sectorstartangle, float sectorangle, float radius, str normal, int thickness, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Builds #cylindrical_sector commands which sets values in the solid, rigid and ID arrays for a Yee voxel. It defines a sector of cylinder given by the direction of the axis of the coordinates of the cylinder face centre, depth coordinates, sector start point, sector angle, and sector radius. N.B Assumes sector start is always clockwise from sector end, i.e. sector defined in an anti-clockwise direction.
         
     Args:
@@ -400,7 +400,7 @@ cpdef build_cylindrical_sector(float ctr1, float ctr2, int level, float sectorst
                             build_voxel(x, y, z, numID, numIDx, numIDy, numIDz, averaging, solid, rigidE, rigidH, ID)
 
 
-cpdef build_box(int xs, int xf, int ys, int yf, int zs, int zf, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_box(int xs, int xf, int ys, int yf, int zs, int zf, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Builds #box commands which sets values in the solid, rigid and ID arrays.
         
     Args:
@@ -458,7 +458,7 @@ cpdef build_box(int xs, int xf, int ys, int yf, int zs, int zf, int numID, int n
                     ID[5, i, j, k] = numIDz
 
 
-cpdef build_cylinder(float x1, float y1, float z1, float x2, float y2, float z2, float r, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_cylinder(float x1, float y1, float z1, float x2, float y2, float z2, float r, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Builds #cylinder commands which sets values in the solid, rigid and ID arrays for a Yee voxel.
         
     Args:
@@ -556,7 +556,7 @@ cpdef build_cylinder(float x1, float y1, float z1, float x2, float y2, float z2,
                     build_voxel(i, j, k, numID, numIDx, numIDy, numIDz, averaging, solid, rigidE, rigidH, ID)
 
 
-cpdef build_sphere(int xc, int yc, int zc, float r, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
+cpdef build_sphere(int xc, int yc, int zc, float r, float dx, float dy, float dz, int numID, int numIDx, int numIDy, int numIDz, bint averaging, np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID):
     """Builds #sphere commands which sets values in the solid, rigid and ID arrays for a Yee voxel.
         
     Args:
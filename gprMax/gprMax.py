@@ -23,8 +23,6 @@ __version__ = '3.0.0b4'
 versionname = ' (Bowmore)'
 
 import sys, os, datetime, itertools, argparse
-if sys.platform != 'win32':
-    import resource
 from time import perf_counter
 from copy import deepcopy
 from enum import Enum
@@ -33,17 +31,17 @@ import numpy as np
 
 from .constants import e0
 from .exceptions import CmdInputError
-from .fields_output import prepare_output_file, write_output
-from .fields_update import *
+from .fields_output import prepare_output_file, truncate_output, write_output_block, write_phasors
 from .grid import FDTDGrid
 from .input_cmds_geometry import process_geometrycmds
 from .input_cmds_file import python_code_blocks, write_python_processed, check_cmd_names
 from .input_cmds_multiuse import process_multicmds
 from .input_cmds_singleuse import process_singlecmds
 from .materials import Material
-from .pml_call_updates import update_pml_electric, update_pml_magnetic
 from .pml import build_pml, calculate_initial_pml_params
-from .utilities import update_progress, logo, human_size
+from .solver import FDTDSolver, tile_candidates
+from .steady_state import SteadyState
+from .utilities import update_progress, logo, human_size, peak_memory
 from .yee_cell_build import build_ex_component, build_ey_component, build_ez_component, build_hx_component, build_hy_component, build_hz_component
 
 
@@ -60,6 +58,7 @@ def main():
     parser.add_argument('-n', default=1, type=int, help='number of times to run the input file')
     parser.add_argument('-mpi', action='store_true', default=False, help='switch on MPI')
     parser.add_argument('--commands-python', action='store_true', default=False, help='write an input file after any Python code blocks in the original input file have been processed')
+    parser.add_argument('--unfused-updates', action='store_true', default=False, help='update each field component with a separate sweep of the grid, e.g. to validate the fused field updates')
     args = parser.parse_args()
     numbermodelruns = args.n
     inputdirectory = os.path.dirname(os.path.abspath(args.inputfile)) + os.sep
@@ -134,6 +133,17 @@ def main():
     print('\nSimulation completed.\n{}\n'.format(65*'*'))
 
 
+def check_temporal_blocking(G):
+    """Checks that temporal blocking is not used with dispersive materials, which 3D models cannot advance several iterations at a time.
+
+    Args:
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    if G.mode == '3D' and G.temporalblocking and G.temporalblocking[0] > 1 and Material.maxpoles != 0:
+        raise CmdInputError('#temporal_blocking cannot be used with dispersive materials')
+
+
 def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
     """Runs a model - processes the input file; builds the Yee cells; calculates update coefficients; runs main FDTD loop.
         
@@ -164,6 +174,7 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
 
     # Process parameters for commands that can occur multiple times in the model
     process_multicmds(multicmds, G)
+    check_temporal_blocking(G)
 
     # Initialise an array for volumetric material IDs (solid), boolean arrays for specifying materials not to be averaged (rigid),
     # an array for cell edge IDs (ID), and arrays for the field components.
@@ -175,8 +186,16 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
     tinputprocend = perf_counter()
     print('\nInput file processed in [HH:MM:SS]: {}'.format(datetime.timedelta(seconds=int(tinputprocend - tinputprocstart))))
 
+    # Dispersive materials can also be created by geometry commands, i.e. soils using a Peplinski mixing model
+    check_temporal_blocking(G)
+
+    # Fractal volumes and surfaces have been built into the solid, rigid and ID arrays
+    memoryreleased = G.release_fractal_arrays()
+
     # Build the PML and calculate initial coefficients
-    build_pml(G)
+    memorysaved = build_pml(G)
+    if memorysaved and G.messages:
+        print('PML Phi vectors stored only for the cells of the slabs, saving {} of memory'.format(human_size(memorysaved)))
     calculate_initial_pml_params(G)
 
     # Build the model, i.e. set the material properties (ID) for every edge of every Yee cell
@@ -227,6 +246,8 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
     # Initialise arrays for storing temporary values if there are any dispersive materials
     if Material.maxpoles != 0:
         G.initialise_dispersive_arrays(len(G.materials))
+        if G.messages and G.dispersivecellsEx is not None:
+            print('\nDispersive materials in {} cell edges: temporary values stored only for these edges, saving {} of memory'.format(len(G.dispersivecellsEx) + len(G.dispersivecellsEy) + len(G.dispersivecellsEz), human_size(G.dispersivememorysaved)))
     
     # Initialise arrays of update coefficients to pass to update functions
     G.initialise_std_updatecoeff_arrays(len(G.materials))
@@ -246,7 +267,11 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
         if Material.maxpoles != 0:
             z = 0
             for y in range(Material.maxpoles):
-                G.updatecoeffsdispersive[x, z:z+3] = e0 * material.eqt2[y], material.eqt[y], material.zt[y]
+                if np.iscomplexobj(G.updatecoeffsdispersive):
+                    G.updatecoeffsdispersive[x, z:z+3] = e0 * material.eqt2[y], material.eqt[y], material.zt[y]
+                else:
+                    # Coefficients of real poles (Debye, Drude) have no imaginary part
+                    G.updatecoeffsdispersive[x, z:z+3] = e0 * material.eqt2[y].real, material.eqt[y].real, material.zt[y].real
                 z += 3
         
         if G.messages:
@@ -260,6 +285,15 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
                 dielectricsmoothing = 'dielectric smoothing not permitted.'
             print('{:3}\t{:12}\tepsr={:4.2f}, sig={:.3e} S/m; mur={:4.2f}, sig*={:.3e} S/m; '.format(material.numID, material.ID, material.er, material.se, material.mr, material.sm) + tmp + dielectricsmoothing)
     
+    # Free the planes of the ID array for the magnetic field components if the model is non-magnetic
+    if G.free_magnetic_ID() and G.messages:
+        print('\nNon-magnetic model: magnetic field updates use the same update coefficients for all cell edges, saving {} of memory'.format(human_size(G.ID.nbytes)))
+
+    # Store the solid and ID arrays with the narrowest integer type that holds all the materials
+    memorysaved = G.narrow_ID()
+    if memorysaved and G.messages:
+        print('\nSolid and ID arrays stored as {}-bit integers for {} materials, saving {} of memory'.format(8 * G.ID.itemsize, len(G.materials), human_size(memorysaved)))
+
     # Write files for any geometry views
     if G.geometryviews:
         tgeostart = perf_counter()
@@ -268,6 +302,14 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
         tgeoend = perf_counter()
         print('\nGeometry file(s) written in [HH:MM:SS]: {}'.format(datetime.timedelta(seconds=int(tgeoend - tgeostart))))
 
+    # Release arrays that are only needed to build the model and write geometry views
+    peakmemorybuild = peak_memory()
+    memoryreleased += G.release_build_arrays()
+    if G.messages:
+        print('\nArrays only needed to build the model released, freeing {} of memory'.format(human_size(memoryreleased)))
+        if peakmemorybuild:
+            print('Peak memory (approx) used building the model: {}'.format(human_size(peakmemorybuild)))
+
     # Run simulation if not doing only geometry
     if not args.geometry_only:
         
@@ -302,94 +344,108 @@ def run_model(args, modelrun, numbermodelruns, inputfile, inputdirectory):
         #   Main FDTD calculation loop   #
         ##################################
         tsolvestart = perf_counter()
-        # Absolute time
-        abstime = 0
 
-        for timestep in range(G.iterations):
-            if timestep == 0:
-                tstepstart = perf_counter()
-            
-            # Write field outputs to file
-            write_output(f, timestep, G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, G)
-            
+        # The compiled solver runs blocks of iterations, only returning to Python to write receiver values and snapshots to file, and to update progress
+        blocksize = max(2, -(-G.iterations // 100))
+        solver = FDTDSolver(G, blocksize, fused=not args.unfused_updates)
+
+        # 2D models are updated with their own field updates, which are neither tiled nor temporally blocked
+        if G.mode != '3D':
+            if G.messages and (G.tilesize or (G.temporalblocking and G.temporalblocking[0] > 1)):
+                print('\n#tile_size and #temporal_blocking are not used for {} models'.format(G.mode))
+
+        # Advance several iterations at a time through each part of the grid, if given in the input file
+        elif G.temporalblocking and G.temporalblocking[0] > 1:
+            solver.temporalsteps, solver.temporalrows = G.temporalblocking
+            if G.messages:
+                print('\nTemporal blocking of {} iterations, with tiles of {} rows (y)'.format(solver.temporalsteps, solver.temporalrows))
+
+        # Choose the tile size for the field updates, either given in the input file or the fastest of a set of candidates
+        elif not args.unfused_updates:
+            if G.tilesize:
+                solver.tilej, solver.tilek = G.tilesize
+                if G.messages:
+                    print('\nField updates using tile size (y x z): {} x {} cells'.format(solver.tilej, solver.tilek))
+            elif G.tilesize is None:
+                candidates = tile_candidates(G.nx, G.ny, G.nz, G.nthreads)
+                timings = solver.autotune_tiles(candidates)
+                if G.messages:
+                    if solver.tilej:
+                        print('\nField updates using tile size (y x z): {} x {} cells, autotuned from {} candidates ({:.3g} ms per iteration, untiled {:.3g} ms)'.format(solver.tilej, solver.tilek, len(candidates), min(timings) * 1e3, timings[0] * 1e3))
+                    else:
+                        print('\nField updates untiled, autotuned from {} candidates ({:.3g} ms per iteration)'.format(len(candidates), timings[0] * 1e3))
+        snapshotsteps = sorted(set(snapshot.time - 1 for snapshot in G.snapshots))
+
+        # Track the phasors at the receivers for each period of continuous sine wave sources, to stop once they reach steady state
+        steadystate = None
+        if G.steadystate:
+            steadystate = SteadyState(G.steadystate, G)
+            print('\nPhasors at {:g} Hz found over periods of {} iterations'.format(steadystate.frequency, steadystate.period))
+
+        timestep = 0
+        while timestep < G.iterations:
             # Write any snapshots to file
             if G.snapshots:
                 for snapshot in G.snapshots:
                     if snapshot.time == timestep + 1:
                         snapshot.write_snapshot(G.Ex, G.Ey, G.Ez, G.Hx, G.Hy, G.Hz, G)
 
-            # Update electric field components
-            # If there are any dispersive materials do 1st part of dispersive update. It is split into two parts as it requires present and updated electric field values.
-            if Material.maxpoles == 1:
-                update_ex_dispersive_1pole_A(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ex, G.Hy, G.Hz)
-                update_ey_dispersive_1pole_A(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Ty, G.Ey, G.Hx, G.Hz)
-                update_ez_dispersive_1pole_A(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tz, G.Ez, G.Hx, G.Hy)
-            elif Material.maxpoles > 1:
-                update_ex_dispersive_multipole_A(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ex, G.Hy, G.Hz)
-                update_ey_dispersive_multipole_A(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Ty, G.Ey, G.Hx, G.Hz)
-                update_ez_dispersive_multipole_A(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsE, G.updatecoeffsdispersive, G.ID, G.Tz, G.Ez, G.Hx, G.Hy)
-            # Otherwise all materials are non-dispersive so do standard update
+            # Run up to the end of the block or the next snapshot. The first block is two iterations, used to estimate overall runtime.
+            if timestep == 0:
+                blockend = min(2, G.iterations)
             else:
-                update_ex(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ex, G.Hy, G.Hz)
-                update_ey(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ey, G.Hx, G.Hz)
-                update_ez(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ez, G.Hx, G.Hy)
-
-            # Update electric field components with the PML correction
-            update_pml_electric(G)
-
-            # Update electric field components with electric sources
-            if G.voltagesources:
-                for v in G.voltagesources:
-                    v.update_fields(abstime, timestep, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G)
-            if G.hertziandipoles:   # Update any Hertzian dipole sources last
-                for h in G.hertziandipoles:
-                    h.update_fields(abstime, timestep, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G)
-
-            # If there are any dispersive materials do 2nd part of dispersive update. It is split into two parts as it requires present and updated electric field values. Therefore it can only be completely updated after the electric field has been updated by the PML and source updates.
-            if Material.maxpoles == 1:
-                update_ex_dispersive_1pole_B(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ex)
-                update_ey_dispersive_1pole_B(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsdispersive, G.ID, G.Ty, G.Ey)
-                update_ez_dispersive_1pole_B(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsdispersive, G.ID, G.Tz, G.Ez)
-            elif Material.maxpoles > 1:
-                update_ex_dispersive_multipole_B(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsdispersive, G.ID, G.Tx, G.Ex)
-                update_ey_dispersive_multipole_B(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsdispersive, G.ID, G.Ty, G.Ey)
-                update_ez_dispersive_multipole_B(G.nx, G.ny, G.nz, G.nthreads, Material.maxpoles, G.updatecoeffsdispersive, G.ID, G.Tz, G.Ez)
-
-            # Increment absolute time value
-            abstime += 0.5 * G.dt
-            
-            # Update magnetic field components
-            update_hx(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hx, G.Ey, G.Ez)
-            update_hy(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hy, G.Ex, G.Ez)
-            update_hz(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hz, G.Ex, G.Ey)
-
-            # Update magnetic field components with the PML correction
-            update_pml_magnetic(G)
-
-            # Update magnetic field components with magnetic sources
-            if G.magneticdipoles:
-                for m in G.magneticdipoles:
-                    m.update_fields(abstime, timestep, G.updatecoeffsH, G.ID, G.Hx, G.Hy, G.Hz, G)
-        
-            # Increment absolute time value
-            abstime += 0.5 * G.dt
-        
-            # Calculate time for two iterations, used to estimate overall runtime
-            if timestep == 1:
-                tstepend = perf_counter()
-                runtime = datetime.timedelta(seconds=int((tstepend - tstepstart) / 2 * G.iterations))
+                blockend = min(timestep + blocksize, G.iterations)
+            blockend = min([blockend] + [step for step in snapshotsteps if step > timestep])
+
+            tstepstart = perf_counter()
+            blockend = solver.run(timestep, blockend)
+            tstepend = perf_counter()
+
+            # Write field outputs to file
+            write_output_block(f, timestep, blockend, solver.rxvalues, G)
+            if steadystate:
+                steadystate.update(timestep, blockend, solver.rxvalues)
+
+            if timestep == 0:
+                runtime = datetime.timedelta(seconds=int((tstepend - tstepstart) / blockend * G.iterations))
                 sys.stdout.write('Estimated runtime [HH:MM:SS]: {}\n'.format(runtime))
                 sys.stdout.write('Solving for model run {} of {}...\n'.format(modelrun, numbermodelruns))
                 sys.stdout.flush()
-            elif timestep > 1:
-                update_progress((timestep + 1) / G.iterations)
-            
+            else:
+                update_progress(blockend / G.iterations)
+
+            timestep = blockend
+
+            # Stop once the fields have decayed or reached steady state
+            if solver.decayed or (steadystate and steadystate.converged):
+                break
+
+        # Complete any dispersive update deferred to the next iteration
+        solver.flush_dispersive()
+
+        # Record the iterations that were run if the run stopped early
+        if solver.decayed:
+            truncate_output(f, timestep, G)
+            print('\n\nField energy decayed below {:g} of its peak: stopped after {} of {} iterations'.format(G.stopondecay[0], timestep, G.iterations))
+        elif steadystate and steadystate.converged:
+            truncate_output(f, timestep, G)
+            print('\n\nSteady state reached, phasors changed by less than {:g} between periods: stopped after {} of {} iterations'.format(G.steadystate, timestep, G.iterations))
+
+        # Write the phasors for the last period that was run
+        if steadystate:
+            if steadystate.phasors is None:
+                print('\n\nNo phasors written, as the time window is shorter than a period of the sources')
+            else:
+                if not steadystate.converged:
+                    print('\n\nSteady state not reached within the time window, phasors are for the last period')
+                write_phasors(f, steadystate, G)
+
         # Close output file
         f.close()
         tsolveend = perf_counter()
         print('\n\nSolving took [HH:MM:SS]: {}'.format(datetime.timedelta(seconds=int(tsolveend - tsolvestart))))
-        if sys.platform != 'win32':
-            print('Peak memory (approx) used: {}'.format(human_size(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, False)))
+        if peak_memory():
+            print('Peak memory (approx) used: {}'.format(human_size(peak_memory())))
 
 
 
@@ -18,8 +18,9 @@
 
 import numpy as np
 
-from .constants import floattype, complextype
+from .constants import floattype, complextype, idtypes
 from .materials import Material
+from .numa import first_touch_zeros
 
 
 class FDTDGrid():
@@ -32,6 +33,7 @@ class FDTDGrid():
         self.nx = 0
         self.ny = 0
         self.nz = 0
+        self.mode = '3D'
         self.dx = 0
         self.dy = 0
         self.dz = 0
@@ -39,6 +41,12 @@ class FDTDGrid():
         self.iterations = 0
         self.timewindow = 0
         self.nthreads = 0
+        self.threadaffinity = None
+        self.firsttouch = True
+        self.tilesize = None
+        self.temporalblocking = None
+        self.stopondecay = None
+        self.steadystate = None
         self.cfs = []
         self.pmlthickness = (10, 10, 10, 10, 10, 10)
         self.pmls = []
@@ -62,20 +70,88 @@ class FDTDGrid():
         self.snapshots = []
         
     def initialise_std_arrays(self):
-        """Initialise an array for volumetric material IDs (solid); boolean arrays for specifying whether materials can have dielectric smoothing (rigid);
-            an array for cell edge IDs (ID); and arrays for the electric and magnetic field components. Solid and ID arrays are initialised to free_space (one); rigid arrays
-            to allow dielectric smoothing (zero).
+        """Initialise an array for volumetric material IDs (solid); arrays for specifying whether materials can have dielectric smoothing (rigid), with a bit
+            for each of the 12 electric or 6 magnetic edge components of a cell; an array for cell edge IDs (ID); and arrays for the electric and magnetic field components.
+            Solid and ID arrays are initialised to free_space (one); rigid arrays to allow dielectric smoothing (zero).
         """
         self.solid = np.ones((self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.uint32)
-        self.rigidE = np.zeros((12, self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.int8)
-        self.rigidH = np.zeros((6, self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.int8)
-        self.ID = np.ones((6, self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.uint32)
-        self.Ex = np.zeros((self.nx, self.ny + 1, self.nz + 1), dtype=floattype)
-        self.Ey = np.zeros((self.nx + 1, self.ny, self.nz + 1), dtype=floattype)
-        self.Ez = np.zeros((self.nx + 1, self.ny + 1, self.nz), dtype=floattype)
-        self.Hx = np.zeros((self.nx + 1, self.ny, self.nz), dtype=floattype)
-        self.Hy = np.zeros((self.nx, self.ny + 1, self.nz), dtype=floattype)
-        self.Hz = np.zeros((self.nx, self.ny, self.nz + 1), dtype=floattype)
+        self.rigidE = np.zeros((self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.uint16)
+        self.rigidH = np.zeros((self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.uint8)
+        self.ID = self.zeros((6, self.nx + 1, self.ny + 1, self.nz + 1), dtype=np.uint32, axis=1)
+        self.ID.fill(1)
+        # ID array used for the magnetic field components, which is replaced if the model is non-magnetic
+        self.IDH = self.ID
+        self.Ex = self.field_zeros('Ex', (self.nx, self.ny + 1, self.nz + 1))
+        self.Ey = self.field_zeros('Ey', (self.nx + 1, self.ny, self.nz + 1))
+        self.Ez = self.field_zeros('Ez', (self.nx + 1, self.ny + 1, self.nz))
+        self.Hx = self.field_zeros('Hx', (self.nx + 1, self.ny, self.nz))
+        self.Hy = self.field_zeros('Hy', (self.nx, self.ny + 1, self.nz))
+        self.Hz = self.field_zeros('Hz', (self.nx, self.ny, self.nz + 1))
+
+    def component_used(self, component):
+        """Checks whether a field component is updated. All of them are updated in 3D models, but in 2D (TM) models only the
+            electric field component normal to the plane of the model and the magnetic field components in the plane are updated.
+
+        Args:
+            component (str): Field component, e.g. 'Ex'.
+
+        Returns:
+            (bool): The field component is updated.
+        """
+        if self.mode == '3D':
+            return True
+        else:
+            return (component[0] == 'E') == (component[1] == self.mode[-1])
+
+    def field_zeros(self, component, shape, dtype=floattype, axis=0):
+        """Allocates an array of zeros for a field component, or for values stored for each of its cell edges. If the field component
+            is not updated (2D models) its values are always zero, so all the elements of the array share the memory of a single value.
+
+        Args:
+            component (str): Field component, e.g. 'Ex'.
+            shape (tuple): Shape of the array.
+            dtype (type): Data type of the array.
+            axis (int): First of the axes that the field updates are parallelised over.
+
+        Returns:
+            (array): Array of zeros.
+        """
+        if self.component_used(component):
+            return self.zeros(shape, dtype, axis)
+        else:
+            return self.shared_zeros(shape, dtype)
+
+    @staticmethod
+    def shared_zeros(shape, dtype):
+        """Creates an array of zeros in which all the elements share the memory of a single value, so it uses (almost) no memory.
+            It must not be written to, other than with zeros.
+
+        Args:
+            shape (tuple): Shape of the array.
+            dtype (type): Data type of the array.
+
+        Returns:
+            (array): Array of zeros.
+        """
+        return np.lib.stride_tricks.as_strided(np.zeros(1, dtype=dtype), shape=shape, strides=(0,) * len(shape))
+
+    def zeros(self, shape, dtype, axis=0):
+        """Allocates an array of zeros that is used by the field updates. If there is more than one thread, each part of the array
+            is written first by the thread that updates it, so that on machines with more than one processor (NUMA node) its memory
+            is placed on the processor of that thread (first touch).
+
+        Args:
+            shape (int or tuple): Shape of the array.
+            dtype (type): Data type of the array.
+            axis (int): First of the axes that the field updates are parallelised over, i.e. the x direction of the grid (the updates divide the rows of cells in x and y between the threads), or a list of cell edges.
+
+        Returns:
+            (array): Array of zeros.
+        """
+        if self.firsttouch and self.nthreads > 1:
+            return first_touch_zeros(shape, dtype, axis, self.nthreads)
+        else:
+            return np.zeros(shape, dtype=dtype)
     
     def initialise_std_updatecoeff_arrays(self, nummaterials):
         """Initialise arrays for storing update coefficients.
@@ -86,17 +162,116 @@ class FDTDGrid():
         self.updatecoeffsE = np.zeros((nummaterials, 5), dtype=floattype)
         self.updatecoeffsH = np.zeros((nummaterials, 5), dtype=floattype)
 
+    def free_magnetic_ID(self):
+        """If all materials have the same magnetic update coefficients (the model is non-magnetic), frees the planes of the ID array
+            for the magnetic field components. The magnetic field updates then use an array of the same shape with a single
+            (zero) value for all cell edges, so they use the same update coefficients everywhere without reading a full array.
+
+        Returns:
+            (bool): Whether the magnetic planes of the ID array were freed.
+        """
+        if not np.all(self.updatecoeffsH == self.updatecoeffsH[0, :]):
+            return False
+
+        self.IDH = self.shared_zeros((6, self.nx + 1, self.ny + 1, self.nz + 1), self.ID.dtype)
+
+        # Planes for the electric field components are the first half of the array, so it can be shrunk in place
+        self.ID.resize((3, self.nx + 1, self.ny + 1, self.nz + 1))
+
+        return True
+
+    def narrow_ID(self):
+        """Converts the solid and ID arrays to the narrowest integer type (8, 16 or 32-bit) that holds the numeric IDs of all the materials.
+            Should be called once all the materials have been created, i.e. after the model has been built.
+
+        Returns:
+            memorysaved (int): Memory saved in bytes.
+        """
+        idtype = next(x for x in idtypes if len(self.materials) - 1 <= np.iinfo(x).max)
+        if idtype == self.ID.dtype:
+            return 0
+
+        memorysaved = self.solid.nbytes + self.ID.nbytes
+        self.solid = self.solid.astype(idtype)
+        ID = self.zeros(self.ID.shape, dtype=idtype, axis=1)
+        ID[:] = self.ID
+        if self.IDH is self.ID:
+            self.ID = self.IDH = ID
+        else:
+            self.ID = ID
+            self.IDH = self.shared_zeros(self.IDH.shape, idtype)
+        memorysaved -= self.solid.nbytes + self.ID.nbytes
+
+        return memorysaved
+
+    def release_fractal_arrays(self):
+        """Releases the arrays used to generate fractal volumes and surfaces, which are no longer needed once they have been built into the solid, rigid and ID arrays.
+
+        Returns:
+            memoryreleased (int): Memory released in bytes.
+        """
+        # Arrays are only created when they are needed, e.g. a mask is only generated if there are surfaces
+        memoryreleased = 0
+        for volume in self.fractalvolumes:
+            arrays = [getattr(volume, 'fractalvolume', None), getattr(volume, 'mask', None)] + [getattr(surface, 'fractalsurface', None) for surface in volume.fractalsurfaces]
+            memoryreleased += sum(array.nbytes for array in arrays if array is not None)
+        self.fractalvolumes = []
+
+        return memoryreleased
+
+    def release_build_arrays(self):
+        """Releases the solid and rigid arrays, which are only needed to build the model and write geometry views, before the main FDTD loop.
+
+        Returns:
+            memoryreleased (int): Memory released in bytes.
+        """
+        memoryreleased = self.solid.nbytes + self.rigidE.nbytes + self.rigidH.nbytes
+        self.solid = self.rigidE = self.rigidH = None
+
+        return memoryreleased
+
     def initialise_dispersive_arrays(self, nummaterials):
-        """Initialise arrays for storing coefficients when there are dispersive materials present.
+        """Initialise arrays for storing coefficients when there are dispersive materials present. The arrays are real
+            if all the dispersive materials have real poles (Debye, Drude), and complex if any have Lorentz poles.
+            The number of poles of each material is stored, so that each material is only updated with the poles it has.
+            If it uses less memory, temporary values are only stored for the cell edges (of the electric field components)
+            that have dispersive materials, which are listed in arrays of cell indices; otherwise they are stored for the whole grid.
             
         Args:
             nummaterials (int): Number of materials present in the model.
         """
-        self.Tx = np.zeros((Material.maxpoles, self.nx, self.ny + 1, self.nz + 1), dtype=complextype)
-        self.Ty = np.zeros((Material.maxpoles, self.nx + 1, self.ny, self.nz + 1), dtype=complextype)
-        self.Tz = np.zeros((Material.maxpoles, self.nx + 1, self.ny + 1, self.nz), dtype=complextype)
-        self.updatecoeffsdispersive = np.zeros((nummaterials, 3 * Material.maxpoles), dtype=complextype)
-
+        if any(material.type == 'lorenz' for material in self.materials):
+            dispersivetype = complextype
+        else:
+            dispersivetype = floattype
+        self.updatecoeffsdispersive = np.zeros((nummaterials, 3 * Material.maxpoles), dtype=dispersivetype)
+        self.poles = np.array([material.poles for material in self.materials], dtype=np.intc)
 
+        # Cell edges with dispersive materials, within the range that is updated for each field component
+        dispersive = np.array([material.poles > 0 for material in self.materials])
+        cellsEx = np.argwhere(dispersive[self.ID[0, 0:self.nx, 1:self.ny, 1:self.nz]]) + (0, 1, 1)
+        cellsEy = np.argwhere(dispersive[self.ID[1, 1:self.nx, 0:self.ny, 1:self.nz]]) + (1, 0, 1)
+        cellsEz = np.argwhere(dispersive[self.ID[2, 1:self.nx, 1:self.ny, 0:self.nz]]) + (1, 1, 0)
+        numcells = len(cellsEx) + len(cellsEy) + len(cellsEz)
 
+        # Memory for temporary values for the whole grid, or for a list of cell edges (cell indices, temporary values and dispersive contribution to the field)
+        densememory = Material.maxpoles * sum(E.size for component, E in (('Ex', self.Ex), ('Ey', self.Ey), ('Ez', self.Ez)) if self.component_used(component)) * np.dtype(dispersivetype).itemsize
+        sparsememory = numcells * (3 * np.dtype(np.int32).itemsize + Material.maxpoles * np.dtype(dispersivetype).itemsize + np.dtype(floattype).itemsize)
 
+        if sparsememory < densememory:
+            self.dispersivecellsEx = cellsEx.astype(np.int32)
+            self.dispersivecellsEy = cellsEy.astype(np.int32)
+            self.dispersivecellsEz = cellsEz.astype(np.int32)
+            self.phiEx = self.zeros(len(cellsEx), dtype=floattype)
+            self.phiEy = self.zeros(len(cellsEy), dtype=floattype)
+            self.phiEz = self.zeros(len(cellsEz), dtype=floattype)
+            self.Tx = self.zeros((Material.maxpoles, len(cellsEx)), dtype=dispersivetype, axis=1)
+            self.Ty = self.zeros((Material.maxpoles, len(cellsEy)), dtype=dispersivetype, axis=1)
+            self.Tz = self.zeros((Material.maxpoles, len(cellsEz)), dtype=dispersivetype, axis=1)
+            self.dispersivememorysaved = densememory - sparsememory
+        else:
+            self.dispersivecellsEx = self.dispersivecellsEy = self.dispersivecellsEz = None
+            self.Tx = self.field_zeros('Ex', (Material.maxpoles, self.nx, self.ny + 1, self.nz + 1), dtype=dispersivetype, axis=1)
+            self.Ty = self.field_zeros('Ey', (Material.maxpoles, self.nx + 1, self.ny, self.nz + 1), dtype=dispersivetype, axis=1)
+            self.Tz = self.field_zeros('Ez', (Material.maxpoles, self.nx + 1, self.ny + 1, self.nz), dtype=dispersivetype, axis=1)
+            self.dispersivememorysaved = 0
@@ -72,6 +72,8 @@ def process_multicmds(multicmds, G):
             # Check polarity & position parameters
             if tmp[0].lower() not in ('x', 'y', 'z'):
                 raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be x, y, or z')
+            if not G.component_used('E' + tmp[0].lower()):
+                raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be {} in a {} model'.format(' or '.join(x for x in 'xyz' if G.component_used('E' + x)), G.mode))
             positionx = rvalue(float(tmp[1])/G.dx)
             positiony = rvalue(float(tmp[2])/G.dy)
             positionz = rvalue(float(tmp[3])/G.dz)
@@ -134,6 +136,8 @@ def process_multicmds(multicmds, G):
             # Check polarity & position parameters
             if tmp[0].lower() not in ('x', 'y', 'z'):
                 raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be x, y, or z')
+            if not G.component_used('E' + tmp[0].lower()):
+                raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be {} in a {} model'.format(' or '.join(x for x in 'xyz' if G.component_used('E' + x)), G.mode))
             positionx = rvalue(float(tmp[1])/G.dx)
             positiony = rvalue(float(tmp[2])/G.dy)
             positionz = rvalue(float(tmp[3])/G.dz)
@@ -192,6 +196,8 @@ def process_multicmds(multicmds, G):
             # Check polarity & position parameters
             if tmp[0].lower() not in ('x', 'y', 'z'):
                 raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be x, y, or z')
+            if not G.component_used('H' + tmp[0].lower()):
+                raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' polarisation must be {} in a {} model'.format(' or '.join(x for x in 'xyz' if G.component_used('H' + x)), G.mode))
             positionx = rvalue(float(tmp[1])/G.dx)
             positiony = rvalue(float(tmp[2])/G.dy)
             positionz = rvalue(float(tmp[3])/G.dz)
@@ -588,8 +594,6 @@ def process_multicmds(multicmds, G):
     # Complex frequency shifted (CFS) PML parameter
     cmdname = '#pml_cfs'
     if multicmds[cmdname] != 'None':
-        if len(multicmds[cmdname]) > 2:
-            raise CmdInputError("'" + cmdname + ': ' + ' '.join(tmp) + "'" + ' can only be used up to two times, for up to a 2nd order PML')
         for cmdinstance in multicmds[cmdname]:
             tmp = cmdinstance.split()
             if len(tmp) != 9:
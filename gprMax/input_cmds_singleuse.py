@@ -22,10 +22,14 @@ from psutil import virtual_memory
 
 from .constants import c, floattype
 from .exceptions import CmdInputError
+from .numa import pin_threads
 from .pml import PML, CFS
 from .utilities import rvalue, human_size
 from .waveforms import Waveform
 
+# CPUs available when gprMax started, before any threads were pinned (only available on Linux)
+availablecpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+
 
 def process_singlecmds(singlecmds, multicmds, G):
     """Checks the validity of command parameters and creates instances of classes of parameters.
@@ -63,12 +67,18 @@ def process_singlecmds(singlecmds, multicmds, G):
     cmd = '#num_threads'
     ompthreads = os.environ.get('OMP_NUM_THREADS')
     if singlecmds[cmd] != 'None':
-        tmp = tuple(int(x) for x in singlecmds[cmd].split())
-        if len(tmp) != 1:
-            raise CmdInputError(cmd + ' requires exactly one parameter to specify the number of OpenMP threads to use')
-        if tmp[0] < 1:
+        tmp = singlecmds[cmd].split()
+        if len(tmp) != 1 and len(tmp) != 2:
+            raise CmdInputError(cmd + ' requires one parameter to specify the number of OpenMP threads to use, and optionally one parameter to specify the thread affinity')
+        if int(tmp[0]) < 1:
             raise CmdInputError(cmd + ' requires the value to be an integer not less than one')
-        G.nthreads = tmp[0]
+        G.nthreads = int(tmp[0])
+        if len(tmp) == 2:
+            if tmp[1].lower() != 'close' and tmp[1].lower() != 'spread':
+                raise CmdInputError(cmd + ' requires the thread affinity to be either close or spread')
+            if availablecpus is None:
+                raise CmdInputError(cmd + ' can only set the thread affinity on Linux')
+            G.threadaffinity = tmp[1].lower()
     elif ompthreads:
         G.nthreads = int(ompthreads)
     else:
@@ -90,6 +100,19 @@ def process_singlecmds(singlecmds, multicmds, G):
     if G.messages:
             print('Number of threads: {}'.format(G.nthreads))
 
+    # Pin each thread to a CPU, either to consecutive CPUs (close), or spread evenly over the available CPUs, e.g. over the processor sockets (spread)
+    if G.threadaffinity:
+        if G.threadaffinity == 'close':
+            threadcpus = [availablecpus[thread % len(availablecpus)] for thread in range(G.nthreads)]
+        else:
+            threadcpus = [availablecpus[(thread * len(availablecpus)) // G.nthreads] for thread in range(G.nthreads)]
+        pinned = pin_threads(np.array(threadcpus, dtype=np.intc), G.nthreads)
+        if G.messages:
+            if pinned:
+                print('Threads pinned to CPUs: {}'.format(', '.join(str(cpu) for cpu in threadcpus)))
+            else:
+                print('Threads could not be pinned to CPUs')
+
 
     # Spatial discretisation
     cmd = '#dx_dy_dz'
@@ -125,6 +148,12 @@ def process_singlecmds(singlecmds, multicmds, G):
         mem = (((G.nx + 1) * (G.ny + 1) * (G.nz + 1) * 13 * np.dtype(floattype).itemsize + (G.nx + 1) * (G.ny + 1) * (G.nz + 1) * 18) * 1.1) + 30e6
         print('Memory (approx) required/available: {} / {}'.format(human_size(mem), human_size(virtual_memory().total)))
 
+    # Mode - a domain that is a single cell thick in one direction is a 2D (TM) model, with the electric field normal to its plane
+    if (G.nx, G.ny, G.nz).count(1) == 1:
+        G.mode = '2D TM' + 'xyz'[(G.nx, G.ny, G.nz).index(1)]
+    if G.messages:
+        print('Mode: {}'.format(G.mode))
+
 
     # Time step CFL limit - use either 2D or 3D (default)
     cmd = '#time_step_limit_type'
@@ -185,6 +214,33 @@ def process_singlecmds(singlecmds, multicmds, G):
         print('Time window: {:.3e} secs ({} iterations)'.format(G.timewindow, G.iterations))
 
 
+    # Stop the run early once the fields have decayed
+    cmd = '#stop_on_decay'
+    if singlecmds[cmd] != 'None':
+        tmp = singlecmds[cmd].split()
+        if len(tmp) != 2:
+            raise CmdInputError(cmd + ' requires exactly two parameters')
+        if not 0 < float(tmp[0]) < 1:
+            raise CmdInputError(cmd + ' requires the energy threshold to be greater than zero and less than one')
+        if int(tmp[1]) < 1:
+            raise CmdInputError(cmd + ' requires the number of iterations between checks of the energy to be positive')
+        G.stopondecay = (float(tmp[0]), int(tmp[1]))
+        if G.messages:
+            print('Run will stop once the field energy decays below {:g} of its peak, checked every {} iterations'.format(G.stopondecay[0], G.stopondecay[1]))
+
+    # Steady state of continuous sine wave sources
+    cmd = '#steady_state'
+    if singlecmds[cmd] != 'None':
+        tmp = singlecmds[cmd].split()
+        if len(tmp) != 1:
+            raise CmdInputError(cmd + ' requires exactly one parameter')
+        if not 0 < float(tmp[0]) < 1:
+            raise CmdInputError(cmd + ' requires the tolerance to be greater than zero and less than one')
+        G.steadystate = float(tmp[0])
+        if G.messages:
+            print('Run will stop once the phasors at the receivers change by less than {:g} between periods of the sources'.format(G.steadystate))
+
+
     # PML
     cmd = '#pml_cells'
     if singlecmds[cmd] != 'None':
@@ -195,8 +251,35 @@ def process_singlecmds(singlecmds, multicmds, G):
             G.pmlthickness = (int(tmp[0]), int(tmp[0]), int(tmp[0]), int(tmp[0]), int(tmp[0]), int(tmp[0]))
         else:
             G.pmlthickness = (int(tmp[0]), int(tmp[1]), int(tmp[2]), int(tmp[3]), int(tmp[4]), int(tmp[5]))
-        if 2*G.pmlthickness[0] >= G.nx or 2*G.pmlthickness[1] >= G.ny or 2*G.pmlthickness[2] >= G.nz or 2*G.pmlthickness[3] >= G.nx or 2*G.pmlthickness[4] >= G.ny or 2*G.pmlthickness[5] >= G.nz:
-            raise CmdInputError(cmd + ' has too many cells for the domain size')
+    # There is no PML in the direction normal to the plane of 2D models
+    if G.mode != '3D':
+        G.pmlthickness = tuple(0 if 'xyz'[side % 3] == G.mode[-1] else thickness for side, thickness in enumerate(G.pmlthickness))
+    if singlecmds[cmd] != 'None' and (2*G.pmlthickness[0] >= G.nx or 2*G.pmlthickness[1] >= G.ny or 2*G.pmlthickness[2] >= G.nz or 2*G.pmlthickness[3] >= G.nx or 2*G.pmlthickness[4] >= G.ny or 2*G.pmlthickness[5] >= G.nz):
+        raise CmdInputError(cmd + ' has too many cells for the domain size')
+
+
+    # Tile size for field updates
+    cmd = '#tile_size'
+    if singlecmds[cmd] != 'None':
+        tmp = singlecmds[cmd].split()
+        if len(tmp) != 2:
+            raise CmdInputError(cmd + ' requires exactly two parameters')
+        if int(tmp[0]) < 0 or int(tmp[1]) < 0:
+            raise CmdInputError(cmd + ' requires the tile size to be zero or positive')
+        if (int(tmp[0]) == 0) != (int(tmp[1]) == 0):
+            raise CmdInputError(cmd + ' requires the tile size to be zero (no tiling) in both or neither of the y and z directions')
+        G.tilesize = (min(int(tmp[0]), G.ny), min(int(tmp[1]), G.nz))
+
+
+    # Temporal blocking of iterations
+    cmd = '#temporal_blocking'
+    if singlecmds[cmd] != 'None':
+        tmp = singlecmds[cmd].split()
+        if len(tmp) != 2:
+            raise CmdInputError(cmd + ' requires exactly two parameters')
+        if int(tmp[0]) < 1 or int(tmp[1]) < 1:
+            raise CmdInputError(cmd + ' requires the number of iterations and the number of rows to be positive')
+        G.temporalblocking = (int(tmp[0]), int(tmp[1]))
 
     
     # src_steps
@@ -104,8 +104,8 @@ class Material():
                     self.q[x] = -1 / self.tau[x]
                 elif self.type == 'lorenz':
                     wp2 = (2 * np.pi * (1 / self.tau[x])) * (2 * np.pi * (1 / self.tau[x]))
-                    self.w[x] = -(wp2 * self.deltaer[x]) * j / np.sqrt(wp2 - (self.alpha[x] * self.alpha[x]))
-                    self.q[x] = -self.alpha[x] + np.sqrt(wp2 - (self.alpha[x] * self.alpha[x])) * j
+                    self.w[x] = -(wp2 * self.deltaer[x]) * 1j / np.sqrt(wp2 - (self.alpha[x] * self.alpha[x]))
+                    self.q[x] = -self.alpha[x] + np.sqrt(wp2 - (self.alpha[x] * self.alpha[x])) * 1j
                 elif self.type == 'drude':
                     wp2 = (2 * np.pi * (1 / self.tau[x])) * (2 * np.pi * (1 / self.tau[x]))
                     self.se += wp2 / self.alpha[x]
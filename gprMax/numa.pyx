@@ -0,0 +1,98 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from libc.string cimport memset
+
+
+# Pinning of the calling thread to a CPU, which is only available on Linux
+cdef extern from *:
+    """
+    #ifdef __linux__
+    #include <sched.h>
+    static int pin_thread(int cpu) {
+        cpu_set_t cpus;
+        CPU_ZERO(&cpus);
+        CPU_SET(cpu, &cpus);
+        return sched_setaffinity(0, sizeof(cpus), &cpus);
+    }
+    #else
+    static int pin_thread(int cpu) {
+        return -1;
+    }
+    #endif
+    """
+    int pin_thread(int cpu) nogil
+
+
+cpdef first_touch_zeros(shape, dtype, int axis, int nthreads):
+    """This function allocates an array of zeros, with each row of cells across an axis and the axis after it written first by the OpenMP thread that updates it.
+        Operating systems usually place a page of memory on the NUMA node (processor socket) of the thread that first writes to it,
+        so the field updates then mostly read memory attached to their own processor.
+
+    Args:
+        shape (int or tuple): Shape of the array.
+        dtype (type): Data type of the array.
+        axis (int): First of the axes that the field updates are parallelised over, which divide the rows of cells across it and the axis after it (if there is one) between the threads in contiguous blocks.
+        nthreads (int): Number of threads to use
+
+    Returns:
+        array (array): Array of zeros.
+    """
+
+    cdef Py_ssize_t r, o, nouter, nrows, nbytes
+    cdef np.uint8_t[:, :, ::1] arraybytes
+
+    array = np.empty(shape, dtype=dtype)
+    nouter = int(np.prod(array.shape[:axis]))
+    nrows = int(np.prod(array.shape[axis:axis + 2]))
+    if array.size == 0:
+        return array
+
+    # Bytes of the array arranged as [rows before the axis, row across the axis and the axis after it, bytes of the row]
+    arraybytes = array.reshape(nouter, nrows, -1).view(np.uint8)
+    nbytes = arraybytes.shape[2]
+
+    for r in prange(0, nrows, nogil=True, schedule='static', num_threads=nthreads):
+        for o in range(0, nouter):
+            memset(&arraybytes[o, r, 0], 0, nbytes)
+
+    return array
+
+
+cpdef bint pin_threads(int[:] cpus, int nthreads):
+    """This function pins each OpenMP thread to a CPU. The threads are kept for later parallel regions with the same number of threads, so they stay pinned for the field updates. Only available on Linux.
+
+    Args:
+        cpus (memoryview): CPU for each thread.
+        nthreads (int): Number of threads to use
+
+    Returns:
+        (bint): All the threads were pinned.
+    """
+
+    cdef int thread
+    cdef int failed = 0
+
+    for thread in prange(0, nthreads, nogil=True, schedule='static', chunksize=1, num_threads=nthreads):
+        if pin_thread(cpus[thread]) != 0:
+            failed += 1
+
+    return failed == 0
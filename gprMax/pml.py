@@ -19,6 +19,7 @@
 import numpy as np
 
 from .constants import e0, z0, floattype
+from .exceptions import CmdInputError
 
 
 class CFS():
@@ -142,25 +143,27 @@ class PML():
         
         # Subscript notation, e.g. 'EPhiyxz' means the electric field Phi vector, of which the
         # component being corrected is y, the stretching direction is x, and field derivative
-        # is z direction.
+        # is z direction. The corrections are only applied to the cells of the slab, so the
+        # Phi vectors have the same shape as the slab (for each order of the CFS).
+        shape = (len(self.CFS), self.nx, self.ny, self.nz)
         if self.direction == 'xminus' or self.direction == 'xplus':
             self.thickness = self.nx
-            self.EPhiyxz = np.zeros((len(self.CFS), self.nx + 1, self.ny, self.nz + 1), dtype=floattype)
-            self.EPhizxy = np.zeros((len(self.CFS), self.nx + 1, self.ny + 1, self.nz), dtype=floattype)
-            self.HPhiyxz = np.zeros((len(self.CFS), self.nx, self.ny + 1, self.nz), dtype=floattype)
-            self.HPhizxy = np.zeros((len(self.CFS), self.nx, self.ny, self.nz + 1), dtype=floattype)
+            self.EPhiyxz = np.zeros(shape, dtype=floattype)
+            self.EPhizxy = np.zeros(shape, dtype=floattype)
+            self.HPhiyxz = np.zeros(shape, dtype=floattype)
+            self.HPhizxy = np.zeros(shape, dtype=floattype)
         elif self.direction == 'yminus' or self.direction == 'yplus':
             self.thickness = self.ny
-            self.EPhixyz = np.zeros((len(self.CFS), self.nx, self.ny + 1, self.nz + 1), dtype=floattype)
-            self.EPhizyx = np.zeros((len(self.CFS), self.nx + 1, self.ny + 1, self.nz), dtype=floattype)
-            self.HPhixyz = np.zeros((len(self.CFS), self.nx + 1, self.ny, self.nz), dtype=floattype)
-            self.HPhizyx = np.zeros((len(self.CFS), self.nx, self.ny, self.nz + 1), dtype=floattype)
+            self.EPhixyz = np.zeros(shape, dtype=floattype)
+            self.EPhizyx = np.zeros(shape, dtype=floattype)
+            self.HPhixyz = np.zeros(shape, dtype=floattype)
+            self.HPhizyx = np.zeros(shape, dtype=floattype)
         elif self.direction == 'zminus' or self.direction == 'zplus':
             self.thickness = self.nz
-            self.EPhixzy = np.zeros((len(self.CFS), self.nx, self.ny + 1, self.nz + 1), dtype=floattype)
-            self.EPhiyzx = np.zeros((len(self.CFS), self.nx + 1, self.ny, self.nz + 1), dtype=floattype)
-            self.HPhixzy = np.zeros((len(self.CFS), self.nx + 1, self.ny, self.nz), dtype=floattype)
-            self.HPhiyzx = np.zeros((len(self.CFS), self.nx, self.ny + 1, self.nz), dtype=floattype)
+            self.EPhixzy = np.zeros(shape, dtype=floattype)
+            self.EPhiyzx = np.zeros(shape, dtype=floattype)
+            self.HPhixzy = np.zeros(shape, dtype=floattype)
+            self.HPhiyzx = np.zeros(shape, dtype=floattype)
 
         self.ERA = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
         self.ERB = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
@@ -170,6 +173,10 @@ class PML():
         self.HRB = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
         self.HRE = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
         self.HRF = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
+        self.ERC = np.zeros(self.thickness + 1, dtype=np.float64)
+        self.ERD = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
+        self.HRC = np.zeros(self.thickness + 1, dtype=np.float64)
+        self.HRD = np.zeros((len(self.CFS), self.thickness + 1), dtype=floattype)
                 
     def calculate_update_coeffs(self, er, mr, G):
         """Calculates electric and magnetic update coefficients for the PML.
@@ -180,52 +187,74 @@ class PML():
             G (class): Grid class instance - holds essential parameters describing the model.
         """
         
-        for x, cfs in enumerate(self.CFS):
-            Ealpha = np.zeros(self.thickness + 1, dtype=floattype)
-            Halpha = np.zeros(self.thickness + 1, dtype=floattype)
-            Ekappa = np.zeros(self.thickness + 1, dtype=floattype)
-            Hkappa = np.zeros(self.thickness + 1, dtype=floattype)
-            Esigma = np.zeros(self.thickness + 1, dtype=floattype)
-            Hsigma = np.zeros(self.thickness + 1, dtype=floattype)
-            if not cfs.sigmamax:
-                cfs.calculate_sigmamax(self.direction, er, mr, G)
-            Ealpha, Halpha = cfs.calculate_values(cfs.alphamin, cfs.alphamax, cfs.alphascaling, Ealpha, Halpha)
-            Ekappa, Hkappa = cfs.calculate_values(cfs.kappamin, cfs.kappamax, cfs.kappascaling, Ekappa, Hkappa)
-            Esigma, Hsigma = cfs.calculate_values(cfs.sigmamin, cfs.sigmamax, cfs.sigmascaling, Esigma, Hsigma)
+        # Parameters that give a kappa of zero anywhere in the PML divide by zero, e.g. polynomial scaling of kappa, which starts
+        # from zero at the inner edge of the PML (the minimum value is not used), or inverse linear scaling, which divides by it
+        try:
+            with np.errstate(divide='raise', invalid='raise'):
+                for x, cfs in enumerate(self.CFS):
+                    Ealpha = np.zeros(self.thickness + 1, dtype=floattype)
+                    Halpha = np.zeros(self.thickness + 1, dtype=floattype)
+                    Ekappa = np.zeros(self.thickness + 1, dtype=floattype)
+                    Hkappa = np.zeros(self.thickness + 1, dtype=floattype)
+                    Esigma = np.zeros(self.thickness + 1, dtype=floattype)
+                    Hsigma = np.zeros(self.thickness + 1, dtype=floattype)
+                    if not cfs.sigmamax:
+                        cfs.calculate_sigmamax(self.direction, er, mr, G)
+                    Ealpha, Halpha = cfs.calculate_values(cfs.alphamin, cfs.alphamax, cfs.alphascaling, Ealpha, Halpha)
+                    Ekappa, Hkappa = cfs.calculate_values(cfs.kappamin, cfs.kappamax, cfs.kappascaling, Ekappa, Hkappa)
+                    Esigma, Hsigma = cfs.calculate_values(cfs.sigmamin, cfs.sigmamax, cfs.sigmascaling, Esigma, Hsigma)
             
-#            print('Ealpha {}'.format(Ealpha))
-#            print('Halpha {}'.format(Halpha))
-#            print('Ekappa {}'.format(Ekappa))
-#            print('Hkappa {}'.format(Hkappa))
-#            print('Esigma {}'.format(Esigma))
-#            print('Hsigma {}'.format(Hsigma))
-
-            # Electric PML update coefficients
-            tmp = (2*e0*Ekappa) + G.dt * (Ealpha * Ekappa + Esigma)
-            self.ERA[x, :] = (2*e0 + G.dt*Ealpha) / tmp
-            self.ERB[x, :] = (2*e0*Ekappa) / tmp
-            self.ERE[x, :] = ((2*e0*Ekappa) - G.dt * (Ealpha * Ekappa + Esigma)) / tmp
-            self.ERF[x, :] = (2*Esigma*G.dt) / (Ekappa * tmp)
+#                    print('Ealpha {}'.format(Ealpha))
+#                    print('Halpha {}'.format(Halpha))
+#                    print('Ekappa {}'.format(Ekappa))
+#                    print('Hkappa {}'.format(Hkappa))
+#                    print('Esigma {}'.format(Esigma))
+#                    print('Hsigma {}'.format(Hsigma))
+
+                    # Electric PML update coefficients
+                    tmp = (2*e0*Ekappa) + G.dt * (Ealpha * Ekappa + Esigma)
+                    self.ERA[x, :] = (2*e0 + G.dt*Ealpha) / tmp
+                    self.ERB[x, :] = (2*e0*Ekappa) / tmp
+                    self.ERE[x, :] = ((2*e0*Ekappa) - G.dt * (Ealpha * Ekappa + Esigma)) / tmp
+                    self.ERF[x, :] = (2*Esigma*G.dt) / (Ekappa * tmp)
             
-            # Magnetic PML update coefficients
-            tmp = (2*e0*Hkappa) + G.dt * (Halpha * Hkappa + Hsigma)
-            self.HRA[x, :] = (2*e0 + G.dt*Halpha) / tmp
-            self.HRB[x, :] = (2*e0*Hkappa) / tmp
-            self.HRE[x, :] = ((2*e0*Hkappa) - G.dt * (Halpha * Hkappa + Hsigma)) / tmp
-            self.HRF[x, :] = (2*Hsigma*G.dt) / (Hkappa * tmp)
-
-#            print('ERA {}'.format(self.ERA))
-#            print('ERB {}'.format(self.ERB))
-#            print('ERE {}'.format(self.ERE))
-#            print('ERF {}'.format(self.ERF))
-#            print('HRA {}'.format(self.HRA))
-#            print('HRB {}'.format(self.HRB))
-#            print('HRE {}'.format(self.HRE))
-#            print('HRF {}'.format(self.HRF))
+                    # Magnetic PML update coefficients
+                    tmp = (2*e0*Hkappa) + G.dt * (Halpha * Hkappa + Hsigma)
+                    self.HRA[x, :] = (2*e0 + G.dt*Halpha) / tmp
+                    self.HRB[x, :] = (2*e0*Hkappa) / tmp
+                    self.HRE[x, :] = ((2*e0*Hkappa) - G.dt * (Halpha * Hkappa + Hsigma)) / tmp
+                    self.HRF[x, :] = (2*Hsigma*G.dt) / (Hkappa * tmp)
+
+#                    print('ERA {}'.format(self.ERA))
+#                    print('ERB {}'.format(self.ERB))
+#                    print('ERE {}'.format(self.ERE))
+#                    print('ERF {}'.format(self.ERF))
+#                    print('HRA {}'.format(self.HRA))
+#                    print('HRB {}'.format(self.HRB))
+#                    print('HRE {}'.format(self.HRE))
+#                    print('HRF {}'.format(self.HRF))
+        except FloatingPointError:
+            raise CmdInputError("'#pml_cfs: {} {:g} {:g} {} {:g} {:g} {} {:g} {:g}' gives PML update coefficients that divide by zero, e.g. from a kappa of zero with polynomial scaling of kappa, or from inverse linear scaling".format(cfs.alphascaling, cfs.alphamin, cfs.alphamax, cfs.kappascaling, cfs.kappamin, cfs.kappamax, cfs.sigmascaling, cfs.sigmamin, cfs.sigmamax))
+
+        # Coefficients of the correction to the field for any number of CFS terms: RC multiplies the field derivative, i.e. the
+        # product of RA over the orders minus one, and RD multiplies each Phi, i.e. its RB times the RA of the higher orders.
+        # The correction is summed in double precision, so RC is subtracted and stored in double precision.
+        self.ERC[:] = np.prod(self.ERA, axis=0).astype(np.float64) - 1
+        self.HRC[:] = np.prod(self.HRA, axis=0).astype(np.float64) - 1
+        for x in range(len(self.CFS)):
+            self.ERD[x, :] = np.prod(self.ERA[x + 1:, :], axis=0) * self.ERB[x, :]
+            self.HRD[x, :] = np.prod(self.HRA[x + 1:, :], axis=0) * self.HRB[x, :]
 
 
 def build_pml(G):
-    """This function builds instances of the PML."""
+    """This function builds instances of the PML.
+
+    Args:
+        G (class): Grid class instance - holds essential parameters describing the model.
+
+    Returns:
+        memorysaved (int): Memory saved in bytes by storing the Phi vectors only for the cells of the slabs.
+    """
     
     if G.messages:
         print('')
@@ -260,75 +289,63 @@ def build_pml(G):
         if G.messages and G.pmlthickness.count(G.pmlthickness[0]) != len(G.pmlthickness):
             print('PML {} slab with {} cells created.'.format(pml.direction, pml.thickness))
         G.pmls.append(pml)
+
+    # Phi vectors of field components that are not used by 2D models are always zero
+    if G.mode != '3D':
+        for pml in G.pmls:
+            for name, Phi in list(vars(pml).items()):
+                if 'Phi' in name and not G.component_used(name[0] + name[4]):
+                    setattr(pml, name, G.shared_zeros(Phi.shape, floattype))
+
+    # Phi vectors were previously stored with an extra plane of cells in the directions that the field component
+    # is staggered in, i.e. the directions other than the component for the electric field, and the direction
+    # of the component for the magnetic field, which were never updated
+    memorysaved = 0
+    for pml in G.pmls:
+        for name, Phi in vars(pml).items():
+            if 'Phi' in name and G.component_used(name[0] + name[4]):
+                padded = [n + 1 if (direction != name[4]) == (name[0] == 'E') else n for direction, n in zip('xyz', Phi.shape[1:])]
+                memorysaved += (len(pml.CFS) * int(np.prod(padded)) - Phi.size) * Phi.itemsize
+
     if G.messages and G.pmlthickness.count(G.pmlthickness[0]) == len(G.pmlthickness):
         if G.pmlthickness[0] == 0:
             print('PML is switched off')
         else:
             print('PML: {} cells'.format(pml.thickness))
 
+    return memorysaved
+
 
 def calculate_initial_pml_params(G):
     """ This function calculates the initial parameters and coefficients for PML including setting scaling
         (based on underlying material er and mr from solid array).
         """
     
+    # Relative permittivity and permeability of each material, indexed by its numeric ID
+    numIDs = np.array([material.numID for material in G.materials])
+    er = np.zeros(numIDs.max() + 1)
+    mr = np.zeros(numIDs.max() + 1)
+    er[numIDs] = [material.er for material in G.materials]
+    mr[numIDs] = [material.mr for material in G.materials]
+
     for pml in G.pmls:
-        sumer = 0
-        summr = 0
+        # Plane of cells of the solid array on the inner face of the PML
         if pml.direction == 'xminus':
-            for j in range(G.ny):
-                for k in range(G.nz):
-                    numID = G.solid[0, j, k]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.ny * G.nz)
-            averagemr = summr / (G.ny * G.nz)
+            solid = G.solid[0, :G.ny, :G.nz]
         elif pml.direction == 'xplus':
-            for j in range(G.ny):
-                for k in range(G.nz):
-                    numID = G.solid[G.nx - pml.thickness, j, k]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.ny * G.nz)
-            averagemr = summr / (G.ny * G.nz)
+            solid = G.solid[G.nx - pml.thickness, :G.ny, :G.nz]
         elif pml.direction == 'yminus':
-            for i in range(G.nx):
-                for k in range(G.nz):
-                    numID = G.solid[i, 0, k]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.nx * G.nz)
-            averagemr = summr / (G.nx * G.nz)
+            solid = G.solid[:G.nx, 0, :G.nz]
         elif pml.direction == 'yplus':
-            for i in range(G.nx):
-                for k in range(G.nz):
-                    numID = G.solid[i, G.ny - pml.thickness, k]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.nx * G.nz)
-            averagemr = summr / (G.nx * G.nz)
+            solid = G.solid[:G.nx, G.ny - pml.thickness, :G.nz]
         elif pml.direction == 'zminus':
-            for i in range(G.nx):
-                for j in range(G.ny):
-                    numID = G.solid[i, j, 0]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.nx * G.ny)
-            averagemr = summr / (G.nx * G.ny)
+            solid = G.solid[:G.nx, :G.ny, 0]
         elif pml.direction == 'zplus':
-            for i in range(G.nx):
-                for j in range(G.ny):
-                    numID = G.solid[i, j, G.nz - pml.thickness]
-                    material = next(x for x in G.materials if x.numID == numID)
-                    sumer += material.er
-                    summr += material.mr
-            averageer = sumer / (G.nx * G.ny)
-            averagemr = summr / (G.nx * G.ny)
+            solid = G.solid[:G.nx, :G.ny, G.nz - pml.thickness]
+        # Number of cells of each material in the plane
+        ncells = np.bincount(solid.ravel(), minlength=len(er))
+        averageer = np.dot(ncells, er) / solid.size
+        averagemr = np.dot(ncells, mr) / solid.size
         pml.calculate_update_coeffs(averageer, averagemr, G)
 
 
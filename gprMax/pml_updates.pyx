@@ -0,0 +1,2418 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+from .constants cimport floattype_t, complextype_t, idtype_t
+
+
+# Minimum number of cells of a PML slab for each thread that updates it
+cdef int pmlcellsperthread = 4096
+
+
+cpdef int pml_threads(int nthreads, int xs, int xf, int ys, int yf, int zs, int zf):
+    """This function gives the number of threads to use to update a PML slab, or part of a slab, so that each thread has at least
+        pmlcellsperthread cells to update. Thin slabs, and the planes of slabs updated by the temporal blocking loop, are then not
+        divided between more threads than is worthwhile.
+
+    Args:
+        nthreads (int): Maximum number of threads to use
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+
+    Returns:
+        (int): Number of threads to use
+    """
+
+    return max(1, min(nthreads, (xf - xs) * (yf - ys) * (zf - zs) // pmlcellsperthread))
+
+
+#############################################
+# Electric field PML updates - Ex component #
+#############################################
+cpdef update_pml_ex_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ex field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[j] * dHz + RD[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[j] * dHz + RD[0, j] * EPhi[0, i, j, k] + RD[1, j] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, j] * EPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dHz + RB[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                correction = RC[j] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi[n, i, j, k]
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_ex_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ex field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + updatecoeffsE[listIndex, 4] * (RC[j] * dHz + RD[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + updatecoeffsE[listIndex, 4] * (RC[j] * dHz + RD[0, j] * EPhi[0, i, j, k] + RD[1, j] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, j] * EPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dHz + RB[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                correction = RC[j] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi[n, i, j, k]
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + updatecoeffsE[listIndex, 4] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_ex_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ex field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[k] * dHy + RD[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[k] * dHy + RD[0, k] * EPhi[0, i, j, k] + RD[1, k] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, k] * EPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dHy + RB[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                correction = RC[k] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi[n, i, j, k]
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_ex_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ex field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - updatecoeffsE[listIndex, 4] * (RC[k] * dHy + RD[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - updatecoeffsE[listIndex, 4] * (RC[k] * dHy + RD[0, k] * EPhi[0, i, j, k] + RD[1, k] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, k] * EPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dHy + RB[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                correction = RC[k] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi[n, i, j, k]
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - updatecoeffsE[listIndex, 4] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+#############################################
+# Electric field PML updates - Ey component #
+#############################################
+cpdef update_pml_ey_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ey field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[i] * dHz + RD[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[i] * dHz + RD[0, i] * EPhi[0, i, j, k] + RD[1, i] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, i] * EPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dHz + RB[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi[n, i, j, k]
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_ey_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ey field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[i] * dHz + RD[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[i] * dHz + RD[0, i] * EPhi[0, i, j, k] + RD[1, i] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, i] * EPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dHz + RB[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                correction = RC[i] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi[n, i, j, k]
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_ey_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ey field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[k] * dHx + RD[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[k] * dHx + RD[0, k] * EPhi[0, i, j, k] + RD[1, k] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, k] * EPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dHx + RB[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                correction = RC[k] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi[n, i, j, k]
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_ey_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ey field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + updatecoeffsE[listIndex, 4] * (RC[k] * dHx + RD[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + updatecoeffsE[listIndex, 4] * (RC[k] * dHx + RD[0, k] * EPhi[0, i, j, k] + RD[1, k] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, k] * EPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dHx + RB[0, k] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, k] * EPhi[0, i, j, k] - RF[0, k] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                correction = RC[k] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi[n, i, j, k]
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + updatecoeffsE[listIndex, 4] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+#############################################
+# Electric field PML updates - Ez component #
+#############################################
+cpdef update_pml_ez_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ey field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[i] * dHy + RD[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[i] * dHy + RD[0, i] * EPhi[0, i, j, k] + RD[1, i] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, i] * EPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dHy + RB[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi[n, i, j, k]
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_ez_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ez field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[i] * dHy + RD[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * (RC[i] * dHy + RD[0, i] * EPhi[0, i, j, k] + RD[1, i] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, i] * EPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dHy + RB[0, i] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, i] * EPhi[0, i, j, k] - RF[0, i] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                correction = RC[i] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi[n, i, j, k]
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + updatecoeffsE[listIndex, 4] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_ez_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ez field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[j] * dHx + RD[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * (RC[j] * dHx + RD[0, j] * EPhi[0, i, j, k] + RD[1, j] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, j] * EPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dHx + RB[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                correction = RC[j] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi[n, i, j, k]
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - updatecoeffsE[listIndex, 4] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_ez_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :, :] EPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ez field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dHx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - updatecoeffsE[listIndex, 4] * (RC[j] * dHx + RD[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - updatecoeffsE[listIndex, 4] * (RC[j] * dHx + RD[0, j] * EPhi[0, i, j, k] + RD[1, j] * EPhi[1, i, j, k])
+                EPhi[1, i, j, k] = RE[1, j] * EPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dHx + RB[0, j] * EPhi[0, i, j, k])
+                EPhi[0, i, j, k] = RE[0, j] * EPhi[0, i, j, k] - RF[0, j] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                correction = RC[j] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi[n, i, j, k]
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - updatecoeffsE[listIndex, 4] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi[n, i, j, k]
+                    EPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+#############################################
+# Magnetic field PML updates - Hx component #
+#############################################
+cpdef update_pml_hx_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hx field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[j] * dEz + RD[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[j] * dEz + RD[0, j] * HPhi[0, i, j, k] + RD[1, j] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, j] * HPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dEz + RB[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                correction = RC[j] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi[n, i, j, k]
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_hx_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hx field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - updatecoeffsH[listIndex, 4] * (RC[j] * dEz + RD[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - updatecoeffsH[listIndex, 4] * (RC[j] * dEz + RD[0, j] * HPhi[0, i, j, k] + RD[1, j] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, j] * HPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dEz + RB[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                correction = RC[j] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi[n, i, j, k]
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - updatecoeffsH[listIndex, 4] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_hx_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hx field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[k] * dEy + RD[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[k] * dEy + RD[0, k] * HPhi[0, i, j, k] + RD[1, k] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, k] * HPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dEy + RB[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                correction = RC[k] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi[n, i, j, k]
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_hx_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hx field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + updatecoeffsH[listIndex, 4] * (RC[k] * dEy + RD[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + updatecoeffsH[listIndex, 4] * (RC[k] * dEy + RD[0, k] * HPhi[0, i, j, k] + RD[1, k] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, k] * HPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dEy + RB[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                correction = RC[k] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi[n, i, j, k]
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + updatecoeffsH[listIndex, 4] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+#############################################
+# Magnetic field PML updates - Hy component #
+#############################################
+cpdef update_pml_hy_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hy field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[i] * dEz + RD[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[i] * dEz + RD[0, i] * HPhi[0, i, j, k] + RD[1, i] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, i] * HPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dEz + RB[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi[n, i, j, k]
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_hy_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hy field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEz, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[i] * dEz + RD[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEz
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[i] * dEz + RD[0, i] * HPhi[0, i, j, k] + RD[1, i] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, i] * HPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dEz + RB[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEz
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                correction = RC[i] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi[n, i, j, k]
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + updatecoeffsH[listIndex, 4] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_hy_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hy field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[k] * dEx + RD[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[k] * dEx + RD[0, k] * HPhi[0, i, j, k] + RD[1, k] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, k] * HPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dEx + RB[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                correction = RC[k] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi[n, i, j, k]
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_hy_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hy field components in the z stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - updatecoeffsH[listIndex, 4] * (RC[k] * dEx + RD[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - updatecoeffsH[listIndex, 4] * (RC[k] * dEx + RD[0, k] * HPhi[0, i, j, k] + RD[1, k] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, k] * HPhi[1, i, j, k] - RF[1, k] * (RA[0, k] * dEx + RB[0, k] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, k] * HPhi[0, i, j, k] - RF[0, k] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                correction = RC[k] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi[n, i, j, k]
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - updatecoeffsH[listIndex, 4] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+#############################################
+# Magnetic field PML updates - Hz component #
+#############################################
+cpdef update_pml_hz_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hz field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[i] * dEy + RD[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[i] * dEy + RD[0, i] * HPhi[0, i, j, k] + RD[1, i] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, i] * HPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dEy + RB[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi[n, i, j, k]
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - updatecoeffsH[listIndex, 4] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_hz_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hz field components in the x stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEy, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[i] * dEy + RD[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - updatecoeffsH[listIndex, 4] * (RC[i] * dEy + RD[0, i] * HPhi[0, i, j, k] + RD[1, i] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, i] * HPhi[1, i, j, k] - RF[1, i] * (RA[0, i] * dEy + RB[0, i] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, i] * HPhi[0, i, j, k] - RF[0, i] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                correction = RC[i] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi[n, i, j, k]
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - updatecoeffsH[listIndex, 4] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_hz_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hz field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[j] * dEx + RD[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * (RC[j] * dEx + RD[0, j] * HPhi[0, i, j, k] + RD[1, j] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, j] * HPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dEx + RB[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                correction = RC[j] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi[n, i, j, k]
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + updatecoeffsH[listIndex, 4] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_hz_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :, :] HPhi, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hz field components in the y stretching direction, for a PML of any order.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex, order
+    cdef float dEx, phi, x
+    cdef double correction
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi.shape[0]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + updatecoeffsH[listIndex, 4] * (RC[j] * dEx + RD[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + updatecoeffsH[listIndex, 4] * (RC[j] * dEx + RD[0, j] * HPhi[0, i, j, k] + RD[1, j] * HPhi[1, i, j, k])
+                HPhi[1, i, j, k] = RE[1, j] * HPhi[1, i, j, k] - RF[1, j] * (RA[0, j] * dEx + RB[0, j] * HPhi[0, i, j, k])
+                HPhi[0, i, j, k] = RE[0, j] * HPhi[0, i, j, k] - RF[0, j] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                correction = RC[j] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi[n, i, j, k]
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + updatecoeffsH[listIndex, 4] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi[n, i, j, k]
+                    HPhi[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+###########################################################
+# Electric field PML updates - both tangential components #
+###########################################################
+cpdef update_pml_electric_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ey and Ez field components in the x stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHz, dHy, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[i] * dHz + RD[0, i] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, i] * EPhi1[0, i, j, k] - RF[0, i] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[i] * dHy + RD[0, i] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, i] * EPhi2[0, i, j, k] - RF[0, i] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[i] * dHz + RD[0, i] * EPhi1[0, i, j, k] + RD[1, i] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, i] * EPhi1[1, i, j, k] - RF[1, i] * (RA[0, i] * dHz + RB[0, i] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, i] * EPhi1[0, i, j, k] - RF[0, i] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[i] * dHy + RD[0, i] * EPhi2[0, i, j, k] + RD[1, i] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, i] * EPhi2[1, i, j, k] - RF[1, i] * (RA[0, i] * dHy + RB[0, i] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, i] * EPhi2[0, i, j, k] - RF[0, i] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i - 1 + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi1[n, i, j, k]
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] - coeffs[listIndex1] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i - 1 + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi2[n, i, j, k]
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] + coeffs[listIndex2] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_electric_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Ey and Ez field components in the x stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHz, dHy, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - coeffs[listIndex1] * (RC[i] * dHz + RD[0, i] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, i] * EPhi1[0, i, j, k] - RF[0, i] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + coeffs[listIndex2] * (RC[i] * dHy + RD[0, i] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, i] * EPhi2[0, i, j, k] - RF[0, i] * dHy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - coeffs[listIndex1] * (RC[i] * dHz + RD[0, i] * EPhi1[0, i, j, k] + RD[1, i] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, i] * EPhi1[1, i, j, k] - RF[1, i] * (RA[0, i] * dHz + RB[0, i] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, i] * EPhi1[0, i, j, k] - RF[0, i] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + coeffs[listIndex2] * (RC[i] * dHy + RD[0, i] * EPhi2[0, i, j, k] + RD[1, i] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, i] * EPhi2[1, i, j, k] - RF[1, i] * (RA[0, i] * dHy + RB[0, i] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, i] * EPhi2[0, i, j, k] - RF[0, i] * dHy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[1, xf - i, j + ys, k + zs]
+                dHz = (Hz[xf - i, j + ys, k + zs] - Hz[xf - i - 1, j + ys, k + zs]) / dx
+                correction = RC[i] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi1[n, i, j, k]
+                Ey[xf - i, j + ys, k + zs] = Ey[xf - i, j + ys, k + zs] - coeffs[listIndex1] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[2, xf - i, j + ys, k + zs]
+                dHy = (Hy[xf - i, j + ys, k + zs] - Hy[xf - i - 1, j + ys, k + zs]) / dx
+                correction = RC[i] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * EPhi2[n, i, j, k]
+                Ez[xf - i, j + ys, k + zs] = Ez[xf - i, j + ys, k + zs] + coeffs[listIndex2] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_electric_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ex and Ez field components in the y stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHz, dHx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[j] * dHz + RD[0, j] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, j] * EPhi1[0, i, j, k] - RF[0, j] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[j] * dHx + RD[0, j] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, j] * EPhi2[0, i, j, k] - RF[0, j] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[j] * dHz + RD[0, j] * EPhi1[0, i, j, k] + RD[1, j] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, j] * EPhi1[1, i, j, k] - RF[1, j] * (RA[0, j] * dHz + RB[0, j] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, j] * EPhi1[0, i, j, k] - RF[0, j] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[j] * dHx + RD[0, j] * EPhi2[0, i, j, k] + RD[1, j] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, j] * EPhi2[1, i, j, k] - RF[1, j] * (RA[0, j] * dHx + RB[0, j] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, j] * EPhi2[0, i, j, k] - RF[0, j] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHz = (Hz[i + xs, j + ys, k + zs] - Hz[i + xs, j - 1 + ys, k + zs]) / dy
+                correction = RC[j] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi1[n, i, j, k]
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] + coeffs[listIndex1] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j - 1 + ys, k + zs]) / dy
+                correction = RC[j] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi2[n, i, j, k]
+                Ez[i + xs, j + ys, k + zs] = Ez[i + xs, j + ys, k + zs] - coeffs[listIndex2] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_electric_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Ex and Ez field components in the y stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHz, dHx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + coeffs[listIndex1] * (RC[j] * dHz + RD[0, j] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, j] * EPhi1[0, i, j, k] - RF[0, j] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - coeffs[listIndex2] * (RC[j] * dHx + RD[0, j] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, j] * EPhi2[0, i, j, k] - RF[0, j] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + coeffs[listIndex1] * (RC[j] * dHz + RD[0, j] * EPhi1[0, i, j, k] + RD[1, j] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, j] * EPhi1[1, i, j, k] - RF[1, j] * (RA[0, j] * dHz + RB[0, j] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, j] * EPhi1[0, i, j, k] - RF[0, j] * dHz
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - coeffs[listIndex2] * (RC[j] * dHx + RD[0, j] * EPhi2[0, i, j, k] + RD[1, j] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, j] * EPhi2[1, i, j, k] - RF[1, j] * (RA[0, j] * dHx + RB[0, j] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, j] * EPhi2[0, i, j, k] - RF[0, j] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, yf - j, k + zs]
+                dHz = (Hz[i + xs, yf - j, k + zs] - Hz[i + xs, yf - j - 1, k + zs]) / dy
+                correction = RC[j] * dHz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi1[n, i, j, k]
+                Ex[i + xs, yf - j, k + zs] = Ex[i + xs, yf - j, k + zs] + coeffs[listIndex1] * correction
+                x = dHz
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[2, i + xs, yf - j, k + zs]
+                dHx = (Hx[i + xs, yf - j, k + zs] - Hx[i + xs, yf - j - 1, k + zs]) / dy
+                correction = RC[j] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * EPhi2[n, i, j, k]
+                Ez[i + xs, yf - j, k + zs] = Ez[i + xs, yf - j, k + zs] - coeffs[listIndex2] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_electric_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ex and Ey field components in the z stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHy, dHx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[k] * dHy + RD[0, k] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, k] * EPhi1[0, i, j, k] - RF[0, k] * dHy
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[k] * dHx + RD[0, k] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, k] * EPhi2[0, i, j, k] - RF[0, k] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[k] * dHy + RD[0, k] * EPhi1[0, i, j, k] + RD[1, k] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, k] * EPhi1[1, i, j, k] - RF[1, k] * (RA[0, k] * dHy + RB[0, k] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, k] * EPhi1[0, i, j, k] - RF[0, k] * dHy
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[k] * dHx + RD[0, k] * EPhi2[0, i, j, k] + RD[1, k] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, k] * EPhi2[1, i, j, k] - RF[1, k] * (RA[0, k] * dHx + RB[0, k] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, k] * EPhi2[0, i, j, k] - RF[0, k] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, k + zs]
+                dHy = (Hy[i + xs, j + ys, k + zs] - Hy[i + xs, j + ys, k - 1 + zs]) / dz
+                correction = RC[k] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi1[n, i, j, k]
+                Ex[i + xs, j + ys, k + zs] = Ex[i + xs, j + ys, k + zs] - coeffs[listIndex1] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, k + zs]
+                dHx = (Hx[i + xs, j + ys, k + zs] - Hx[i + xs, j + ys, k - 1 + zs]) / dz
+                correction = RC[k] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi2[n, i, j, k]
+                Ey[i + xs, j + ys, k + zs] = Ey[i + xs, j + ys, k + zs] + coeffs[listIndex2] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_electric_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsE, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :, :] EPhi1, floattype_t[:, :, :, :] EPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Ex and Ey field components in the z stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dHy, dHx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = EPhi1.shape[0]
+    coeffs = updatecoeffsE[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - coeffs[listIndex1] * (RC[k] * dHy + RD[0, k] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, k] * EPhi1[0, i, j, k] - RF[0, k] * dHy
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + coeffs[listIndex2] * (RC[k] * dHx + RD[0, k] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, k] * EPhi2[0, i, j, k] - RF[0, k] * dHx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - coeffs[listIndex1] * (RC[k] * dHy + RD[0, k] * EPhi1[0, i, j, k] + RD[1, k] * EPhi1[1, i, j, k])
+                EPhi1[1, i, j, k] = RE[1, k] * EPhi1[1, i, j, k] - RF[1, k] * (RA[0, k] * dHy + RB[0, k] * EPhi1[0, i, j, k])
+                EPhi1[0, i, j, k] = RE[0, k] * EPhi1[0, i, j, k] - RF[0, k] * dHy
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + coeffs[listIndex2] * (RC[k] * dHx + RD[0, k] * EPhi2[0, i, j, k] + RD[1, k] * EPhi2[1, i, j, k])
+                EPhi2[1, i, j, k] = RE[1, k] * EPhi2[1, i, j, k] - RF[1, k] * (RA[0, k] * dHx + RB[0, k] * EPhi2[0, i, j, k])
+                EPhi2[0, i, j, k] = RE[0, k] * EPhi2[0, i, j, k] - RF[0, k] * dHx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[0, i + xs, j + ys, zf - k]
+                dHy = (Hy[i + xs, j + ys, zf - k] - Hy[i + xs, j + ys, zf - k - 1]) / dz
+                correction = RC[k] * dHy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi1[n, i, j, k]
+                Ex[i + xs, j + ys, zf - k] = Ex[i + xs, j + ys, zf - k] - coeffs[listIndex1] * correction
+                x = dHy
+                for n in range(0, order):
+                    phi = EPhi1[n, i, j, k]
+                    EPhi1[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[1, i + xs, j + ys, zf - k]
+                dHx = (Hx[i + xs, j + ys, zf - k] - Hx[i + xs, j + ys, zf - k - 1]) / dz
+                correction = RC[k] * dHx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * EPhi2[n, i, j, k]
+                Ey[i + xs, j + ys, zf - k] = Ey[i + xs, j + ys, zf - k] + coeffs[listIndex2] * correction
+                x = dHx
+                for n in range(0, order):
+                    phi = EPhi2[n, i, j, k]
+                    EPhi2[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+###########################################################
+# Magnetic field PML updates - both tangential components #
+###########################################################
+cpdef update_pml_magnetic_xplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hy and Hz field components in the x stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEz, dEy, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[i] * dEz + RD[0, i] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, i] * HPhi1[0, i, j, k] - RF[0, i] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[i] * dEy + RD[0, i] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, i] * HPhi2[0, i, j, k] - RF[0, i] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[i] * dEz + RD[0, i] * HPhi1[0, i, j, k] + RD[1, i] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, i] * HPhi1[1, i, j, k] - RF[1, i] * (RA[0, i] * dEz + RB[0, i] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, i] * HPhi1[0, i, j, k] - RF[0, i] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[i] * dEy + RD[0, i] * HPhi2[0, i, j, k] + RD[1, i] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, i] * HPhi2[1, i, j, k] - RF[1, i] * (RA[0, i] * dEy + RB[0, i] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, i] * HPhi2[0, i, j, k] - RF[0, i] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + 1 + xs, j + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi1[n, i, j, k]
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] + coeffs[listIndex1] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + 1 + xs, j + ys, k + zs] - Ey[i + xs, j + ys, k + zs]) / dx
+                correction = RC[i] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi2[n, i, j, k]
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] - coeffs[listIndex2] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_magnetic_xminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ey, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dx):
+    """This function updates the Hy and Hz field components in the x stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEz, dEy, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + coeffs[listIndex1] * (RC[i] * dEz + RD[0, i] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, i] * HPhi1[0, i, j, k] - RF[0, i] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - coeffs[listIndex2] * (RC[i] * dEy + RD[0, i] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, i] * HPhi2[0, i, j, k] - RF[0, i] * dEy
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + coeffs[listIndex1] * (RC[i] * dEz + RD[0, i] * HPhi1[0, i, j, k] + RD[1, i] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, i] * HPhi1[1, i, j, k] - RF[1, i] * (RA[0, i] * dEz + RB[0, i] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, i] * HPhi1[0, i, j, k] - RF[0, i] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - coeffs[listIndex2] * (RC[i] * dEy + RD[0, i] * HPhi2[0, i, j, k] + RD[1, i] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, i] * HPhi2[1, i, j, k] - RF[1, i] * (RA[0, i] * dEy + RB[0, i] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, i] * HPhi2[0, i, j, k] - RF[0, i] * dEy
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[4, xf - (i + 1), j + ys, k + zs]
+                dEz = (Ez[xf - i, j + ys, k + zs] - Ez[xf - (i + 1), j + ys, k + zs]) / dx
+                correction = RC[i] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi1[n, i, j, k]
+                Hy[xf - (i + 1), j + ys, k + zs] = Hy[xf - (i + 1), j + ys, k + zs] + coeffs[listIndex1] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[5, xf - (i + 1), j + ys, k + zs]
+                dEy = (Ey[xf - i, j + ys, k + zs] - Ey[xf - (i + 1), j + ys, k + zs]) / dx
+                correction = RC[i] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, i] * HPhi2[n, i, j, k]
+                Hz[xf - (i + 1), j + ys, k + zs] = Hz[xf - (i + 1), j + ys, k + zs] - coeffs[listIndex2] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, i] * phi - RF[n, i] * x
+                    x = RA[n, i] * x + RB[n, i] * phi
+
+
+cpdef update_pml_magnetic_yplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hx and Hz field components in the y stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEz, dEx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[j] * dEz + RD[0, j] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, j] * HPhi1[0, i, j, k] - RF[0, j] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[j] * dEx + RD[0, j] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, j] * HPhi2[0, i, j, k] - RF[0, j] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - coeffs[listIndex1] * (RC[j] * dEz + RD[0, j] * HPhi1[0, i, j, k] + RD[1, j] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, j] * HPhi1[1, i, j, k] - RF[1, j] * (RA[0, j] * dEz + RB[0, j] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, j] * HPhi1[0, i, j, k] - RF[0, j] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + coeffs[listIndex2] * (RC[j] * dEx + RD[0, j] * HPhi2[0, i, j, k] + RD[1, j] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, j] * HPhi2[1, i, j, k] - RF[1, j] * (RA[0, j] * dEx + RB[0, j] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, j] * HPhi2[0, i, j, k] - RF[0, j] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEz = (Ez[i + xs, j + 1 + ys, k + zs] - Ez[i + xs, j + ys, k + zs]) / dy
+                correction = RC[j] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi1[n, i, j, k]
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] - coeffs[listIndex1] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + 1 + ys, k + zs] - Ex[i + xs, j + ys, k + zs]) / dy
+                correction = RC[j] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi2[n, i, j, k]
+                Hz[i + xs, j + ys, k + zs] = Hz[i + xs, j + ys, k + zs] + coeffs[listIndex2] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_magnetic_yminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hz, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ez, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dy):
+    """This function updates the Hx and Hz field components in the y stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEz, dEx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - coeffs[listIndex1] * (RC[j] * dEz + RD[0, j] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, j] * HPhi1[0, i, j, k] - RF[0, j] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + coeffs[listIndex2] * (RC[j] * dEx + RD[0, j] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, j] * HPhi2[0, i, j, k] - RF[0, j] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - coeffs[listIndex1] * (RC[j] * dEz + RD[0, j] * HPhi1[0, i, j, k] + RD[1, j] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, j] * HPhi1[1, i, j, k] - RF[1, j] * (RA[0, j] * dEz + RB[0, j] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, j] * HPhi1[0, i, j, k] - RF[0, j] * dEz
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + coeffs[listIndex2] * (RC[j] * dEx + RD[0, j] * HPhi2[0, i, j, k] + RD[1, j] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, j] * HPhi2[1, i, j, k] - RF[1, j] * (RA[0, j] * dEx + RB[0, j] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, j] * HPhi2[0, i, j, k] - RF[0, j] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, yf - (j + 1), k + zs]
+                dEz = (Ez[i + xs, yf - j, k + zs] - Ez[i + xs, yf - (j + 1), k + zs]) / dy
+                correction = RC[j] * dEz
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi1[n, i, j, k]
+                Hx[i + xs, yf - (j + 1), k + zs] = Hx[i + xs, yf - (j + 1), k + zs] - coeffs[listIndex1] * correction
+                x = dEz
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[5, i + xs, yf - (j + 1), k + zs]
+                dEx = (Ex[i + xs, yf - j, k + zs] - Ex[i + xs, yf - (j + 1), k + zs]) / dy
+                correction = RC[j] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, j] * HPhi2[n, i, j, k]
+                Hz[i + xs, yf - (j + 1), k + zs] = Hz[i + xs, yf - (j + 1), k + zs] + coeffs[listIndex2] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, j] * phi - RF[n, j] * x
+                    x = RA[n, j] * x + RB[n, j] * phi
+
+
+cpdef update_pml_magnetic_zplus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hx and Hy field components in the z stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEy, dEx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[k] * dEy + RD[0, k] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, k] * HPhi1[0, i, j, k] - RF[0, k] * dEy
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[k] * dEx + RD[0, k] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, k] * HPhi2[0, i, j, k] - RF[0, k] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + coeffs[listIndex1] * (RC[k] * dEy + RD[0, k] * HPhi1[0, i, j, k] + RD[1, k] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, k] * HPhi1[1, i, j, k] - RF[1, k] * (RA[0, k] * dEy + RB[0, k] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, k] * HPhi1[0, i, j, k] - RF[0, k] * dEy
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - coeffs[listIndex2] * (RC[k] * dEx + RD[0, k] * HPhi2[0, i, j, k] + RD[1, k] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, k] * HPhi2[1, i, j, k] - RF[1, k] * (RA[0, k] * dEx + RB[0, k] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, k] * HPhi2[0, i, j, k] - RF[0, k] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, k + zs]
+                dEy = (Ey[i + xs, j + ys, k + 1 + zs] - Ey[i + xs, j + ys, k + zs]) / dz
+                correction = RC[k] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi1[n, i, j, k]
+                Hx[i + xs, j + ys, k + zs] = Hx[i + xs, j + ys, k + zs] + coeffs[listIndex1] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, k + zs]
+                dEx = (Ex[i + xs, j + ys, k + 1 + zs] - Ex[i + xs, j + ys, k + zs]) / dz
+                correction = RC[k] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi2[n, i, j, k]
+                Hy[i + xs, j + ys, k + zs] = Hy[i + xs, j + ys, k + zs] - coeffs[listIndex2] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+
+
+cpdef update_pml_magnetic_zminus(int xs, int xf, int ys, int yf, int zs, int zf, int nthreads, floattype_t[:, :] updatecoeffsH, idtype_t[:, :, :, :] ID, floattype_t[:, :, :] Hx, floattype_t[:, :, :] Hy, floattype_t[:, :, :] Ex, floattype_t[:, :, :] Ey, floattype_t[:, :, :, :] HPhi1, floattype_t[:, :, :, :] HPhi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD, float dz):
+    """This function updates the Hx and Hy field components in the z stretching direction, for a PML of any order. Both components are updated in a single pass over the rows of the slab.
+        
+    Args:
+        xs, xf, ys, yf, zs, zf (int): Cell coordinates of entire box
+        nthreads (int): Number of threads to use
+        updatecoeffs, ID, E, H (memoryviews): Access to update coeffients, ID and field component arrays
+        EPhi, HPhi, RA, RB, RE, RF, RC, RD (memoryviews): Access to PML coefficient arrays
+        dx, dy, dz (float): Spatial discretisation
+    """
+    
+    cdef int i, j, k, n, ij, nx, ny, nz, listIndex1, listIndex2, order
+    cdef float dEy, dEx, phi, x
+    cdef double correction
+    cdef floattype_t[:] coeffs
+    nx = xf - xs
+    ny = yf - ys
+    nz = zf - zs
+    order = HPhi1.shape[0]
+    coeffs = updatecoeffsH[:, 4]
+
+    # The loops for first and second order PMLs, the most common, are written out
+    if order == 1:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + coeffs[listIndex1] * (RC[k] * dEy + RD[0, k] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, k] * HPhi1[0, i, j, k] - RF[0, k] * dEy
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - coeffs[listIndex2] * (RC[k] * dEx + RD[0, k] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, k] * HPhi2[0, i, j, k] - RF[0, k] * dEx
+    elif order == 2:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + coeffs[listIndex1] * (RC[k] * dEy + RD[0, k] * HPhi1[0, i, j, k] + RD[1, k] * HPhi1[1, i, j, k])
+                HPhi1[1, i, j, k] = RE[1, k] * HPhi1[1, i, j, k] - RF[1, k] * (RA[0, k] * dEy + RB[0, k] * HPhi1[0, i, j, k])
+                HPhi1[0, i, j, k] = RE[0, k] * HPhi1[0, i, j, k] - RF[0, k] * dEy
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - coeffs[listIndex2] * (RC[k] * dEx + RD[0, k] * HPhi2[0, i, j, k] + RD[1, k] * HPhi2[1, i, j, k])
+                HPhi2[1, i, j, k] = RE[1, k] * HPhi2[1, i, j, k] - RF[1, k] * (RA[0, k] * dEx + RB[0, k] * HPhi2[0, i, j, k])
+                HPhi2[0, i, j, k] = RE[0, k] * HPhi2[0, i, j, k] - RF[0, k] * dEx
+    else:
+        for ij in prange(0, nx * ny, nogil=True, schedule='static', num_threads=nthreads):
+            i = ij // ny
+            j = ij % ny
+            for k in range(0, nz):
+                listIndex1 = ID[3, i + xs, j + ys, zf - (k + 1)]
+                dEy = (Ey[i + xs, j + ys, zf - k] - Ey[i + xs, j + ys, zf - (k + 1)]) / dz
+                correction = RC[k] * dEy
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi1[n, i, j, k]
+                Hx[i + xs, j + ys, zf - (k + 1)] = Hx[i + xs, j + ys, zf - (k + 1)] + coeffs[listIndex1] * correction
+                x = dEy
+                for n in range(0, order):
+                    phi = HPhi1[n, i, j, k]
+                    HPhi1[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
+            for k in range(0, nz):
+                listIndex2 = ID[4, i + xs, j + ys, zf - (k + 1)]
+                dEx = (Ex[i + xs, j + ys, zf - k] - Ex[i + xs, j + ys, zf - (k + 1)]) / dz
+                correction = RC[k] * dEx
+                for n in range(0, order):
+                    correction = correction + RD[n, k] * HPhi2[n, i, j, k]
+                Hy[i + xs, j + ys, zf - (k + 1)] = Hy[i + xs, j + ys, zf - (k + 1)] - coeffs[listIndex2] * correction
+                x = dEx
+                for n in range(0, order):
+                    phi = HPhi2[n, i, j, k]
+                    HPhi2[n, i, j, k] = RE[n, k] * phi - RF[n, k] * x
+                    x = RA[n, k] * x + RB[n, k] * phi
@@ -0,0 +1,1392 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+from time import perf_counter
+
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+
+from .constants import e0, m0, floattype
+from .constants cimport floattype_t, complextype_t, idtype_t, dispersivetype_t
+from .fields_update cimport *
+from .fields_update_2d cimport *
+from .fields_update_sparse cimport *
+from .fields_update_temporal cimport *
+from .fields_update_tiled cimport *
+from .materials import Material
+from .pml_updates cimport *
+
+
+# Numeric codes for the direction of PML slabs
+cdef enum:
+    XMINUS, XPLUS, YMINUS, YPLUS, ZMINUS, ZPLUS
+
+pmldirections = {'xminus': XMINUS, 'xplus': XPLUS, 'yminus': YMINUS, 'yplus': YPLUS, 'zminus': ZMINUS, 'zplus': ZPLUS}
+
+
+cdef bint restrict_pml_range(int s, int f, int c0, int c1, bint reverse, int shift, int *rs, int *rf, int *r0):
+    """Restricts the range of a PML slab in one direction to the cells c0 to c1 - 1.
+
+    Args:
+        s, f (int): Cell coordinates of the slab in the direction.
+        c0, c1 (int): Range of cells to restrict the slab to.
+        reverse (bint): The PML update works backwards from f in the direction, i.e. it is the stretching direction of a minus slab.
+        shift (int): Offset of the last cell updated from f when working backwards (0 for electric, 1 for magnetic field components).
+        rs, rf (int): Cell coordinates of the restricted slab.
+        r0 (int): Offset of the restricted slab into the PML coefficient arrays.
+
+    Returns:
+        (bint): The restricted slab contains cells.
+    """
+
+    cdef int lo, hi, top
+
+    if reverse:
+        top = f - shift
+        lo = max(top - (f - s) + 1, c0)
+        hi = min(top + 1, c1)
+        if lo >= hi:
+            return False
+        r0[0] = top - (hi - 1)
+        rf[0] = hi - 1 + shift
+        rs[0] = rf[0] - (hi - lo)
+    else:
+        lo = max(s, c0)
+        hi = min(f, c1)
+        if lo >= hi:
+            return False
+        r0[0] = lo - s
+        rs[0] = lo
+        rf[0] = hi
+
+    return True
+
+
+def tile_candidates(nx, ny, nz, nthreads):
+    """Lists tile sizes to try for the tiled field updates of a grid.
+
+    Args:
+        nx, ny, nz (int): Grid size in cells.
+        nthreads (int): Number of OpenMP threads.
+
+    Returns:
+        candidates (list): Tile sizes (tilej, tilek) in cells, starting with (0, 0) for the untiled updates.
+    """
+
+    candidates = [(0, 0)]
+    for tilej, tilek in [(4, nz), (8, nz), (16, nz), (32, nz), (16, 64), (32, 64), (64, 64), (32, 128)]:
+        tilej = min(tilej, ny)
+        tilek = min(tilek, nz)
+        # There must be at least one tile per thread
+        if ((ny + tilej - 1) // tilej) * ((nz + tilek - 1) // tilek) >= nthreads and (tilej, tilek) not in candidates:
+            candidates.append((tilej, tilek))
+
+    return candidates
+
+
+def uniform_rows(ID, nx, ny, nz, tilek):
+    """Finds the material of each row (in the k direction) of each tile of a grid, if it is the same for all the cell edges of the row.
+
+    Args:
+        ID (array): IDs of the electric, or magnetic, field components.
+        nx, ny, nz (int): Grid size in cells.
+        tilek (int): Tile size in cells in the k direction.
+
+    Returns:
+        uniform (array): Material of each row [i, j, tile in k direction], or -1 if the row has more than one material.
+    """
+
+    # Material of each cell if it is the same for all the field components, otherwise -1
+    material = ID[0, 0:nx, 0:ny, 0:nz].astype(np.intc)
+    material[(ID[1, 0:nx, 0:ny, 0:nz] != ID[0, 0:nx, 0:ny, 0:nz]) | (ID[2, 0:nx, 0:ny, 0:nz] != ID[0, 0:nx, 0:ny, 0:nz])] = -1
+
+    kstarts = np.arange(0, nz, tilek)
+    uniform = np.minimum.reduceat(material, kstarts, axis=2)
+    uniform[uniform != np.maximum.reduceat(material, kstarts, axis=2)] = -1
+
+    return uniform
+
+
+cdef idtype_t[:, :] id_plane(idtype_t[:, :, :, :] ID, int component, int normal):
+    """Plane of the ID array of a field component in the plane of a 2D model.
+
+    Args:
+        ID (memoryview): IDs of the field components.
+        component (int): Field component of the ID array.
+        normal (int): Direction normal to the plane of the model.
+
+    Returns:
+        (memoryview): IDs of the field component in the plane.
+    """
+
+    if normal == 0:
+        return ID[component, 0, :, :]
+    elif normal == 1:
+        return ID[component, :, 0, :]
+    else:
+        return ID[component, :, :, 0]
+
+
+def waveform_tables(sources, waveforms, times, dt):
+    """Evaluates the waveforms of a set of sources, with any delay in their start, at every iteration. Sources with the same waveform and delay share a table.
+
+    Args:
+        sources (list): Source class instances.
+        waveforms (dict): Waveform class instances by ID.
+        times (array): Absolute time at which the sources are updated in each iteration.
+        dt (float): Absolute time discretisation.
+
+    Returns:
+        tables (array): Values of each waveform and delay for every iteration, which are zero before the delay.
+        table (array): Index of the table of each source.
+    """
+
+    keys = {}
+    table = np.zeros(len(sources), dtype=np.int32)
+    for s, source in enumerate(sources):
+        table[s] = keys.setdefault((source.waveformID, source.start), len(keys))
+
+    tables = np.zeros((len(keys), len(times)), dtype=np.float64)
+    for (waveformID, delay), t in keys.items():
+        active = times >= delay
+        tables[t, active] = waveforms[waveformID].calculate_values(times[active] - delay, dt)
+
+    return tables, table
+
+
+def sources_end(tables, table, start, stop, threshold):
+    """Finds the iteration after which the values of all of a set of sources stay below a threshold relative to their peak.
+
+    Args:
+        tables (memoryview): Values of each waveform of the sources for every iteration.
+        table (memoryview): Index of the table of each source.
+        start, stop (memoryview): First iteration each source is on, and one past the last iteration it is on.
+        threshold (float): Threshold relative to the peak value of each source.
+
+    Returns:
+        end (int): One past the last iteration at which the value of any of the sources is above the threshold.
+    """
+
+    end = 0
+    for s in range(len(table)):
+        if stop[s] <= start[s]:
+            continue
+        sourcevalues = np.abs(np.asarray(tables)[table[s], start[s]:stop[s]])
+        active = np.nonzero(sourcevalues > threshold * sourcevalues.max())[0]
+        if len(active) > 0:
+            end = max(end, start[s] + active[-1] + 1)
+
+    return end
+
+
+cdef int first_source(int[:, :] positions, int i):
+    """Finds the first of a set of sources, which are sorted by their x position, at or after an x position.
+
+    Args:
+        positions (memoryview): Positions of the sources.
+        i (int): x position.
+
+    Returns:
+        lo (int): Index of the first source at or after the x position, or the number of sources if there are none.
+    """
+
+    cdef int mid
+    cdef int lo = 0
+    cdef int hi = positions.shape[0]
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if positions[mid, 0] < i:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+
+cdef double sum_squares(floattype_t[:, :, :] F, int nthreads):
+    """Sums the squares of the values of a field component.
+
+    Args:
+        F (memoryview): Field component array.
+        nthreads (int): Number of threads to use.
+
+    Returns:
+        total (double): Sum of the squares of the values.
+    """
+
+    cdef Py_ssize_t i, j, k
+    cdef double total = 0
+
+    for i in prange(0, F.shape[0], nogil=True, schedule='static', num_threads=nthreads):
+        for j in range(0, F.shape[1]):
+            for k in range(0, F.shape[2]):
+                total += F[i, j, k] * F[i, j, k]
+
+    return total
+
+
+cdef grow_region(int[:, :] positions, int[:] start, int[:] stop, int timestep, int *size, int *lo, int *hi):
+    """Grows a region of the grid to include the cells in which the fields from a set of sources may be non-zero at an iteration. The region extends a cell beyond them, as the field components at the edges of the region are not updated.
+
+    Args:
+        positions, start, stop (memoryviews): Positions of the sources, and the range of iterations during which each source is on.
+        timestep (int): Iteration.
+        size (int): Grid size in cells in each direction.
+        lo, hi (int): Cell coordinates of the region.
+    """
+
+    cdef int s, d, r
+
+    for s in range(positions.shape[0]):
+        if stop[s] <= start[s]:
+            continue
+        r = 2 * max(timestep - start[s], 0) + 2
+        for d in range(3):
+            lo[d] = min(lo[d], max(positions[s, d] - r, 0))
+            hi[d] = max(hi[d], min(positions[s, d] + r, size[d]))
+
+
+cdef class PMLSlab:
+    """Typed copy of the parameters of a PML slab, so that it can be updated from the compiled solver without Python attribute lookups."""
+
+    cdef int direction, xs, xf, ys, yf, zs, zf
+    cdef bint E1, E2, H1, H2
+    cdef floattype_t[:, :, :, :] EPhi1, EPhi2, HPhi1, HPhi2
+    cdef floattype_t[:, :] ERA, ERB, ERE, ERF, ERD, HRA, HRB, HRE, HRF, HRD
+    cdef double[:] ERC, HRC
+
+    def __init__(self, pml, G):
+        """
+        Args:
+            pml (class): PML class instance.
+            G (class): Grid class instance - holds essential parameters describing the model.
+        """
+        self.direction = pmldirections[pml.direction]
+        self.xs = pml.xs
+        self.xf = pml.xf
+        self.ys = pml.ys
+        self.yf = pml.yf
+        self.zs = pml.zs
+        self.zf = pml.zf
+
+        # Phi arrays for the two field components that are corrected in the slab, in the order x, y, z
+        if pml.direction[0] == 'x':
+            self.EPhi1, self.EPhi2, self.HPhi1, self.HPhi2 = pml.EPhiyxz, pml.EPhizxy, pml.HPhiyxz, pml.HPhizxy
+        elif pml.direction[0] == 'y':
+            self.EPhi1, self.EPhi2, self.HPhi1, self.HPhi2 = pml.EPhixyz, pml.EPhizyx, pml.HPhixyz, pml.HPhizyx
+        elif pml.direction[0] == 'z':
+            self.EPhi1, self.EPhi2, self.HPhi1, self.HPhi2 = pml.EPhixzy, pml.EPhiyzx, pml.HPhixzy, pml.HPhiyzx
+
+        # Components that are corrected in the slab, which are only those used by the model for 2D models
+        components = [x for x in 'xyz' if x != pml.direction[0]]
+        self.E1, self.E2 = (G.component_used('E' + x) for x in components)
+        self.H1, self.H2 = (G.component_used('H' + x) for x in components)
+
+        self.ERA = pml.ERA
+        self.ERB = pml.ERB
+        self.ERE = pml.ERE
+        self.ERF = pml.ERF
+        self.ERC = pml.ERC
+        self.ERD = pml.ERD
+        self.HRA = pml.HRA
+        self.HRB = pml.HRB
+        self.HRE = pml.HRE
+        self.HRF = pml.HRF
+        self.HRC = pml.HRC
+        self.HRD = pml.HRD
+
+    cdef bint overlaps(self, int x0, int y0, int z0, int x1, int y1, int z1):
+        """Checks whether the slab, or the field values its update reads, overlaps a region of the grid.
+
+        Args:
+            x0, y0, z0, x1, y1, z1 (int): Cell coordinates of the region.
+
+        Returns:
+            (bint): The slab overlaps the region.
+        """
+
+        return self.xs <= x1 and self.xf >= x0 and self.ys <= y1 and self.yf >= y0 and self.zs <= z1 and self.zf >= z0
+
+
+cdef class FDTDSolver:
+    """Compiled main FDTD loop. Runs blocks of iterations (electric, PML, source, dispersive and magnetic updates, and storing of receiver values) without returning to Python."""
+
+    cdef int nx, ny, nz, nthreads, maxpoles, unrolledpoles
+    cdef bint fused, deferdispersive, dispersivepending
+    cdef public int tilej, tilek, temporalsteps, temporalrows
+    cdef int uniformtilek
+    cdef int[:, :, :] uniformE, uniformH
+    cdef bint uniformuntiled
+    cdef int[:, :] uniformuntiledE, uniformuntiledH
+    cdef float dx, dy, dz
+    cdef floattype_t[:, :] updatecoeffsE, updatecoeffsH
+    cdef bint realdispersive, sparsedispersive
+    cdef int[:] poles
+    cdef complextype_t[:, :] updatecoeffsdispersive
+    cdef floattype_t[:, :] updatecoeffsdispersivereal
+    cdef object ID, IDH
+    cdef int idbytes
+    cdef np.uint8_t[:, :, :, :] ID8, IDH8
+    cdef np.uint16_t[:, :, :, :] ID16, IDH16
+    cdef np.uint32_t[:, :, :, :] ID32, IDH32
+    cdef floattype_t[:, :, :] Ex, Ey, Ez, Hx, Hy, Hz
+    cdef int normal, paxis, qaxis, nump, numq, coeffp, coeffq
+    cdef bint righthanded
+    cdef floattype_t[:, :] E2D, Hp2D, Hq2D
+    cdef bint lightcone, fullregion
+    cdef int x0, y0, z0, x1, y1, z1, nxr, nyr, nzr, numpr, numqr
+    cdef floattype_t[:, :, :] Exr, Eyr, Ezr, Hxr, Hyr, Hzr
+    cdef floattype_t[:, :] E2Dr, Hp2Dr, Hq2Dr
+    cdef public bint decayed
+    cdef int decaysteps, nextcheck, sourcesend
+    cdef double decaythreshold, peakenergy
+    cdef complextype_t[:, :, :, :] Tx, Ty, Tz
+    cdef floattype_t[:, :, :, :] Txreal, Tyreal, Tzreal
+    cdef complextype_t[:, :] Txsparse, Tysparse, Tzsparse
+    cdef floattype_t[:, :] Txsparsereal, Tysparsereal, Tzsparsereal
+    cdef np.int32_t[:, :] dispersivecellsEx, dispersivecellsEy, dispersivecellsEz
+    cdef floattype_t[:] phiEx, phiEy, phiEz
+    cdef list pmls
+    cdef int[:, :] srcEpositions, srcHpositions, rxpositions
+    cdef int[:] srcEcomponents, srcEhard, srcEstart, srcEstop, srcEtable, srcHcomponents, srcHstart, srcHstop, srcHtable
+    cdef double[:] srcEscale, srcEfactor, srcHscale, srcHfactor
+    cdef double[:, :] srcEtables, srcHtables
+    cdef public floattype_t[:, :, :] rxvalues
+
+    def __init__(self, G, blocksize, fused=True, lightcone=True):
+        """
+        Args:
+            G (class): Grid class instance - holds essential parameters describing the model.
+            blocksize (int): Maximum number of iterations run in a block, i.e. between writing receiver values to file.
+            fused (bool): Update all electric, and all magnetic, field components in a single sweep of the grid, rather than with a separate kernel for each component. If there are any dispersive materials the 2nd part of the dispersive update is also done in the same sweep as the electric field update of the next iteration.
+            lightcone (bool): Restrict the field updates to the light cone of the sources until it covers the whole grid, rather than updating the whole grid from the first iteration.
+        """
+        self.nx = G.nx
+        self.ny = G.ny
+        self.nz = G.nz
+        self.nthreads = G.nthreads
+        self.dx = G.dx
+        self.dy = G.dy
+        self.dz = G.dz
+        self.updatecoeffsE = G.updatecoeffsE
+        self.updatecoeffsH = G.updatecoeffsH
+        self.ID = G.ID
+        self.IDH = G.IDH
+        # Typed views of the ID arrays for the integer type they are stored with
+        self.idbytes = G.ID.itemsize
+        if self.idbytes == 1:
+            self.ID8 = G.ID
+            self.IDH8 = G.IDH
+        elif self.idbytes == 2:
+            self.ID16 = G.ID
+            self.IDH16 = G.IDH
+        else:
+            self.ID32 = G.ID
+            self.IDH32 = G.IDH
+        self.Ex = G.Ex
+        self.Ey = G.Ey
+        self.Ez = G.Ez
+        self.Hx = G.Hx
+        self.Hy = G.Hy
+        self.Hz = G.Hz
+
+        # For 2D models, the planes of the field components that are used, and the directions (p, q) of the plane
+        if G.mode == '3D':
+            self.normal = -1
+        else:
+            self.normal = 'xyz'.index(G.mode[-1])
+            self.paxis, self.qaxis = (axis for axis in range(3) if axis != self.normal)
+            plane = tuple(0 if axis == self.normal else slice(None) for axis in range(3))
+            self.E2D = (G.Ex, G.Ey, G.Ez)[self.normal][plane]
+            self.Hp2D = (G.Hx, G.Hy, G.Hz)[self.paxis][plane]
+            self.Hq2D = (G.Hx, G.Hy, G.Hz)[self.qaxis][plane]
+            self.nump = (G.nx, G.ny, G.nz)[self.paxis]
+            self.numq = (G.nx, G.ny, G.nz)[self.qaxis]
+            self.coeffp = 1 + self.paxis
+            self.coeffq = 1 + self.qaxis
+            self.righthanded = self.normal != 1
+
+        self.maxpoles = Material.maxpoles
+        self.fused = fused
+        self.deferdispersive = fused and self.maxpoles != 0
+        self.dispersivepending = False
+        self.tilej = 0
+        self.tilek = 0
+        self.uniformtilek = 0
+        self.uniformuntiled = False
+        self.temporalsteps = 1
+        self.temporalrows = 0
+        self.realdispersive = self.maxpoles != 0 and not np.iscomplexobj(G.Tx)
+        self.sparsedispersive = self.maxpoles != 0 and G.dispersivecellsEx is not None
+        if self.maxpoles != 0:
+            # Kernels with the pole loop unrolled are used if all dispersive materials have the same (small) number of poles, otherwise each material is updated with its own number of poles
+            self.poles = G.poles
+            polecounts = set(material.poles for material in G.materials if material.poles > 0)
+            self.unrolledpoles = polecounts.pop() if len(polecounts) == 1 and self.maxpoles <= 3 else 0
+        if self.realdispersive:
+            self.updatecoeffsdispersivereal = G.updatecoeffsdispersive
+        elif self.maxpoles != 0:
+            self.updatecoeffsdispersive = G.updatecoeffsdispersive
+        if self.sparsedispersive:
+            self.dispersivecellsEx = G.dispersivecellsEx
+            self.dispersivecellsEy = G.dispersivecellsEy
+            self.dispersivecellsEz = G.dispersivecellsEz
+            self.phiEx = G.phiEx
+            self.phiEy = G.phiEy
+            self.phiEz = G.phiEz
+        if self.sparsedispersive and self.realdispersive:
+            self.Txsparsereal = G.Tx
+            self.Tysparsereal = G.Ty
+            self.Tzsparsereal = G.Tz
+        elif self.sparsedispersive:
+            self.Txsparse = G.Tx
+            self.Tysparse = G.Ty
+            self.Tzsparse = G.Tz
+        elif self.realdispersive:
+            self.Txreal = G.Tx
+            self.Tyreal = G.Ty
+            self.Tzreal = G.Tz
+        elif self.maxpoles != 0:
+            self.Tx = G.Tx
+            self.Ty = G.Ty
+            self.Tz = G.Tz
+        self.pmls = [PMLSlab(pml, G) for pml in G.pmls]
+
+        self.prepare_sources(G)
+
+        # The field updates are restricted to a region of the grid, which is the bounding box of the cells in which the fields
+        # may be non-zero (the light cone of the sources) until it covers the whole grid. Views of the field arrays start at the region.
+        self.lightcone = lightcone and (np.any(np.asarray(self.srcEstop) > np.asarray(self.srcEstart)) or np.any(np.asarray(self.srcHstop) > np.asarray(self.srcHstart)))
+        self.set_region(0, 0, 0, self.nx, self.ny, self.nz)
+
+        # The energy of the fields is checked every decaysteps iterations once the sources have finished, to stop the run once it has decayed
+        self.decayed = False
+        self.decaysteps = 0
+        if G.stopondecay:
+            self.decaythreshold, self.decaysteps = G.stopondecay
+            self.nextcheck = self.decaysteps
+            self.peakenergy = 0
+            self.sourcesend = max(sources_end(self.srcEtables, self.srcEtable, self.srcEstart, self.srcEstop, self.decaythreshold),
+                                  sources_end(self.srcHtables, self.srcHtable, self.srcHstart, self.srcHstop, self.decaythreshold))
+
+        # Receiver positions, and storage for field values at receivers for a block of iterations
+        self.rxpositions = np.array([(rx.positionx, rx.positiony, rx.positionz) for rx in G.rxs], dtype=np.int32).reshape(len(G.rxs), 3)
+        self.rxvalues = np.zeros((6, len(G.rxs), blocksize), dtype=floattype)
+
+    def prepare_sources(self, G):
+        """Stores the positions, field components, scale factors and waveforms of all sources in arrays, i.e. a registry of the sources that
+            the compiled source updates apply in one call. The waveforms are evaluated, with any delay in their start, for every iteration.
+
+        Args:
+            G (class): Grid class instance - holds essential parameters describing the model.
+        """
+
+        # Absolute time at the electric and magnetic source updates of each iteration (accumulated as in the original main loop)
+        Etimes = np.zeros(G.iterations, dtype=np.float64)
+        Htimes = np.zeros(G.iterations, dtype=np.float64)
+        abstime = 0
+        for timestep in range(G.iterations):
+            Etimes[timestep] = abstime
+            abstime += 0.5 * G.dt
+            Htimes[timestep] = abstime
+            abstime += 0.5 * G.dt
+
+        components = {'x': 0, 'y': 1, 'z': 2}
+        waveforms = {waveform.ID: waveform for waveform in G.waveforms}
+
+        # Electric sources - voltage sources then Hertzian dipoles, the order in which they are applied. The value of a source is its
+        # scale factor times its waveform, which is then multiplied by (or for hard sources divided by) its other factor.
+        sources = G.voltagesources + G.hertziandipoles
+        positions = np.zeros((len(sources), 3), dtype=np.int32)
+        polarisations = np.zeros(len(sources), dtype=np.int32)
+        hard = np.zeros(len(sources), dtype=np.int32)
+        start = np.zeros(len(sources), dtype=np.int32)
+        stop = np.zeros(len(sources), dtype=np.int32)
+        scale = np.zeros(len(sources), dtype=np.float64)
+        factor = np.zeros(len(sources), dtype=np.float64)
+        dl = (G.dx, G.dy, G.dz)
+        area = (G.dy * G.dz, G.dx * G.dz, G.dx * G.dy)
+        for s, source in enumerate(sources):
+            i = source.positionx
+            j = source.positiony
+            k = source.positionz
+            c = components[source.polarisation]
+            waveform = waveforms[source.waveformID]
+            positions[s, :] = i, j, k
+            polarisations[s] = c
+            hard[s] = source in G.voltagesources and source.resistance == 0
+            start[s], stop[s] = self.active_iterations(source, Etimes)
+            if hard[s]:
+                scale[s] = -1 * waveform.amp
+                factor[s] = dl[c]
+            elif source in G.voltagesources:
+                scale[s] = G.updatecoeffsE[G.ID[c, i, j, k], 4] * waveform.amp
+                factor[s] = 1 / (source.resistance * area[c])
+            else:
+                scale[s] = G.updatecoeffsE[G.ID[c, i, j, k], 4] * waveform.amp
+                factor[s] = 1 / area[c]
+        tables, table = waveform_tables(sources, waveforms, Etimes, G.dt)
+
+        # Sources are sorted by their x position so the updates of part of the grid only visit the sources in it. The sort is stable,
+        # so sources at the same position are still applied in order.
+        order = np.argsort(positions[:, 0], kind='stable')
+        self.srcEpositions = positions[order]
+        self.srcEcomponents = polarisations[order]
+        self.srcEhard = hard[order]
+        self.srcEstart = start[order]
+        self.srcEstop = stop[order]
+        self.srcEscale = scale[order]
+        self.srcEfactor = factor[order]
+        self.srcEtable = table[order]
+        self.srcEtables = tables
+
+        # Magnetic sources
+        sources = G.magneticdipoles
+        positions = np.zeros((len(sources), 3), dtype=np.int32)
+        polarisations = np.zeros(len(sources), dtype=np.int32)
+        start = np.zeros(len(sources), dtype=np.int32)
+        stop = np.zeros(len(sources), dtype=np.int32)
+        scale = np.zeros(len(sources), dtype=np.float64)
+        factor = np.full(len(sources), G.dt / (G.dx * G.dy * G.dz), dtype=np.float64)
+        for s, source in enumerate(sources):
+            positions[s, :] = source.positionx, source.positiony, source.positionz
+            polarisations[s] = components[source.polarisation]
+            start[s], stop[s] = self.active_iterations(source, Htimes)
+            scale[s] = waveforms[source.waveformID].amp
+        tables, table = waveform_tables(sources, waveforms, Htimes, G.dt)
+        order = np.argsort(positions[:, 0], kind='stable')
+        self.srcHpositions = positions[order]
+        self.srcHcomponents = polarisations[order]
+        self.srcHstart = start[order]
+        self.srcHstop = stop[order]
+        self.srcHscale = scale[order]
+        self.srcHfactor = factor[order]
+        self.srcHtable = table[order]
+        self.srcHtables = tables
+
+    @staticmethod
+    def active_iterations(source, times):
+        """Finds the range of iterations during which a source is switched on.
+
+        Args:
+            source (class): Source class instance.
+            times (array): Absolute time at which the source is updated in each iteration.
+
+        Returns:
+            start, stop (int): First iteration the source is on, and one past the last iteration it is on.
+        """
+        active = np.nonzero((times >= source.start) & (times <= source.stop))[0]
+        if len(active) == 0:
+            return 0, 0
+        return active[0], active[-1] + 1
+
+    def run(self, int start, int stop):
+        """Runs a block of iterations of the main FDTD loop.
+
+        Args:
+            start (int): First iteration of the block.
+            stop (int): One past the last iteration of the block.
+
+        Returns:
+            (int): One past the last iteration that was run, which is before stop if the fields have decayed (decayed is then set).
+        """
+
+        # The field updates are compiled for each integer type of the ID arrays
+        if self.idbytes == 1:
+            return self.run_block(self.ID8, self.IDH8, start, stop)
+        elif self.idbytes == 2:
+            return self.run_block(self.ID16, self.IDH16, start, stop)
+        else:
+            return self.run_block(self.ID32, self.IDH32, start, stop)
+
+    cdef int run_block(self, idtype_t[:, :, :, :] ID, idtype_t[:, :, :, :] IDH, int start, int stop):
+        """Runs a block of iterations of the main FDTD loop with the ID arrays stored as a particular integer type.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            IDH (memoryview): IDs of the magnetic field components.
+            start (int): First iteration of the block.
+            stop (int): One past the last iteration of the block.
+
+        Returns:
+            (int): One past the last iteration that was run.
+        """
+
+        cdef int timestep, first, last
+
+        # While the fields may only be non-zero in part of the grid the field updates are restricted to that region
+        first = start
+        while first < stop and self.lightcone:
+            self.update_light_cone(first)
+            self.run_iteration(ID, IDH, first, first - start)
+            first += 1
+            if self.check_decay(first):
+                return first
+
+        if self.temporalsteps > 1:
+            for timestep in range(first, stop, self.temporalsteps):
+                last = min(timestep + self.temporalsteps, stop)
+                self.run_temporal_block(ID, IDH, timestep, last, timestep - start)
+                if self.check_decay(last):
+                    return last
+            return stop
+
+        for timestep in range(first, stop):
+            self.run_iteration(ID, IDH, timestep, timestep - start)
+            if self.check_decay(timestep + 1):
+                return timestep + 1
+
+        return stop
+
+    cdef run_iteration(self, idtype_t[:, :, :, :] ID, idtype_t[:, :, :, :] IDH, int timestep, int index):
+        """Runs an iteration of the main FDTD loop.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            IDH (memoryview): IDs of the magnetic field components.
+            timestep (int): Iteration.
+            index (int): Index of the iteration within the current block of receiver values.
+        """
+
+        # Store field values at receivers
+        self.store_rx_values(index, 0, self.nx + 1, 0, self.ny + 1)
+
+        # Update electric field components
+        self.update_electric_fields(ID)
+
+        # Update electric field components with the PML correction
+        self.update_pml_electric(ID)
+
+        # Update electric field components with electric sources
+        self.update_electric_sources(timestep, 0, self.nx + 1, 0, self.ny + 1)
+
+        # If there are any dispersive materials do 2nd part of dispersive update. It is split into two parts as it requires present and updated electric field values. Therefore it can only be completely updated after the electric field has been updated by the PML and source updates. Nothing changes the electric field, or uses the temporary dispersive arrays, until the electric field update of the next iteration, so the 2nd part can be deferred to the same sweep of the grid as that update.
+        if self.deferdispersive:
+            self.dispersivepending = True
+        else:
+            self.update_electric_dispersive_B(ID)
+
+        # Update magnetic field components
+        self.update_magnetic_fields(IDH)
+
+        # Update magnetic field components with the PML correction
+        self.update_pml_magnetic(IDH)
+
+        # Update magnetic field components with magnetic sources
+        self.update_magnetic_sources(timestep, 0, self.nx + 1, 0, self.ny + 1)
+
+    cdef run_temporal_block(self, idtype_t[:, :, :, :] ID, idtype_t[:, :, :, :] IDH, int first, int last, int index):
+        """Runs iterations first to last - 1 with temporal blocking (non-dispersive models only). The grid is divided into tiles of temporalrows rows (in y), which are processed in turn. In each tile a wavefront sweeps through the planes (in x), updating the electric field of iteration s on plane p - 2s and the magnetic field of iteration s on plane p - 2s - 1 for wavefront position p, so that the fields of a few neighbouring planes are advanced through all the iterations while they are in cache. The rows of each tile are shifted down by two rows per iteration, so that all the values a tile needs from the previous tile are already up to date, and not yet overwritten. The PML correction, sources and receivers are applied to each plane and range of rows straight after the field update, so the field values are identical to those of the standard loop.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            IDH (memoryview): IDs of the magnetic field components.
+            first (int): First iteration of the block.
+            last (int): One past the last iteration of the block.
+            index (int): Index of the first iteration within the current block of receiver values.
+        """
+
+        cdef int ntiles, tile, p, s, i, j0, j1
+        cdef int nsteps = last - first
+
+        if not self.uniformuntiled:
+            self.find_uniform_rows_untiled()
+
+        # Rows 0 to ny are processed, so that receivers on the last row are stored
+        ntiles = (self.ny + self.temporalrows) // self.temporalrows
+
+        for tile in range(ntiles):
+            for p in range(self.nx + 2 * nsteps):
+                for s in range(nsteps):
+                    # Electric field components (then PML correction and electric sources) of iteration s on plane p - 2s
+                    i = p - 2 * s
+                    if 0 <= i <= self.nx:
+                        j0 = 0 if tile == 0 else max(tile * self.temporalrows - 2 * s, 0)
+                        j1 = self.ny + 1 if tile == ntiles - 1 else min((tile + 1) * self.temporalrows - 2 * s, self.ny + 1)
+                        if j0 < j1:
+                            self.store_rx_values(index + s, i, i + 1, j0, j1)
+                            update_electric_rows(self.nx, self.ny, self.nz, self.nthreads, i, j0, j1, self.uniformuntiledE, self.updatecoeffsE, ID, self.Ex, self.Ey, self.Ez, self.Hx, self.Hy, self.Hz)
+                            self.update_pml_region(ID, True, i, i + 1, j0, j1)
+                            self.update_electric_sources(first + s, i, i + 1, j0, j1)
+
+                    # Magnetic field components (then PML correction and magnetic sources) of iteration s on plane p - 2s - 1
+                    i -= 1
+                    if 0 <= i <= self.nx:
+                        j0 = 0 if tile == 0 else max(tile * self.temporalrows - 2 * s - 1, 0)
+                        j1 = self.ny + 1 if tile == ntiles - 1 else min((tile + 1) * self.temporalrows - 2 * s - 1, self.ny + 1)
+                        if j0 < j1:
+                            update_magnetic_rows(self.nx, self.ny, self.nz, self.nthreads, i, j0, j1, self.uniformuntiledH, self.updatecoeffsH, IDH, self.Hx, self.Hy, self.Hz, self.Ex, self.Ey, self.Ez)
+                            self.update_pml_region(IDH, False, i, i + 1, j0, j1)
+                            self.update_magnetic_sources(first + s, i, i + 1, j0, j1)
+
+    cdef bint check_decay(self, int iterations):
+        """Checks whether the fields have decayed, i.e. the sources have finished and the energy of the fields is below a threshold relative to its peak. The energy is only calculated every decaysteps iterations (or at the end of the first temporal block after that).
+
+        Args:
+            iterations (int): Number of iterations that have been run.
+
+        Returns:
+            (bint): The fields have decayed.
+        """
+
+        cdef double energy
+
+        if self.decaysteps == 0 or iterations < self.nextcheck:
+            return False
+        self.nextcheck = (iterations // self.decaysteps + 1) * self.decaysteps
+
+        energy = self.field_energy()
+        self.peakenergy = max(self.peakenergy, energy)
+        self.decayed = iterations >= self.sourcesend and energy <= self.decaythreshold * self.peakenergy
+
+        return self.decayed
+
+    cdef double field_energy(self):
+        """Calculates a measure of the energy of the fields, i.e. the energy of the field values in free space, per unit volume of a cell. It is only used relative to its peak.
+
+        Returns:
+            (double): Energy of the fields.
+        """
+
+        cdef int c
+        cdef double E = 0
+        cdef double H = 0
+
+        # Only the field components that are used by 2D models
+        for c in range(3):
+            if self.normal < 0 or c == self.normal:
+                E += sum_squares((self.Ex, self.Ey, self.Ez)[c], self.nthreads)
+            if c != self.normal:
+                H += sum_squares((self.Hx, self.Hy, self.Hz)[c], self.nthreads)
+
+        return 0.5 * (e0 * E + m0 * H)
+
+    cdef update_light_cone(self, int timestep):
+        """Sets the region of the grid that the field updates are restricted to for an iteration, i.e. the bounding box of the cells in which the fields may be non-zero. The fields spread by (at most) a cell in each direction per half-step from each source, from its first iteration. Once the region covers the whole grid it is no longer tracked.
+
+        Args:
+            timestep (int): Iteration.
+        """
+
+        cdef int lo[3]
+        cdef int hi[3]
+        cdef int size[3]
+
+        size[0], size[1], size[2] = self.nx, self.ny, self.nz
+        lo[0], lo[1], lo[2] = self.nx, self.ny, self.nz
+        hi[0], hi[1], hi[2] = 0, 0, 0
+        grow_region(self.srcEpositions, self.srcEstart, self.srcEstop, timestep, size, lo, hi)
+        grow_region(self.srcHpositions, self.srcHstart, self.srcHstop, timestep, size, lo, hi)
+
+        if lo[0] == 0 and lo[1] == 0 and lo[2] == 0 and hi[0] == self.nx and hi[1] == self.ny and hi[2] == self.nz:
+            self.lightcone = False
+        self.set_region(lo[0], lo[1], lo[2], hi[0], hi[1], hi[2])
+
+    cdef set_region(self, int x0, int y0, int z0, int x1, int y1, int z1):
+        """Sets the region of the grid that the field updates are restricted to, and the views of the field arrays that start at it.
+
+        Args:
+            x0, y0, z0, x1, y1, z1 (int): Cell coordinates of the region.
+        """
+
+        self.x0, self.y0, self.z0 = x0, y0, z0
+        self.x1, self.y1, self.z1 = x1, y1, z1
+        self.nxr, self.nyr, self.nzr = x1 - x0, y1 - y0, z1 - z0
+        self.fullregion = x0 == 0 and y0 == 0 and z0 == 0 and x1 == self.nx and y1 == self.ny and z1 == self.nz
+        self.Exr = self.Ex[x0:, y0:, z0:]
+        self.Eyr = self.Ey[x0:, y0:, z0:]
+        self.Ezr = self.Ez[x0:, y0:, z0:]
+        self.Hxr = self.Hx[x0:, y0:, z0:]
+        self.Hyr = self.Hy[x0:, y0:, z0:]
+        self.Hzr = self.Hz[x0:, y0:, z0:]
+        if self.normal >= 0:
+            origin = (x0, y0, z0)
+            self.E2Dr = self.E2D[origin[self.paxis]:, origin[self.qaxis]:]
+            self.Hp2Dr = self.Hp2D[origin[self.paxis]:, origin[self.qaxis]:]
+            self.Hq2Dr = self.Hq2D[origin[self.paxis]:, origin[self.qaxis]:]
+            self.numpr = (self.nxr, self.nyr, self.nzr)[self.paxis]
+            self.numqr = (self.nxr, self.nyr, self.nzr)[self.qaxis]
+
+    cdef bint tiled(self):
+        """Whether the tiled field updates are used, which are only used for the whole grid."""
+
+        return self.tilej != 0 and self.fullregion
+
+    def flush_dispersive(self):
+        """Does the 2nd part of the dispersive update of the last iteration, if it has been deferred to the electric field update of the next iteration. Should be called after the last iteration, so that the temporary dispersive arrays are up to date."""
+
+        if self.dispersivepending:
+            if self.idbytes == 1:
+                self.update_electric_dispersive_B(self.ID8)
+            elif self.idbytes == 2:
+                self.update_electric_dispersive_B(self.ID16)
+            else:
+                self.update_electric_dispersive_B(self.ID32)
+            self.dispersivepending = False
+
+    def autotune_tiles(self, candidates, repeats=2):
+        """Times the electric and magnetic field updates with each candidate tile size and selects the fastest. Must be called before the first iteration, when all field values are zero, as the timed updates then leave them unchanged.
+
+        Args:
+            candidates (list): Tile sizes (tilej, tilek) to try. A tile size of (0, 0) selects the untiled updates.
+            repeats (int): Number of times the updates are timed with each tile size; the fastest time is used.
+
+        Returns:
+            timings (list): Time in seconds taken by the field updates of an iteration with each candidate tile size.
+        """
+
+        # Time the electric field updates of an iteration after the first, i.e. including any deferred 2nd part of the dispersive update
+        self.dispersivepending = self.deferdispersive
+
+        # Touch all the arrays once before timing
+        self.tilej, self.tilek = candidates[0]
+        self.update_fields()
+
+        timings = []
+        for tilej, tilek in candidates:
+            self.tilej, self.tilek = tilej, tilek
+            timing = []
+            for repeat in range(repeats):
+                tstart = perf_counter()
+                self.update_fields()
+                timing.append(perf_counter() - tstart)
+            timings.append(min(timing))
+        self.tilej, self.tilek = candidates[timings.index(min(timings))]
+        self.dispersivepending = False
+
+        return timings
+
+    cdef update_fields(self):
+        """Updates electric field components, including any dispersive update, and magnetic field components for timing, i.e. without the PML correction or sources."""
+
+        if self.idbytes == 1:
+            self.update_fields_id(self.ID8, self.IDH8)
+        elif self.idbytes == 2:
+            self.update_fields_id(self.ID16, self.IDH16)
+        else:
+            self.update_fields_id(self.ID32, self.IDH32)
+
+    cdef update_fields_id(self, idtype_t[:, :, :, :] ID, idtype_t[:, :, :, :] IDH):
+        """Updates electric field components, including any dispersive update, and magnetic field components with the ID arrays stored as a particular integer type.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            IDH (memoryview): IDs of the magnetic field components.
+        """
+
+        self.update_electric_fields(ID)
+        if not self.deferdispersive:
+            self.update_electric_dispersive_B(ID)
+        self.update_magnetic_fields(IDH)
+
+    cdef find_uniform_rows(self):
+        """Finds the material of each row of each tile for the tiled standard updates, which depends on the tile size in the k direction, so that rows with a single material are updated without reading the ID array."""
+
+        self.uniformE = uniform_rows(self.ID[0:3], self.nx, self.ny, self.nz, self.tilek)
+        self.uniformH = uniform_rows(self.IDH[3:6], self.nx, self.ny, self.nz, self.tilek)
+        self.uniformtilek = self.tilek
+
+    cdef find_uniform_rows_untiled(self):
+        """Finds the material of each row (over the whole grid in the k direction) for the untiled and temporally blocked standard updates, so that rows with a single material are updated without reading the ID array. A row with a single material also has a single material over any part of it, so the same rows are used when the updates are restricted to part of the grid."""
+
+        self.uniformuntiledE = uniform_rows(self.ID[0:3], self.nx, self.ny, self.nz, self.nz)[:, :, 0]
+        self.uniformuntiledH = uniform_rows(self.IDH[3:6], self.nx, self.ny, self.nz, self.nz)[:, :, 0]
+        self.uniformuntiled = True
+
+    cdef update_electric_fields(self, idtype_t[:, :, :, :] ID):
+        """Updates electric field components. If there are any dispersive materials does the 1st part of the dispersive update, preceded by the 2nd part of the dispersive update of the previous iteration if it has been deferred.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+        """
+
+        if self.sparsedispersive and self.realdispersive:
+            self.update_electric_dispersive_sparse_A(ID, self.updatecoeffsdispersivereal, self.Txsparsereal, self.Tysparsereal, self.Tzsparsereal)
+        elif self.sparsedispersive:
+            self.update_electric_dispersive_sparse_A(ID, self.updatecoeffsdispersive, self.Txsparse, self.Tysparse, self.Tzsparse)
+        elif self.maxpoles != 0 and self.realdispersive:
+            self.update_electric_dispersive_A(ID, self.updatecoeffsdispersivereal, self.Txreal, self.Tyreal, self.Tzreal)
+        elif self.maxpoles != 0:
+            self.update_electric_dispersive_A(ID, self.updatecoeffsdispersive, self.Tx, self.Ty, self.Tz)
+        # Otherwise all materials are non-dispersive so do standard update
+        else:
+            self.update_electric_standard(ID)
+
+    cdef update_electric_standard(self, idtype_t[:, :, :, :] ID):
+        """Updates electric field components with the standard update, i.e. without any dispersive update.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+        """
+
+        if not self.fullregion:
+            ID = ID[:, self.x0:, self.y0:, self.z0:]
+
+        if self.normal >= 0:
+            update_electric_2d(self.numpr, self.numqr, self.nthreads, self.coeffp, self.coeffq, self.righthanded, self.updatecoeffsE, id_plane(ID, self.normal, self.normal), self.E2Dr, self.Hp2Dr, self.Hq2Dr)
+        elif self.tiled():
+            if self.uniformtilek != self.tilek:
+                self.find_uniform_rows()
+            update_electric_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.uniformE, self.updatecoeffsE, ID, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+        elif self.fused:
+            if not self.uniformuntiled:
+                self.find_uniform_rows_untiled()
+            update_electric(self.nxr, self.nyr, self.nzr, self.nthreads, self.uniformuntiledE[self.x0:, self.y0:], self.updatecoeffsE, ID, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+        else:
+            update_ex(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, ID, self.Exr, self.Hyr, self.Hzr)
+            update_ey(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, ID, self.Eyr, self.Hxr, self.Hzr)
+            update_ez(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, ID, self.Ezr, self.Hxr, self.Hyr)
+
+    cdef update_electric_dispersive_sparse_A(self, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :] updatecoeffsdispersive, dispersivetype_t[:, :] Tx, dispersivetype_t[:, :] Ty, dispersivetype_t[:, :] Tz):
+        """Updates electric field components and does the 1st part of the dispersive update, preceded by the 2nd part of the dispersive update of the previous iteration if it has been deferred, when temporary values are only stored for the cell edges with dispersive materials.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            updatecoeffsdispersive, Tx, Ty, Tz (memoryviews): Dispersive update coefficients and temporary arrays, either real or complex.
+        """
+
+        if self.dispersivepending:
+            update_dispersive_sparse_BA(self.nthreads, self.poles, 0, updatecoeffsdispersive, ID, self.dispersivecellsEx, Tx, self.phiEx, self.Ex)
+            update_dispersive_sparse_BA(self.nthreads, self.poles, 1, updatecoeffsdispersive, ID, self.dispersivecellsEy, Ty, self.phiEy, self.Ey)
+            update_dispersive_sparse_BA(self.nthreads, self.poles, 2, updatecoeffsdispersive, ID, self.dispersivecellsEz, Tz, self.phiEz, self.Ez)
+        else:
+            update_dispersive_sparse_A(self.nthreads, self.poles, 0, updatecoeffsdispersive, ID, self.dispersivecellsEx, Tx, self.phiEx, self.Ex)
+            update_dispersive_sparse_A(self.nthreads, self.poles, 1, updatecoeffsdispersive, ID, self.dispersivecellsEy, Ty, self.phiEy, self.Ey)
+            update_dispersive_sparse_A(self.nthreads, self.poles, 2, updatecoeffsdispersive, ID, self.dispersivecellsEz, Tz, self.phiEz, self.Ez)
+        self.update_electric_standard(ID)
+        update_dispersive_sparse_phi(self.nthreads, 0, self.updatecoeffsE, ID, self.dispersivecellsEx, self.phiEx, self.Ex)
+        update_dispersive_sparse_phi(self.nthreads, 1, self.updatecoeffsE, ID, self.dispersivecellsEy, self.phiEy, self.Ey)
+        update_dispersive_sparse_phi(self.nthreads, 2, self.updatecoeffsE, ID, self.dispersivecellsEz, self.phiEz, self.Ez)
+
+    cdef update_electric_dispersive_A(self, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :] updatecoeffsdispersive, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz):
+        """Updates electric field components and does the 1st part of the dispersive update, preceded by the 2nd part of the dispersive update of the previous iteration if it has been deferred.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            updatecoeffsdispersive, Tx, Ty, Tz (memoryviews): Dispersive update coefficients and temporary arrays, either real or complex.
+        """
+
+        if not self.fullregion:
+            ID = ID[:, self.x0:, self.y0:, self.z0:]
+            Tx = Tx[:, self.x0:, self.y0:, self.z0:]
+            Ty = Ty[:, self.x0:, self.y0:, self.z0:]
+            Tz = Tz[:, self.x0:, self.y0:, self.z0:]
+
+        if self.unrolledpoles == 1:
+            if self.tiled() and self.dispersivepending:
+                update_electric_dispersive_1pole_BA_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.tiled():
+                update_electric_dispersive_1pole_A_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.dispersivepending:
+                update_ex_dispersive_1pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_1pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_1pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+            else:
+                update_ex_dispersive_1pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_1pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_1pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+        elif self.unrolledpoles == 2:
+            if self.tiled() and self.dispersivepending:
+                update_electric_dispersive_2pole_BA_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.tiled():
+                update_electric_dispersive_2pole_A_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.dispersivepending:
+                update_ex_dispersive_2pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_2pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_2pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+            else:
+                update_ex_dispersive_2pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_2pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_2pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+        elif self.unrolledpoles == 3:
+            if self.tiled() and self.dispersivepending:
+                update_electric_dispersive_3pole_BA_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.tiled():
+                update_electric_dispersive_3pole_A_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.dispersivepending:
+                update_ex_dispersive_3pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_3pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_3pole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+            else:
+                update_ex_dispersive_3pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_3pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_3pole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+        else:
+            if self.tiled() and self.dispersivepending:
+                update_electric_dispersive_multipole_BA_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.tiled():
+                update_electric_dispersive_multipole_A_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr, self.Hxr, self.Hyr, self.Hzr)
+            elif self.dispersivepending:
+                update_ex_dispersive_multipole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_multipole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_multipole_BA(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+            else:
+                update_ex_dispersive_multipole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tx, self.Exr, self.Hyr, self.Hzr)
+                update_ey_dispersive_multipole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Ty, self.Eyr, self.Hxr, self.Hzr)
+                update_ez_dispersive_multipole_A(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, self.updatecoeffsE, updatecoeffsdispersive, ID, Tz, self.Ezr, self.Hxr, self.Hyr)
+
+    cdef update_electric_dispersive_B(self, idtype_t[:, :, :, :] ID):
+        """If there are any dispersive materials does the 2nd part of the dispersive update.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+        """
+
+        if self.sparsedispersive and self.realdispersive:
+            self.update_electric_dispersive_B_sparse(ID, self.updatecoeffsdispersivereal, self.Txsparsereal, self.Tysparsereal, self.Tzsparsereal)
+        elif self.sparsedispersive:
+            self.update_electric_dispersive_B_sparse(ID, self.updatecoeffsdispersive, self.Txsparse, self.Tysparse, self.Tzsparse)
+        elif self.maxpoles != 0 and self.realdispersive:
+            self.update_electric_dispersive_B_arrays(ID, self.updatecoeffsdispersivereal, self.Txreal, self.Tyreal, self.Tzreal)
+        elif self.maxpoles != 0:
+            self.update_electric_dispersive_B_arrays(ID, self.updatecoeffsdispersive, self.Tx, self.Ty, self.Tz)
+
+    cdef update_electric_dispersive_B_sparse(self, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :] updatecoeffsdispersive, dispersivetype_t[:, :] Tx, dispersivetype_t[:, :] Ty, dispersivetype_t[:, :] Tz):
+        """Does the 2nd part of the dispersive update when temporary values are only stored for the cell edges with dispersive materials.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            updatecoeffsdispersive, Tx, Ty, Tz (memoryviews): Dispersive update coefficients and temporary arrays, either real or complex.
+        """
+
+        update_dispersive_sparse_B(self.nthreads, self.poles, 0, updatecoeffsdispersive, ID, self.dispersivecellsEx, Tx, self.Ex)
+        update_dispersive_sparse_B(self.nthreads, self.poles, 1, updatecoeffsdispersive, ID, self.dispersivecellsEy, Ty, self.Ey)
+        update_dispersive_sparse_B(self.nthreads, self.poles, 2, updatecoeffsdispersive, ID, self.dispersivecellsEz, Tz, self.Ez)
+
+    cdef update_electric_dispersive_B_arrays(self, idtype_t[:, :, :, :] ID, dispersivetype_t[:, :] updatecoeffsdispersive, dispersivetype_t[:, :, :, :] Tx, dispersivetype_t[:, :, :, :] Ty, dispersivetype_t[:, :, :, :] Tz):
+        """Does the 2nd part of the dispersive update.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            updatecoeffsdispersive, Tx, Ty, Tz (memoryviews): Dispersive update coefficients and temporary arrays, either real or complex.
+        """
+
+        if not self.fullregion:
+            ID = ID[:, self.x0:, self.y0:, self.z0:]
+            Tx = Tx[:, self.x0:, self.y0:, self.z0:]
+            Ty = Ty[:, self.x0:, self.y0:, self.z0:]
+            Tz = Tz[:, self.x0:, self.y0:, self.z0:]
+
+        if self.unrolledpoles == 1:
+            if self.tiled():
+                update_electric_dispersive_1pole_B_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr)
+            else:
+                update_ex_dispersive_1pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tx, self.Exr)
+                update_ey_dispersive_1pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Ty, self.Eyr)
+                update_ez_dispersive_1pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tz, self.Ezr)
+        elif self.unrolledpoles == 2:
+            if self.tiled():
+                update_electric_dispersive_2pole_B_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr)
+            else:
+                update_ex_dispersive_2pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tx, self.Exr)
+                update_ey_dispersive_2pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Ty, self.Eyr)
+                update_ez_dispersive_2pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tz, self.Ezr)
+        elif self.unrolledpoles == 3:
+            if self.tiled():
+                update_electric_dispersive_3pole_B_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr)
+            else:
+                update_ex_dispersive_3pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tx, self.Exr)
+                update_ey_dispersive_3pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Ty, self.Eyr)
+                update_ez_dispersive_3pole_B(self.nxr, self.nyr, self.nzr, self.nthreads, updatecoeffsdispersive, ID, Tz, self.Ezr)
+        else:
+            if self.tiled():
+                update_electric_dispersive_multipole_B_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.poles, updatecoeffsdispersive, ID, Tx, Ty, Tz, self.Exr, self.Eyr, self.Ezr)
+            else:
+                update_ex_dispersive_multipole_B(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, updatecoeffsdispersive, ID, Tx, self.Exr)
+                update_ey_dispersive_multipole_B(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, updatecoeffsdispersive, ID, Ty, self.Eyr)
+                update_ez_dispersive_multipole_B(self.nxr, self.nyr, self.nzr, self.nthreads, self.poles, updatecoeffsdispersive, ID, Tz, self.Ezr)
+
+    cdef update_magnetic_fields(self, idtype_t[:, :, :, :] IDH):
+        """Updates magnetic field components.
+
+        Args:
+            IDH (memoryview): IDs of the magnetic field components.
+        """
+
+        if not self.fullregion:
+            IDH = IDH[:, self.x0:, self.y0:, self.z0:]
+
+        if self.normal >= 0:
+            update_magnetic_2d(self.numpr, self.numqr, self.nthreads, self.coeffp, self.coeffq, self.righthanded, self.updatecoeffsH, id_plane(IDH, 3 + self.paxis, self.normal), id_plane(IDH, 3 + self.qaxis, self.normal), self.Hp2Dr, self.Hq2Dr, self.E2Dr)
+        elif self.tiled():
+            if self.uniformtilek != self.tilek:
+                self.find_uniform_rows()
+            update_magnetic_tiled(self.nxr, self.nyr, self.nzr, self.nthreads, self.tilej, self.tilek, self.uniformH, self.updatecoeffsH, IDH, self.Hxr, self.Hyr, self.Hzr, self.Exr, self.Eyr, self.Ezr)
+        elif self.fused:
+            if not self.uniformuntiled:
+                self.find_uniform_rows_untiled()
+            update_magnetic(self.nxr, self.nyr, self.nzr, self.nthreads, self.uniformuntiledH[self.x0:, self.y0:], self.updatecoeffsH, IDH, self.Hxr, self.Hyr, self.Hzr, self.Exr, self.Eyr, self.Ezr)
+        else:
+            update_hx(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsH, IDH, self.Hxr, self.Eyr, self.Ezr)
+            update_hy(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsH, IDH, self.Hyr, self.Exr, self.Ezr)
+            update_hz(self.nxr, self.nyr, self.nzr, self.nthreads, self.updatecoeffsH, IDH, self.Hzr, self.Exr, self.Eyr)
+
+    cdef store_rx_values(self, int index, int i0, int i1, int j0, int j1):
+        """Stores the field values at each receiver within planes i0 to i1 - 1 and rows j0 to j1 - 1.
+
+        Args:
+            index (int): Index of the iteration within the current block.
+            i0, i1, j0, j1 (int): Part of the grid containing the receivers to store.
+        """
+
+        cdef int r, i, j, k
+
+        for r in range(self.rxpositions.shape[0]):
+            i = self.rxpositions[r, 0]
+            j = self.rxpositions[r, 1]
+            k = self.rxpositions[r, 2]
+            if i < i0 or i >= i1 or j < j0 or j >= j1:
+                continue
+            self.rxvalues[0, r, index] = self.Ex[i, j, k]
+            self.rxvalues[1, r, index] = self.Ey[i, j, k]
+            self.rxvalues[2, r, index] = self.Ez[i, j, k]
+            self.rxvalues[3, r, index] = self.Hx[i, j, k]
+            self.rxvalues[4, r, index] = self.Hy[i, j, k]
+            self.rxvalues[5, r, index] = self.Hz[i, j, k]
+
+    cdef update_electric_sources(self, int timestep, int i0, int i1, int j0, int j1):
+        """Updates electric field values for voltage sources and Hertzian dipoles within planes i0 to i1 - 1 and rows j0 to j1 - 1.
+
+        Args:
+            timestep (int): Iteration number.
+            i0, i1, j0, j1 (int): Part of the grid containing the sources to update.
+        """
+
+        cdef int s, i, j, k
+        cdef double value
+        cdef floattype_t[:, :, :] E
+
+        for s in range(first_source(self.srcEpositions, i0), first_source(self.srcEpositions, i1)):
+            if timestep < self.srcEstart[s] or timestep >= self.srcEstop[s]:
+                continue
+            i = self.srcEpositions[s, 0]
+            j = self.srcEpositions[s, 1]
+            k = self.srcEpositions[s, 2]
+            if j < j0 or j >= j1:
+                continue
+            value = self.srcEscale[s] * self.srcEtables[self.srcEtable[s], timestep]
+            if self.srcEcomponents[s] == 0:
+                E = self.Ex
+            elif self.srcEcomponents[s] == 1:
+                E = self.Ey
+            else:
+                E = self.Ez
+            if self.srcEhard[s]:
+                E[i, j, k] = <floattype_t> (value / self.srcEfactor[s])
+            else:
+                E[i, j, k] = <floattype_t> (E[i, j, k] - value * self.srcEfactor[s])
+
+    cdef update_magnetic_sources(self, int timestep, int i0, int i1, int j0, int j1):
+        """Updates magnetic field values for magnetic dipoles within planes i0 to i1 - 1 and rows j0 to j1 - 1.
+
+        Args:
+            timestep (int): Iteration number.
+            i0, i1, j0, j1 (int): Part of the grid containing the sources to update.
+        """
+
+        cdef int s, i, j, k
+        cdef double value
+        cdef floattype_t[:, :, :] H
+
+        for s in range(first_source(self.srcHpositions, i0), first_source(self.srcHpositions, i1)):
+            if timestep < self.srcHstart[s] or timestep >= self.srcHstop[s]:
+                continue
+            i = self.srcHpositions[s, 0]
+            j = self.srcHpositions[s, 1]
+            k = self.srcHpositions[s, 2]
+            if j < j0 or j >= j1:
+                continue
+            value = self.srcHscale[s] * self.srcHtables[self.srcHtable[s], timestep]
+            if self.srcHcomponents[s] == 0:
+                H = self.Hx
+            elif self.srcHcomponents[s] == 1:
+                H = self.Hy
+            else:
+                H = self.Hz
+            H[i, j, k] = <floattype_t> (H[i, j, k] - value * self.srcHfactor[s])
+
+    cdef update_pml_electric(self, idtype_t[:, :, :, :] ID):
+        """Updates electric field components with the PML correction.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+        """
+
+        cdef PMLSlab pml
+
+        for pml in self.pmls:
+            # Slabs outside the region that the field updates are restricted to only hold zero fields
+            if not self.fullregion and not pml.overlaps(self.x0, self.y0, self.z0, self.x1, self.y1, self.z1):
+                continue
+            self.pml_electric(ID, pml, pml.xs, pml.xf, pml.ys, pml.yf, pml.zs, pml.zf, pml.EPhi1, pml.EPhi2, pml.ERA, pml.ERB, pml.ERE, pml.ERF, pml.ERC, pml.ERD)
+
+    cdef update_pml_region(self, idtype_t[:, :, :, :] ID, bint electric, int i0, int i1, int j0, int j1):
+        """Updates electric or magnetic field components with the PML correction within planes i0 to i1 - 1 and rows j0 to j1 - 1.
+
+        Args:
+            ID (memoryview): IDs of the electric or magnetic field components.
+            electric (bint): Update electric, rather than magnetic, field components.
+            i0, i1, j0, j1 (int): Part of the grid to update.
+        """
+
+        cdef PMLSlab pml
+        cdef int xs, xf, ys, yf, ri, rj, r
+
+        for pml in self.pmls:
+            if not restrict_pml_range(pml.xs, pml.xf, i0, i1, pml.direction == XMINUS, 0 if electric else 1, &xs, &xf, &ri):
+                continue
+            if not restrict_pml_range(pml.ys, pml.yf, j0, j1, pml.direction == YMINUS, 0 if electric else 1, &ys, &yf, &rj):
+                continue
+            # Offset into the arrays of coefficients, which vary in the stretching direction only
+            if pml.direction == XMINUS or pml.direction == XPLUS:
+                r = ri
+            elif pml.direction == YMINUS or pml.direction == YPLUS:
+                r = rj
+            else:
+                r = 0
+            if electric:
+                self.pml_electric(ID, pml, xs, xf, ys, yf, pml.zs, pml.zf, pml.EPhi1[:, ri:, rj:, :], pml.EPhi2[:, ri:, rj:, :], pml.ERA[:, r:], pml.ERB[:, r:], pml.ERE[:, r:], pml.ERF[:, r:], pml.ERC[r:], pml.ERD[:, r:])
+            else:
+                self.pml_magnetic(ID, pml, xs, xf, ys, yf, pml.zs, pml.zf, pml.HPhi1[:, ri:, rj:, :], pml.HPhi2[:, ri:, rj:, :], pml.HRA[:, r:], pml.HRB[:, r:], pml.HRE[:, r:], pml.HRF[:, r:], pml.HRC[r:], pml.HRD[:, r:])
+
+    cdef pml_electric(self, idtype_t[:, :, :, :] ID, PMLSlab pml, int xs, int xf, int ys, int yf, int zs, int zf, floattype_t[:, :, :, :] Phi1, floattype_t[:, :, :, :] Phi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD):
+        """Updates electric field components with the PML correction of a slab, or of part of a slab.
+
+        Args:
+            ID (memoryview): IDs of the electric field components.
+            pml (PMLSlab): PML slab.
+            xs, xf, ys, yf, zs, zf (int): Cell coordinates of the part of the slab to update.
+            Phi1, Phi2, RA, RB, RE, RF, RC, RD (memoryviews): PML coefficient arrays, starting at the part of the slab to update.
+        """
+
+        cdef int nthreads = pml_threads(self.nthreads, xs, xf, ys, yf, zs, zf)
+
+        if pml.direction == XMINUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Ez, self.Hy, self.Hz, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.E1:
+                update_pml_ey_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Hz, Phi1, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.E2:
+                update_pml_ez_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ez, self.Hy, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+        elif pml.direction == XPLUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Ez, self.Hy, self.Hz, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.E1:
+                update_pml_ey_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Hz, Phi1, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.E2:
+                update_pml_ez_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ez, self.Hy, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+        elif pml.direction == YMINUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Ez, self.Hx, self.Hz, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.E1:
+                update_pml_ex_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Hz, Phi1, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.E2:
+                update_pml_ez_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ez, self.Hx, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+        elif pml.direction == YPLUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Ez, self.Hx, self.Hz, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.E1:
+                update_pml_ex_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Hz, Phi1, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.E2:
+                update_pml_ez_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ez, self.Hx, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+        elif pml.direction == ZMINUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Ey, self.Hx, self.Hy, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.E1:
+                update_pml_ex_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Hy, Phi1, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.E2:
+                update_pml_ey_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Hx, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+        elif pml.direction == ZPLUS:
+            if pml.E1 and pml.E2:
+                update_pml_electric_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Ey, self.Hx, self.Hy, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.E1:
+                update_pml_ex_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ex, self.Hy, Phi1, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.E2:
+                update_pml_ey_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsE, ID, self.Ey, self.Hx, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+
+    cdef update_pml_magnetic(self, idtype_t[:, :, :, :] IDH):
+        """Updates magnetic field components with the PML correction.
+
+        Args:
+            IDH (memoryview): IDs of the magnetic field components.
+        """
+
+        cdef PMLSlab pml
+
+        for pml in self.pmls:
+            # Slabs outside the region that the field updates are restricted to only hold zero fields
+            if not self.fullregion and not pml.overlaps(self.x0, self.y0, self.z0, self.x1, self.y1, self.z1):
+                continue
+            self.pml_magnetic(IDH, pml, pml.xs, pml.xf, pml.ys, pml.yf, pml.zs, pml.zf, pml.HPhi1, pml.HPhi2, pml.HRA, pml.HRB, pml.HRE, pml.HRF, pml.HRC, pml.HRD)
+
+    cdef pml_magnetic(self, idtype_t[:, :, :, :] IDH, PMLSlab pml, int xs, int xf, int ys, int yf, int zs, int zf, floattype_t[:, :, :, :] Phi1, floattype_t[:, :, :, :] Phi2, floattype_t[:, :] RA, floattype_t[:, :] RB, floattype_t[:, :] RE, floattype_t[:, :] RF, double[:] RC, floattype_t[:, :] RD):
+        """Updates magnetic field components with the PML correction of a slab, or of part of a slab.
+
+        Args:
+            IDH (memoryview): IDs of the magnetic field components.
+            pml (PMLSlab): PML slab.
+            xs, xf, ys, yf, zs, zf (int): Cell coordinates of the part of the slab to update.
+            Phi1, Phi2, RA, RB, RE, RF, RC, RD (memoryviews): PML coefficient arrays, starting at the part of the slab to update.
+        """
+
+        cdef int nthreads = pml_threads(self.nthreads, xs, xf, ys, yf, zs, zf)
+
+        if pml.direction == XMINUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Hz, self.Ey, self.Ez, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.H1:
+                update_pml_hy_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Ez, Phi1, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.H2:
+                update_pml_hz_xminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hz, self.Ey, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+        elif pml.direction == XPLUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Hz, self.Ey, self.Ez, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.H1:
+                update_pml_hy_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Ez, Phi1, RA, RB, RE, RF, RC, RD, self.dx)
+            elif pml.H2:
+                update_pml_hz_xplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hz, self.Ey, Phi2, RA, RB, RE, RF, RC, RD, self.dx)
+        elif pml.direction == YMINUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Hz, self.Ex, self.Ez, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.H1:
+                update_pml_hx_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Ez, Phi1, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.H2:
+                update_pml_hz_yminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hz, self.Ex, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+        elif pml.direction == YPLUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Hz, self.Ex, self.Ez, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.H1:
+                update_pml_hx_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Ez, Phi1, RA, RB, RE, RF, RC, RD, self.dy)
+            elif pml.H2:
+                update_pml_hz_yplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hz, self.Ex, Phi2, RA, RB, RE, RF, RC, RD, self.dy)
+        elif pml.direction == ZMINUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Hy, self.Ex, self.Ey, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.H1:
+                update_pml_hx_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Ey, Phi1, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.H2:
+                update_pml_hy_zminus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Ex, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+        elif pml.direction == ZPLUS:
+            if pml.H1 and pml.H2:
+                update_pml_magnetic_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Hy, self.Ex, self.Ey, Phi1, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.H1:
+                update_pml_hx_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hx, self.Ey, Phi1, RA, RB, RE, RF, RC, RD, self.dz)
+            elif pml.H2:
+                update_pml_hy_zplus(xs, xf, ys, yf, zs, zf, nthreads, self.updatecoeffsH, IDH, self.Hy, self.Ex, Phi2, RA, RB, RE, RF, RC, RD, self.dz)
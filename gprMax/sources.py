@@ -54,19 +54,19 @@ class VoltageSource:
             k = self.positionz
             waveform = next(x for x in G.waveforms if x.ID == self.waveformID)
             
-            if self.polarisation is 'x':
+            if self.polarisation == 'x':
                 if self.resistance != 0:
                     Ex[i, j, k] -= updatecoeffsE[ID[0, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (self.resistance * G.dy * G.dz))
                 else:
                     Ex[i, j, k] = -1 * waveform.amp * waveform.calculate_value(time, G.dt) / G.dx
 
-            elif self.polarisation is 'y':
+            elif self.polarisation == 'y':
                 if self.resistance != 0:
                     Ey[i, j, k] -= updatecoeffsE[ID[1, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (self.resistance * G.dx * G.dz))
                 else:
                     Ey[i, j, k] = -1 * waveform.amp * waveform.calculate_value(time, G.dt) / G.dy
 
-            elif self.polarisation is 'z':
+            elif self.polarisation == 'z':
                 if self.resistance != 0:
                     Ez[i, j, k] -= updatecoeffsE[ID[2, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (self.resistance * G.dx * G.dy))
                 else:
@@ -105,13 +105,13 @@ class HertzianDipole:
             k = self.positionz
             waveform = next(x for x in G.waveforms if x.ID == self.waveformID)
             
-            if self.polarisation is 'x':
+            if self.polarisation == 'x':
                 Ex[i, j, k] -= updatecoeffsE[ID[0, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (G.dy * G.dz))
 
-            elif self.polarisation is 'y':
+            elif self.polarisation == 'y':
                 Ey[i, j, k] -= updatecoeffsE[ID[1, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (G.dx * G.dz))
 
-            elif self.polarisation is 'z':
+            elif self.polarisation == 'z':
                 Ez[i, j, k] -= updatecoeffsE[ID[2, i, j, k], 4] * waveform.amp * waveform.calculate_value(time, G.dt) * (1 / (G.dx * G.dy))
 
 
@@ -147,12 +147,12 @@ class MagneticDipole:
             k = self.positionz
             waveform = next(x for x in G.waveforms if x.ID == self.waveformID)
             
-            if self.polarisation is 'x':
+            if self.polarisation == 'x':
                 Hx[i, j, k] -= waveform.amp  * waveform.calculate_value(time, G.dt) * (G.dt / (G.dx * G.dy * G.dz))
 
-            elif self.polarisation is 'y':
+            elif self.polarisation == 'y':
                 Hy[i, j, k] -= waveform.amp  * waveform.calculate_value(time, G.dt) * (G.dt / (G.dx * G.dy * G.dz))
 
-            elif self.polarisation is 'z':
+            elif self.polarisation == 'z':
                 Hz[i, j, k] -= waveform.amp  * waveform.calculate_value(time, G.dt) * (G.dt / (G.dx * G.dy * G.dz))
 
@@ -0,0 +1,119 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from .exceptions import CmdInputError
+
+
+class SteadyState:
+    """Phasors of the field components at the receivers, at the frequency of continuous sine wave sources, found for each period of the sources to detect when the fields reach steady state."""
+
+    def __init__(self, tolerance, G):
+        """
+        Args:
+            tolerance (float): Change in the amplitude (relative) and phase (radians) of the phasors between periods below which the fields are in steady state.
+            G (class): Grid class instance - holds essential parameters describing the model.
+        """
+
+        if not G.rxs:
+            raise CmdInputError('#steady_state requires at least one #rx')
+
+        sources = G.voltagesources + G.hertziandipoles + G.magneticdipoles
+        waveforms = [next(waveform for waveform in G.waveforms if waveform.ID == source.waveformID) for source in sources]
+        if not sources or any(waveform.type != 'contsine' for waveform in waveforms):
+            raise CmdInputError('#steady_state requires all sources to use contsine waveforms')
+        if len(set(waveform.freq for waveform in waveforms)) > 1:
+            raise CmdInputError('#steady_state requires all the contsine waveforms to have the same frequency')
+
+        self.frequency = waveforms[0].freq
+        self.tolerance = tolerance
+        self.dt = G.dt
+
+        # Number of iterations in a period of the sources, which is usually not a whole number
+        self.period = int(round(1 / (self.frequency * G.dt)))
+        if self.period < 4:
+            raise CmdInputError('#steady_state requires at least four iterations per period of the contsine waveforms')
+
+        # The amplitude of contsine waveforms ramps up over the first four periods, so only periods after that are compared
+        self.rampend = int(np.ceil((max(source.start for source in sources) + 4 / self.frequency) / G.dt))
+
+        # Field component values at the receivers for the current period
+        self.values = np.zeros((6, len(G.rxs), self.period))
+        self.periodstart = 0
+
+        # Phasors (Ex, Ey, Ez, Hx, Hy, Hz) indexed by component and receiver for the last complete period, and the last period after the ramp before that
+        self.phasors = None
+        self.previous = None
+        self.converged = False
+
+    def update(self, start, stop, rxvalues):
+        """Adds a block of stored field component values at receivers, finding the phasors for each period that is completed.
+
+        Args:
+            start (int): Iteration number of the first values in the block.
+            stop (int): One past the iteration number of the last values in the block.
+            rxvalues (memory view): numpy array of field component values (Ex, Ey, Ez, Hx, Hy, Hz) indexed by component, receiver and iteration within the block.
+        """
+
+        rxvalues = np.asarray(rxvalues)
+        timestep = start
+        while timestep < stop:
+            offset = timestep - self.periodstart
+            count = min(stop - timestep, self.period - offset)
+            self.values[:, :, offset:offset + count] = rxvalues[:, :, timestep - start:timestep - start + count]
+            timestep += count
+            if offset + count == self.period:
+                self.fit_period()
+                self.periodstart += self.period
+
+    def fit_period(self):
+        """Finds the phasors for the current period and checks whether they have converged."""
+
+        # Magnetic field values are stored half a time step before the electric field values, i.e. at (n - 1/2)dt
+        time = (self.periodstart + np.arange(self.period)) * self.dt
+        self.phasors = np.concatenate((self.fit(self.values[:3], time), self.fit(self.values[3:], time - self.dt / 2)))
+
+        if self.periodstart < self.rampend:
+            return
+
+        # Components with amplitudes that are negligible compared to the largest are not compared
+        if self.previous is not None:
+            amplitude = np.abs(self.phasors)
+            significant = amplitude > self.tolerance * amplitude.max()
+            amplitudechange = np.abs(amplitude - np.abs(self.previous)) <= self.tolerance * amplitude
+            phasechange = np.abs(np.angle(self.phasors * np.conj(self.previous))) <= self.tolerance
+            self.converged = amplitude.max() > 0 and bool(np.all((amplitudechange & phasechange)[significant]))
+        self.previous = self.phasors
+
+    def fit(self, values, time):
+        """Least squares fit of a.cos(wt) + b.sin(wt) to field component values over a period, which is exact for a sine wave even though the period is not a whole number of iterations.
+
+        Args:
+            values (array): Field component values indexed by component, receiver and iteration within the period.
+            time (array): Time of the values for each iteration within the period.
+
+        Returns:
+            (array): Phasors (a - jb) indexed by component and receiver.
+        """
+
+        cos = np.cos(2 * np.pi * self.frequency * time)
+        sin = np.sin(2 * np.pi * self.frequency * time)
+        matrix = np.array([[np.dot(cos, cos), np.dot(cos, sin)], [np.dot(cos, sin), np.dot(sin, sin)]])
+        a, b = np.linalg.solve(matrix, np.stack((np.dot(values, cos), np.dot(values, sin))).reshape(2, -1))
+        return (a - 1j * b).reshape(values.shape[:2])
@@ -117,3 +117,20 @@ def human_size(size, a_kilobyte_is_1024_bytes=True):
     raise ValueError('Number is too large.')
 
 
+def peak_memory():
+    """Get the peak memory (resident set size) used by the process so far.
+
+    Returns:
+        Peak memory in bytes (int), or None if it is not available (on Microsoft Windows).
+    """
+
+    if sys.platform == 'win32':
+        return None
+
+    import resource
+    # Linux reports the peak memory in kilobytes, and Mac OS X in bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        peak *= 1024
+
+    return peak
@@ -18,8 +18,6 @@
 
 import numpy as np
 
-from .utilities import rvalue
-
 
 class Waveform:
     """Definitions of waveform shapes that can be used with sources."""
@@ -43,10 +41,23 @@ class Waveform:
         Returns:
             waveform (float): Calculated value for waveform.
         """
-        
+
+        return self.calculate_values(np.array([time], dtype=np.float64), dt)[0]
+
+    def calculate_values(self, times, dt):
+        """Calculates values of the waveform at a set of times, e.g. every iteration of a model.
+
+        Args:
+            times (array): Absolute times.
+            dt (float): Absolute time discretisation.
+
+        Returns:
+            waveform (array): Calculated values for waveform.
+        """
+
         chi = 1 / self.freq
         zeta = 2 * np.pi * np.pi * self.freq * self.freq
-        delay = time - chi
+        delay = times - chi
         
         if self.type == 'gaussian':
             waveform = np.exp(-zeta * delay * delay)
@@ -73,30 +84,23 @@ class Waveform:
             waveform = - (2 * zeta * (2 * zeta * delay * delay - 1) * np.exp(-zeta * delay * delay)) * normalise
 
         elif self.type == 'sine':
-            waveform = np.sin(2 * np.pi * self.freq * time)
-            if time * self.freq > 1:
-                waveform = 0
+            waveform = np.sin(2 * np.pi * self.freq * times)
+            waveform[times * self.freq > 1] = 0
                 
         elif self.type == 'contsine':
             rampamp = 0.25
-            ramp = rampamp * time * self.freq
-            if ramp > 1:
-                ramp = 1
-            waveform = ramp * np.sin(2 * np.pi * self.freq * time)
+            ramp = np.minimum(rampamp * times * self.freq, 1)
+            waveform = ramp * np.sin(2 * np.pi * self.freq * times)
 
         elif self.type == 'impulse':
             # time < G.dt condition required to do impulsive magnetic dipole
-            if time == 0 or time < dt:
-                waveform = 1
-            elif time >= dt:
-                waveform = 0
+            waveform = np.where((times == 0) | (times < dt), 1.0, 0.0)
         
         elif self.type == 'user':
-            index = rvalue(time / dt)
-            # Check to see if there are still user specified values and if not use zero
-            if index > len(self.uservalues) - 1:
-                waveform = 0
-            else:
-                waveform = self.uservalues[index]
+            # Indices rounded with half values downward, the same as utilities.rvalue but for all the times at once. Use zero once there are no more user specified values.
+            indices = np.ceil(times / dt - 0.5).astype(int)
+            waveform = np.zeros(len(times))
+            available = indices < len(self.uservalues)
+            waveform[available] = self.uservalues[indices[available]]
         
-        return waveform
\ No newline at end of file
+        return waveform
@@ -22,7 +22,7 @@ from .materials import Material
 from .yee_cell_setget_rigid cimport get_rigid_Ex, get_rigid_Ey, get_rigid_Ez, get_rigid_Hx, get_rigid_Hy, get_rigid_Hz
 
 
-cpdef build_ex_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_ex_component(np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Ex components in the ID array.
         
     Args:
@@ -75,7 +75,7 @@ cpdef build_ex_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigid
                             G.materials.append(m)
                             ID[0, i, j, k] = newNumID
 
-cpdef build_ey_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_ey_component(np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Ey components in the ID array.
         
     Args:
@@ -128,7 +128,7 @@ cpdef build_ey_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigid
                             G.materials.append(m)
                             ID[1, i, j, k] = newNumID
 
-cpdef build_ez_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_ez_component(np.uint32_t[:, :, :] solid, np.uint16_t[:, :, :] rigidE, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Ez components in the ID array.
         
     Args:
@@ -181,7 +181,7 @@ cpdef build_ez_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigid
                             G.materials.append(m)
                             ID[2, i, j, k] = newNumID
 
-cpdef build_hx_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_hx_component(np.uint32_t[:, :, :] solid, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Hx components in the ID array.
         
     Args:
@@ -231,7 +231,7 @@ cpdef build_hx_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigid
                             G.materials.append(m)
                             ID[3, i, j, k] = newNumID
 
-cpdef build_hy_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_hy_component(np.uint32_t[:, :, :] solid, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Hy components in the ID array.
         
     Args:
@@ -281,7 +281,7 @@ cpdef build_hy_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigid
                             G.materials.append(m)
                             ID[4, i, j, k] = newNumID
 
-cpdef build_hz_component(np.uint32_t[:, :, :] solid, np.int8_t[:, :, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
+cpdef build_hz_component(np.uint32_t[:, :, :] solid, np.uint8_t[:, :, :] rigidH, np.uint32_t[:, :, :, :] ID, G):
     """This function builds the Hz components in the ID array.
         
     Args:
@@ -19,139 +19,139 @@
 import numpy as np
 cimport numpy as np
 
-# Get and set functions for the rigid electric component array. The rigid array is 4D with the 1st dimension holding
+# Get and set functions for the rigid electric component array. The rigid array is 3D with bits 0 to 11 of each element holding
 # the 12 electric edge components of a cell - Ex1, Ex2, Ex3, Ex4, Ey1, Ey2, Ey3, Ey4, Ez1, Ez2, Ez3, Ez4
-cdef bint get_rigid_Ex(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
+cdef bint get_rigid_Ex(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
     cdef bint result
     result = False
-    if rigidE[0, i, j, k]:
+    if rigidE[i, j, k] & (1 << 0):
         result = True
     if j != 0:
-        if rigidE[1, i, j - 1, k]:
+        if rigidE[i, j - 1, k] & (1 << 1):
             result = True
     if k != 0:
-        if rigidE[3, i, j, k - 1]:
+        if rigidE[i, j, k - 1] & (1 << 3):
             result = True
     if j != 0 and k != 0:
-        if rigidE[2, i, j - 1, k - 1]:
+        if rigidE[i, j - 1, k - 1] & (1 << 2):
             result = True
     return result
 
-cdef bint get_rigid_Ey(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
+cdef bint get_rigid_Ey(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
     cdef bint result
     result = False
-    if rigidE[4, i, j, k]:
+    if rigidE[i, j, k] & (1 << 4):
         result = True
     if i != 0:
-        if rigidE[7, i - 1, j, k]:
+        if rigidE[i - 1, j, k] & (1 << 7):
             result = True
     if k != 0:
-        if rigidE[5, i, j, k - 1]:
+        if rigidE[i, j, k - 1] & (1 << 5):
             result = True
     if i != 0 and k != 0:
-        if rigidE[6, i - 1, j, k - 1]:
+        if rigidE[i - 1, j, k - 1] & (1 << 6):
             result = True
     return result
 
-cdef bint get_rigid_Ez(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
+cdef bint get_rigid_Ez(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
     cdef bint result
     result = False
-    if rigidE[8, i, j, k]:
+    if rigidE[i, j, k] & (1 << 8):
         result = True
     if i != 0:
-        if rigidE[9, i - 1, j, k]:
+        if rigidE[i - 1, j, k] & (1 << 9):
             result = True
     if j != 0:
-        if rigidE[11, i, j - 1, k]:
+        if rigidE[i, j - 1, k] & (1 << 11):
             result = True
     if i != 0 and j != 0:
-        if rigidE[10, i - 1, j - 1, k]:
+        if rigidE[i - 1, j - 1, k] & (1 << 10):
             result = True
     return result
 
-cdef void set_rigid_Ex(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
-    rigidE[0, i, j, k] = True
+cdef void set_rigid_Ex(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
+    rigidE[i, j, k] |= 1 << 0
     if j != 0:
-        rigidE[1, i, j - 1, k] = True
+        rigidE[i, j - 1, k] |= 1 << 1
     if k != 0:
-        rigidE[3, i, j, k - 1] = True
+        rigidE[i, j, k - 1] |= 1 << 3
     if j != 0 and k != 0:
-        rigidE[2, i, j - 1, k - 1] = True
+        rigidE[i, j - 1, k - 1] |= 1 << 2
 
-cdef void set_rigid_Ey(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
-    rigidE[4, i, j, k] = True
+cdef void set_rigid_Ey(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
+    rigidE[i, j, k] |= 1 << 4
     if i != 0:
-        rigidE[7, i - 1, j, k] = True
+        rigidE[i - 1, j, k] |= 1 << 7
     if k != 0:
-        rigidE[5, i, j, k - 1] = True
+        rigidE[i, j, k - 1] |= 1 << 5
     if i != 0 and k != 0:
-        rigidE[6, i - 1, j, k - 1] = True
+        rigidE[i - 1, j, k - 1] |= 1 << 6
 
-cdef void set_rigid_Ez(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
-    rigidE[8, i, j, k] = True
+cdef void set_rigid_Ez(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
+    rigidE[i, j, k] |= 1 << 8
     if i != 0:
-        rigidE[9, i - 1, j, k] = True
+        rigidE[i - 1, j, k] |= 1 << 9
     if j != 0:
-        rigidE[11, i, j - 1, k] = True
+        rigidE[i, j - 1, k] |= 1 << 11
     if i != 0 and j != 0:
-        rigidE[10, i - 1, j - 1, k] = True
+        rigidE[i - 1, j - 1, k] |= 1 << 10
 
-cdef void set_rigid_E(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
-    rigidE[:, i, j, k] = True
+cdef void set_rigid_E(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
+    rigidE[i, j, k] = (1 << 12) - 1
 
-cdef void unset_rigid_E(int i, int j, int k, np.int8_t[:, :, :, :] rigidE):
-    rigidE[:, i, j, k] = False
+cdef void unset_rigid_E(int i, int j, int k, np.uint16_t[:, :, :] rigidE):
+    rigidE[i, j, k] = 0
 
-# Get and set functions for the rigid magnetic component array. The rigid array is 4D with the 1st dimension holding
+# Get and set functions for the rigid magnetic component array. The rigid array is 3D with bits 0 to 5 of each element holding
 # the 6 magnetic edge components - Hx1, Hx2, Hy1, Hy2, Hz1, Hz2
-cdef bint get_rigid_Hx(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
+cdef bint get_rigid_Hx(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
     cdef bint result
     result = False
-    if rigidH[0, i, j, k]:
+    if rigidH[i, j, k] & (1 << 0):
         result = True
     if i != 0:
-        if rigidH[1, i - 1, j, k]:
+        if rigidH[i - 1, j, k] & (1 << 1):
             result = True
     return result
 
-cdef bint get_rigid_Hy(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
+cdef bint get_rigid_Hy(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
     cdef bint result
     result = False
-    if rigidH[2, i, j, k]:
+    if rigidH[i, j, k] & (1 << 2):
         result = True
     if j != 0:
-        if rigidH[3, i, j - 1, k]:
+        if rigidH[i, j - 1, k] & (1 << 3):
             result = True
     return result
 
-cdef bint get_rigid_Hz(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
+cdef bint get_rigid_Hz(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
     cdef bint result
     result = False
-    if rigidH[4, i, j, k]:
+    if rigidH[i, j, k] & (1 << 4):
         result = True
     if k != 0:
-        if rigidH[5, i, j, k - 1]:
+        if rigidH[i, j, k - 1] & (1 << 5):
             result = True
     return result
 
-cdef void set_rigid_Hx(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
-    rigidH[0, i, j, k] = True
+cdef void set_rigid_Hx(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
+    rigidH[i, j, k] |= 1 << 0
     if i != 0:
-        rigidH[1, i - 1, j, k] = True
+        rigidH[i - 1, j, k] |= 1 << 1
 
-cdef void set_rigid_Hy(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
-    rigidH[2, i, j, k] = True
+cdef void set_rigid_Hy(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
+    rigidH[i, j, k] |= 1 << 2
     if j != 0:
-        rigidH[3, i, j - 1, k] = True
+        rigidH[i, j - 1, k] |= 1 << 3
 
-cdef void set_rigid_Hz(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
-    rigidH[4, i, j, k] = True
+cdef void set_rigid_Hz(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
+    rigidH[i, j, k] |= 1 << 4
     if k != 0:
-        rigidH[5, i, j, k - 1] = True
+        rigidH[i, j, k - 1] |= 1 << 5
 
-cdef void set_rigid_H(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
-    rigidH[:, i, j, k] = True
+cdef void set_rigid_H(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
+    rigidH[i, j, k] = (1 << 6) - 1
 
-cdef void unset_rigid_H(int i, int j, int k, np.int8_t[:, :, :, :] rigidH):
-    rigidH[:, i, j, k] = False
+cdef void unset_rigid_H(int i, int j, int k, np.uint8_t[:, :, :] rigidH):
+    rigidH[i, j, k] = 0
 
@@ -0,0 +1,41 @@
+import sys
+import h5py
+import numpy as np
+
+"""Compare the field outputs of a model using a PML with three CFS terms with a reference model in a domain large enough that nothing reflected from its PML reaches the receivers
+
+Usage:
+    cd gprMax
+    python -m gprMax tests/pml/pml_3cfs/pml_3cfs.in
+    python -m gprMax tests/pml/pml_3cfs/pml_3cfs_ref.in
+    python -m tests.test_compare_pml tests/pml/pml_3cfs/pml_3cfs.out tests/pml/pml_3cfs/pml_3cfs_ref.out
+
+"""
+
+modelfile = sys.argv[1]
+reffile = sys.argv[2]
+fields = ['Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz']
+threshold = 2e-2 # Largest reflection from the PML expected, relative to the largest electric or magnetic field at the receiver
+
+f = h5py.File(modelfile, 'r')
+nrx = f.attrs['nrx']
+model = np.array([[f['/rxs/rx' + str(rx + 1) + '/' + name][:] for name in fields] for rx in range(nrx)])
+f.close()
+
+f = h5py.File(reffile, 'r')
+ref = np.array([[f['/rxs/rx' + str(rx + 1) + '/' + name][:] for name in fields] for rx in range(nrx)])
+f.close()
+
+# Differences relative to the largest value of the electric or magnetic field in the reference at each receiver
+failed = False
+for rx in range(nrx):
+    for component, name in enumerate(fields):
+        largest = np.abs(ref[rx, 3 * (component // 3):3 * (component // 3) + 3]).max()
+        diff = np.abs(model[rx, component] - ref[rx, component]).max() / largest
+        print('rx{} {}: largest difference to reference {:.2e}'.format(rx + 1, name, diff))
+        if diff > threshold:
+            failed = True
+
+if failed:
+    sys.exit('Reflections from the PML are larger than expected')
+print('Reflections from the PML are within the expected range')
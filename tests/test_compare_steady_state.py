@@ -0,0 +1,78 @@
+import sys
+import h5py
+import numpy as np
+
+"""Compare the phasors written by a model using #steady_state with least squares fits to the field outputs of the same model run for the full time window
+
+Usage:
+    cd gprMax
+    python -m gprMax tests/steady_state/contsine_fs/contsine_fs.in
+    python -m gprMax tests/steady_state/contsine_fs/contsine_fs_full.in
+    python -m tests.test_compare_steady_state tests/steady_state/contsine_fs/contsine_fs.out tests/steady_state/contsine_fs/contsine_fs_full.out
+
+"""
+
+steadyfile = sys.argv[1]
+fullfile = sys.argv[2]
+fields = ['Ex', 'Ey', 'Ez', 'Hx', 'Hy', 'Hz']
+
+
+def fit_phasor(values, frequency, time):
+    """Least squares fit of a.cos(wt) + b.sin(wt) to field component values.
+
+    Args:
+        values (array): Field component values.
+        frequency (float): Frequency of the sine wave.
+        time (array): Time of each of the values.
+
+    Returns:
+        (complex): Phasor (a - jb).
+    """
+
+    w = 2 * np.pi * frequency
+    (a, b), *_ = np.linalg.lstsq(np.stack((np.cos(w * time), np.sin(w * time)), axis=1), values, rcond=None)
+    return a - 1j * b
+
+
+# Phasors written by the model using #steady_state, which are for the last complete period that was run
+f = h5py.File(steadyfile, 'r')
+frequency = f.attrs['Phasor frequency']
+dt = f.attrs['dt']
+nrx = f.attrs['nrx']
+period = int(round(1 / (frequency * dt)))
+periodend = (f.attrs['Iterations'] // period) * period
+print('Steady state reached: {}, after {} iterations, phasors at {:g} Hz over iterations {} to {}'.format(bool(f.attrs['Steady state']), f.attrs['Iterations'], frequency, periodend - period, periodend))
+steady = np.array([[f['/rxs/rx' + str(rx + 1) + '/Phasors/' + name][()] for name in fields] for rx in range(nrx)])
+f.close()
+
+# Least squares fits to the same period, and to the last complete period, of the model run for the full time window.
+# Magnetic field values are stored half a time step before the electric field values, i.e. at (n - 1/2)dt
+f = h5py.File(fullfile, 'r')
+fullend = (f.attrs['Iterations'] // period) * period
+same = np.zeros((nrx, len(fields)), dtype=complex)
+last = np.zeros((nrx, len(fields)), dtype=complex)
+for rx in range(nrx):
+    for component, name in enumerate(fields):
+        values = f['/rxs/rx' + str(rx + 1) + '/' + name][:]
+        offset = 0.5 if name[0] == 'H' else 0
+        same[rx, component] = fit_phasor(values[periodend - period:periodend], frequency, (np.arange(periodend - period, periodend) - offset) * dt)
+        last[rx, component] = fit_phasor(values[fullend - period:fullend], frequency, (np.arange(fullend - period, fullend) - offset) * dt)
+f.close()
+
+# Differences relative to the largest phasor of the electric or magnetic field at each receiver, ignoring components with negligible amplitudes
+thresholds = {'same': 1e-5, 'last': 1e-2} # Largest differences expected with a fit to the same period, and to the last period of the full run
+failed = False
+for rx in range(nrx):
+    for component, name in enumerate(fields):
+        largest = np.abs(steady[rx, 3 * (component // 3):3 * (component // 3) + 3]).max()
+        if np.abs(steady[rx, component]) < 1e-3 * largest:
+            continue
+        diffsame = np.abs(steady[rx, component] - same[rx, component]) / largest
+        difflast = np.abs(steady[rx, component] - last[rx, component]) / largest
+        print('rx{} {}: phasor {:.4e}, difference to same period {:.2e}, to last period of full run {:.2e}'.format(rx + 1, name, steady[rx, component], diffsame, difflast))
+        if diffsame > thresholds['same'] or difflast > thresholds['last']:
+            failed = True
+
+if failed:
+    sys.exit('Phasors differ from the least squares fits to the full run')
+print('Phasors match the least squares fits to the full run')
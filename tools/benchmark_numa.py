@@ -0,0 +1,146 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse, os
+from time import perf_counter
+
+import numpy as np
+
+from gprMax.constants import c, floattype
+from gprMax.grid import FDTDGrid
+from gprMax.materials import Material
+from gprMax.numa import pin_threads
+from gprMax.pml import build_pml, calculate_initial_pml_params
+from gprMax.receivers import Rx
+from gprMax.solver import FDTDSolver
+from gprMax.sources import HertzianDipole
+from gprMax.waveforms import Waveform
+from gprMax.yee_cell_build import build_ex_component, build_ey_component, build_ez_component, build_hx_component, build_hy_component, build_hz_component
+
+
+"""Benchmarks the time per iteration of the compiled solver when the field, ID and dispersive arrays are allocated by a single thread, and when each part of them is first written by the thread that updates it (first touch)."""
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description='Benchmarks the time per iteration of the compiled solver with arrays allocated by a single thread and with first touch allocation.', usage='cd gprMax; python -m tools.benchmark_numa')
+parser.add_argument('-sizes', type=int, nargs='+', default=[100, 200, 300], help='number of cells in each direction of the (cubic) test models')
+parser.add_argument('-iterations', type=int, default=50, help='number of iterations to run')
+parser.add_argument('-nthreads', type=int, default=os.cpu_count(), help='number of OpenMP threads to use')
+parser.add_argument('-affinity', choices=['close', 'spread'], default=None, help='pin each thread to a CPU, either consecutive CPUs or spread evenly over the available CPUs')
+args = parser.parse_args()
+
+
+def build_model(n, iterations, nthreads, firsttouch):
+    """Builds a free space model with a PML, a Hertzian dipole source and a receiver.
+
+    Args:
+        n (int): Number of cells in each direction.
+        iterations (int): Number of iterations.
+        nthreads (int): Number of OpenMP threads.
+        firsttouch (bool): Allocate arrays with each part first written by the thread that updates it.
+
+    Returns:
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    G = FDTDGrid()
+    G.messages = False
+    G.nx = G.ny = G.nz = n
+    G.dx = G.dy = G.dz = 1e-3
+    G.dt = 1 / (c * np.sqrt((1 / G.dx) * (1 / G.dx) + (1 / G.dy) * (1 / G.dy) + (1 / G.dz) * (1 / G.dz)))
+    G.iterations = iterations
+    G.nthreads = nthreads
+    G.firsttouch = firsttouch
+    G.pmlthickness = (min(10, n // 4),) * 6
+    G.initialise_std_arrays()
+
+    m = Material(0, 'pec', G)
+    m.average = False
+    G.materials.append(m)
+    m = Material(1, 'free_space', G)
+    G.materials.append(m)
+
+    build_pml(G)
+    calculate_initial_pml_params(G)
+    build_ex_component(G.solid, G.rigidE, G.ID, G)
+    build_ey_component(G.solid, G.rigidE, G.ID, G)
+    build_ez_component(G.solid, G.rigidE, G.ID, G)
+    build_hx_component(G.solid, G.rigidH, G.ID, G)
+    build_hy_component(G.solid, G.rigidH, G.ID, G)
+    build_hz_component(G.solid, G.rigidH, G.ID, G)
+
+    G.initialise_std_updatecoeff_arrays(len(G.materials))
+    for x, material in enumerate(G.materials):
+        material.calculate_update_coeffsE(G)
+        material.calculate_update_coeffsH(G)
+        G.updatecoeffsE[x, :] = material.CA, material.CBx, material.CBy, material.CBz, material.srce
+        G.updatecoeffsH[x, :] = material.DA, material.DBx, material.DBy, material.DBz, material.srcm
+    G.narrow_ID()
+
+    w = Waveform()
+    w.ID = 'w1'
+    w.type = 'gaussiandot'
+    w.freq = 1.5e9
+    G.waveforms.append(w)
+    h = HertzianDipole()
+    h.polarisation = 'z'
+    h.positionx = h.positiony = h.positionz = n // 2
+    h.start = 0
+    h.stop = iterations * G.dt
+    h.waveformID = w.ID
+    G.hertziandipoles.append(h)
+    G.rxs.append(Rx(positionx=n // 2 + 1, positiony=n // 2, positionz=n // 2))
+
+    return G
+
+
+def run_solver(G):
+    """Runs the main FDTD loop with the compiled solver.
+
+    Args:
+        G (class): Grid class instance - holds essential parameters describing the model.
+
+    Returns:
+        time (float): Time in seconds per iteration.
+        rxvalues (array): Ez field values at the receiver.
+    """
+
+    # The light cone is switched off so that every iteration updates the whole grid
+    solver = FDTDSolver(G, G.iterations, lightcone=False)
+    tstart = perf_counter()
+    solver.run(0, G.iterations)
+    time = (perf_counter() - tstart) / G.iterations
+
+    return time, np.asarray(solver.rxvalues)[2, 0, :]
+
+
+if args.affinity:
+    cpus = sorted(os.sched_getaffinity(0))
+    if args.affinity == 'close':
+        threadcpus = [cpus[thread % len(cpus)] for thread in range(args.nthreads)]
+    else:
+        threadcpus = [cpus[(thread * len(cpus)) // args.nthreads] for thread in range(args.nthreads)]
+    if not pin_threads(np.array(threadcpus, dtype=np.intc), args.nthreads):
+        print('Threads could not be pinned to CPUs')
+
+print('{:>8} {:>20} {:>20} {:>10} {:>12}'.format('cells', 'single [us/it]', 'first touch [us/it]', 'speedup', 'max diff'))
+for n in args.sizes:
+    tsingle, single = run_solver(build_model(n, args.iterations, args.nthreads, False))
+    tfirsttouch, firsttouch = run_solver(build_model(n, args.iterations, args.nthreads, True))
+
+    maxdiff = np.abs(single - firsttouch).max() / (np.abs(single).max() + np.finfo(floattype).tiny)
+    print('{:>8} {:>20.1f} {:>20.1f} {:>10.2f} {:>12.2e}'.format('{}^3'.format(n), tsingle * 1e6, tfirsttouch * 1e6, tsingle / tfirsttouch, maxdiff))
@@ -0,0 +1,170 @@
+# Copyright (C) 2015: The University of Edinburgh
+#            Authors: Craig Warren and Antonis Giannopoulos
+#
+# This file is part of gprMax.
+#
+# gprMax is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# gprMax is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with gprMax.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from gprMax.constants import c, floattype
+from gprMax.fields_update import update_ex, update_ey, update_ez, update_hx, update_hy, update_hz
+from gprMax.grid import FDTDGrid
+from gprMax.materials import Material
+from gprMax.pml import build_pml, calculate_initial_pml_params
+from gprMax.pml_call_updates import build_pml_updates, update_pml_electric, update_pml_magnetic
+from gprMax.receivers import Rx
+from gprMax.solver import FDTDSolver
+from gprMax.sources import HertzianDipole
+from gprMax.waveforms import Waveform
+from gprMax.yee_cell_build import build_ex_component, build_ey_component, build_ez_component, build_hx_component, build_hy_component, build_hz_component
+
+
+"""Benchmarks the time per iteration of the main FDTD loop when driven from Python, i.e. one call per update function per iteration, and when driven by the compiled solver."""
+
+# Parse command line arguments
+parser = argparse.ArgumentParser(description='Benchmarks the time per iteration of the main FDTD loop driven from Python and by the compiled solver.', usage='cd gprMax; python -m tools.benchmark_solver')
+parser.add_argument('-sizes', type=int, nargs='+', default=[10, 20, 40, 80], help='number of cells in each direction of the (cubic) test models')
+parser.add_argument('-iterations', type=int, default=200, help='number of iterations to run')
+parser.add_argument('-nthreads', type=int, default=1, help='number of OpenMP threads to use')
+args = parser.parse_args()
+
+
+def build_model(n, iterations, nthreads):
+    """Builds a free space model with a PML, a Hertzian dipole source and a receiver.
+
+    Args:
+        n (int): Number of cells in each direction.
+        iterations (int): Number of iterations.
+        nthreads (int): Number of OpenMP threads.
+
+    Returns:
+        G (class): Grid class instance - holds essential parameters describing the model.
+    """
+
+    G = FDTDGrid()
+    G.messages = False
+    G.nx = G.ny = G.nz = n
+    G.dx = G.dy = G.dz = 1e-3
+    G.dt = 1 / (c * np.sqrt((1 / G.dx) * (1 / G.dx) + (1 / G.dy) * (1 / G.dy) + (1 / G.dz) * (1 / G.dz)))
+    G.iterations = iterations
+    G.nthreads = nthreads
+    G.pmlthickness = (min(10, n // 4),) * 6
+    G.initialise_std_arrays()
+
+    m = Material(0, 'pec', G)
+    m.average = False
+    G.materials.append(m)
+    m = Material(1, 'free_space', G)
+    G.materials.append(m)
+
+    build_pml(G)
+    calculate_initial_pml_params(G)
+    build_ex_component(G.solid, G.rigidE, G.ID, G)
+    build_ey_component(G.solid, G.rigidE, G.ID, G)
+    build_ez_component(G.solid, G.rigidE, G.ID, G)
+    build_hx_component(G.solid, G.rigidH, G.ID, G)
+    build_hy_component(G.solid, G.rigidH, G.ID, G)
+    build_hz_component(G.solid, G.rigidH, G.ID, G)
+
+    G.initialise_std_updatecoeff_arrays(len(G.materials))
+    for x, material in enumerate(G.materials):
+        material.calculate_update_coeffsE(G)
+        material.calculate_update_coeffsH(G)
+        G.updatecoeffsE[x, :] = material.CA, material.CBx, material.CBy, material.CBz, material.srce
+        G.updatecoeffsH[x, :] = material.DA, material.DBx, material.DBy, material.DBz, material.srcm
+
+    w = Waveform()
+    w.ID = 'w1'
+    w.type = 'gaussiandot'
+    w.freq = 1.5e9
+    G.waveforms.append(w)
+    h = HertzianDipole()
+    h.polarisation = 'z'
+    h.positionx = h.positiony = h.positionz = n // 2
+    h.start = 0
+    h.stop = iterations * G.dt
+    h.waveformID = w.ID
+    G.hertziandipoles.append(h)
+    G.rxs.append(Rx(positionx=n // 2 + 1, positiony=n // 2, positionz=n // 2))
+
+    return G
+
+
+def run_python_loop(G):
+    """Runs the main FDTD loop with one call per update function per iteration.
+
+    Args:
+        G (class): Grid class instance - holds essential parameters describing the model.
+
+    Returns:
+        rxvalues (array): Ez field values at the receiver.
+    """
+
+    rxvalues = np.zeros(G.iterations, dtype=floattype)
+    rx = G.rxs[0]
+    pmlelectric, pmlmagnetic = build_pml_updates(G)
+    abstime = 0
+    for timestep in range(G.iterations):
+        rxvalues[timestep] = G.Ez[rx.positionx, rx.positiony, rx.positionz]
+        update_ex(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ex, G.Hy, G.Hz)
+        update_ey(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ey, G.Hx, G.Hz)
+        update_ez(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsE, G.ID, G.Ez, G.Hx, G.Hy)
+        update_pml_electric(pmlelectric)
+        for h in G.hertziandipoles:
+            h.update_fields(abstime, timestep, G.updatecoeffsE, G.ID, G.Ex, G.Ey, G.Ez, G)
+        abstime += 0.5 * G.dt
+        update_hx(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hx, G.Ey, G.Ez)
+        update_hy(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hy, G.Ex, G.Ez)
+        update_hz(G.nx, G.ny, G.nz, G.nthreads, G.updatecoeffsH, G.ID, G.Hz, G.Ex, G.Ey)
+        update_pml_magnetic(pmlmagnetic)
+        abstime += 0.5 * G.dt
+
+    return rxvalues
+
+
+def run_solver(G):
+    """Runs the main FDTD loop with the compiled solver.
+
+    Args:
+        G (class): Grid class instance - holds essential parameters describing the model.
+
+    Returns:
+        rxvalues (array): Ez field values at the receiver.
+    """
+
+    # The light cone is switched off so that every iteration updates the whole grid
+    solver = FDTDSolver(G, G.iterations, lightcone=False)
+    solver.run(0, G.iterations)
+
+    return np.asarray(solver.rxvalues)[2, 0, :]
+
+
+print('{:>8} {:>16} {:>16} {:>16} {:>12}'.format('cells', 'python [us/it]', 'compiled [us/it]', 'saved [us/it]', 'max diff'))
+for n in args.sizes:
+    G = build_model(n, args.iterations, args.nthreads)
+    tstart = perf_counter()
+    python = run_python_loop(G)
+    tpython = (perf_counter() - tstart) / G.iterations
+
+    G = build_model(n, args.iterations, args.nthreads)
+    tstart = perf_counter()
+    compiled = run_solver(G)
+    tcompiled = (perf_counter() - tstart) / G.iterations
+
+    maxdiff = np.abs(python - compiled).max() / (np.abs(python).max() + np.finfo(floattype).tiny)
+    print('{:>8} {:>16.1f} {:>16.1f} {:>16.1f} {:>12.2e}'.format('{}^3'.format(n), tpython * 1e6, tcompiled * 1e6, (tpython - tcompiled) * 1e6, maxdiff))